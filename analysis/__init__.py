@@ -0,0 +1,28 @@
+# Núcleo de análise sem dependências de interface (Streamlit) ou AWS
+from importlib import import_module
+
+from .analyze_petshop_data import analyze_petshop_data, FATURAMENTO_ATUAL_ZERADO
+from .analysis_trace import AnalysisTrace
+from .calculate_capacity_metrics import calculate_capacity_metrics
+from .calculate_financial_metrics import calculate_financial_metrics
+from .calculate_working_hours import calculate_working_hours
+
+# Motores vetorizados (dependem de pandas): nome -> módulo
+_LAZY_EXPORTS = {
+    "analyze_petshop_batch": ".analyze_petshop_batch",
+    "batch_to_results": ".analyze_petshop_batch",
+    "build_scenario_grid": ".scenario_sweep",
+    "scenario_sweep": ".scenario_sweep",
+    "simulate_petshop": ".monte_carlo",
+    "mix_matrix": ".service_mix",
+    "service_mix_capacity": ".service_mix",
+}
+
+
+def __getattr__(name):
+    # Os motores vetorizados só são importados quando usados
+    if name in _LAZY_EXPORTS:
+        valor = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = valor
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
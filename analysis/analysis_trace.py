@@ -0,0 +1,60 @@
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+# Fração das análises que geram rastro quando o log está em DEBUG (ex: 0.01 em lote)
+ANALYSIS_DEBUG_SAMPLE_RATE = float(os.getenv("ANALYSIS_DEBUG_SAMPLE_RATE", "1"))
+
+
+class AnalysisTrace:
+    """
+    Registro único de uma análise com os valores intermediários de cada etapa.
+
+    Substitui as linhas de log por etapa: as funções de cálculo apenas guardam
+    os valores, e o registro inteiro é formatado uma vez, quando emitido.
+    """
+
+    __slots__ = ("petshop", "etapas", "_inicio")
+
+    def __init__(self, petshop: Optional[str] = None) -> None:
+        self.petshop = petshop
+        self.etapas: Dict[str, Dict[str, Any]] = {}
+        self._inicio = time.perf_counter()
+
+    def record(self, etapa: str, **valores: Any) -> None:
+        """Guarda valores de uma etapa (ex: "capacidade", "financeiro")"""
+        self.etapas.setdefault(etapa, {}).update(valores)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "petshop": self.petshop,
+            "duracao_ms": round((time.perf_counter() - self._inicio) * 1000, 3),
+            "etapas": self.etapas,
+        }
+
+    def __str__(self) -> str:
+        return json.dumps(self.as_dict(), ensure_ascii=False, default=str)
+
+
+def start_trace(
+    logger: logging.Logger, petshop: Optional[str] = None
+) -> Optional[AnalysisTrace]:
+    """
+    Cria o rastro de uma análise se o logger estiver em DEBUG e a análise for
+    sorteada pela taxa ANALYSIS_DEBUG_SAMPLE_RATE.
+
+    Args:
+        logger: Logger que emitirá o rastro
+        petshop: Nome do petshop analisado
+
+    Returns:
+        AnalysisTrace ou None quando a análise não deve ser rastreada
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return None
+    if ANALYSIS_DEBUG_SAMPLE_RATE < 1 and random.random() >= ANALYSIS_DEBUG_SAMPLE_RATE:
+        return None
+    return AnalysisTrace(petshop)
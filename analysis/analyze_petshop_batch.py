@@ -0,0 +1,343 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from assets import WORKING_DAYS_IN_THE_MONTH
+from dataclass import AnalisysResult
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = [
+    "horario_abertura",
+    "horario_fechamento",
+    "dias_funcionamento_semana",
+    "numero_funcionarios",
+    "funcionarios_banho_tosa",
+    "salario_medio",
+    "tempo_medio_banho_tosa",
+    "numero_atendimentos_mes",
+    "ticket_medio",
+    "faturamento_mensal",
+    "despesa_agua_luz",
+    "despesa_produtos",
+]
+
+RESULT_COLUMNS = list(AnalisysResult.__fields__.keys())
+
+
+def _to_frame(dados):
+    """Converte uma lista de PetshopData (ou dicts) em DataFrame"""
+    if isinstance(dados, pd.DataFrame):
+        return dados
+
+    registros = [d.dict() if hasattr(d, "dict") else dict(d) for d in dados]
+    return pd.DataFrame.from_records(registros)
+
+
+def _numeric(frame, coluna, padrao=np.nan):
+    """Retorna a coluna como array float, preenchendo ausentes com o padrão"""
+    if coluna not in frame:
+        return np.full(len(frame), padrao, dtype=float)
+
+    valores = pd.to_numeric(frame[coluna], errors="coerce").to_numpy(dtype=float)
+    if not np.isnan(padrao):
+        valores = np.where(np.isnan(valores), padrao, valores)
+    return valores
+
+
+def _parse_hours(serie, padrao):
+    """
+    Converte horários HH:MM em minutos desde a meia-noite.
+
+    Retorna os minutos e uma máscara indicando horários fora do intervalo
+    válido (ex: 25:00), que fazem o cálculo individual cair no fallback.
+    """
+    # Poucos horários distintos se repetem, então o parse é feito só nos únicos
+    codigos, unicos = pd.factorize(serie.astype(str))
+    partes = pd.Series(unicos).str.extract(r"^(\d{1,2}):(\d{2})$")
+    padrao_hora, padrao_minuto = (int(p) for p in padrao.split(":"))
+
+    horas = pd.to_numeric(partes[0], errors="coerce").fillna(padrao_hora).to_numpy()
+    minutos = pd.to_numeric(partes[1], errors="coerce").fillna(padrao_minuto).to_numpy()
+
+    invalido = (horas > 23) | (minutos > 59)
+    return (horas * 60 + minutos)[codigos], invalido[codigos]
+
+
+def calculate_working_hours_batch(frame):
+    """Versão vetorizada de calculate_working_hours"""
+    abertura, abertura_invalida = _parse_hours(frame["horario_abertura"], "08:00")
+    fechamento, fechamento_invalido = _parse_hours(frame["horario_fechamento"], "18:00")
+
+    # Ajuste para horários que passam da meia-noite
+    fechamento = np.where(fechamento < abertura, 23 * 60 + 59, fechamento)
+    horas_diaria = (fechamento - abertura) / 60
+
+    # Garantir valor mínimo para horas de operação
+    horas_diaria = np.where(horas_diaria < 1, 6.0, horas_diaria)
+
+    dias_semana = _numeric(frame, "dias_funcionamento_semana", 0.0)
+    dias_semana = np.clip(np.where(dias_semana == 0, 5, dias_semana), 1, 7)
+    dias_uteis = np.maximum(20, WORKING_DAYS_IN_THE_MONTH * (dias_semana / 5))
+
+    # Horários inválidos usam os valores padrão, como no cálculo individual
+    erro = abertura_invalida | fechamento_invalido
+    horas_diaria = np.where(erro, 8.0, horas_diaria)
+    dias_uteis = np.where(erro, 22.0, dias_uteis)
+
+    return {
+        "diaria": horas_diaria,
+        "mensal": horas_diaria * dias_uteis,
+        "dias_uteis": dias_uteis,
+    }
+
+
+def calculate_capacity_metrics_batch(frame, horas_operacao):
+    """Versão vetorizada de calculate_capacity_metrics"""
+    eficiencia_trabalho = 0.85
+
+    tempo_informado = _numeric(frame, "tempo_medio_banho_tosa", 0.0)
+    tempo_medio_banho_tosa = np.maximum(30, tempo_informado)
+    funcionarios_banho_tosa = np.maximum(
+        1, _numeric(frame, "funcionarios_banho_tosa", 0.0)
+    )
+
+    horas_diarias = np.maximum(1, horas_operacao["diaria"])
+    capacidade_funcionario = (
+        horas_diarias * 60 * eficiencia_trabalho
+    ) / tempo_medio_banho_tosa
+
+    capacidade_diaria_ideal = np.trunc(capacidade_funcionario * funcionarios_banho_tosa)
+    dias_uteis = np.maximum(1, horas_operacao["dias_uteis"])
+    capacidade_mensal_ideal = np.trunc(capacidade_diaria_ideal * dias_uteis)
+
+    numero_atendimentos_mes = np.maximum(
+        0, _numeric(frame, "numero_atendimentos_mes", 0.0)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentual_capacidade = np.where(
+            capacidade_mensal_ideal > 0,
+            numero_atendimentos_mes / capacidade_mensal_ideal * 100,
+            0.0,
+        )
+
+    atendimentos_diarios_atuais = numero_atendimentos_mes / dias_uteis
+    horas_produtivas_diarias = np.where(
+        tempo_informado > 0,
+        atendimentos_diarios_atuais * tempo_medio_banho_tosa / 60,
+        0.0,
+    )
+    horas_potenciais_diarias = (
+        horas_diarias * funcionarios_banho_tosa * eficiencia_trabalho
+    )
+
+    return {
+        "capacidade_diaria_ideal": capacidade_diaria_ideal,
+        "capacidade_mensal_ideal": capacidade_mensal_ideal,
+        "percentual_capacidade": percentual_capacidade,
+        "tempo_ocioso_diario": np.maximum(
+            0, horas_potenciais_diarias - horas_produtivas_diarias
+        ),
+    }
+
+
+def calculate_financial_metrics_batch(frame, capacidade):
+    """Versão vetorizada de calculate_financial_metrics"""
+    faturamento_mensal = _numeric(frame, "faturamento_mensal", 0.0)
+    faturamento_mensal = np.where(faturamento_mensal > 0, faturamento_mensal, 18000.0)
+
+    despesa_produtos = _numeric(frame, "despesa_produtos", 0.0)
+    despesa_aluguel = _numeric(frame, "despesa_aluguel", 0.0)
+    despesa_pessoal = _numeric(frame, "salario_medio", 0.0) * _numeric(
+        frame, "numero_funcionarios", 0.0
+    )
+    despesa_total = (
+        despesa_pessoal
+        + _numeric(frame, "despesa_agua_luz", 0.0)
+        + despesa_produtos
+        + despesa_aluguel
+        + _numeric(frame, "despesa_outros", 0.0)
+    )
+
+    ticket_medio = _numeric(frame, "ticket_medio", 0.0)
+    ticket_medio = np.where(ticket_medio > 0, ticket_medio, 90.0)
+    capacidade_mensal_ideal = np.where(
+        capacidade["capacidade_mensal_ideal"] > 0,
+        capacidade["capacidade_mensal_ideal"],
+        200,
+    )
+
+    faturamento_potencial = capacidade_mensal_ideal * ticket_medio
+    faturamento_nao_realizado = np.maximum(
+        0, faturamento_potencial - faturamento_mensal
+    )
+
+    lucro_atual = faturamento_mensal - despesa_total
+    margem_lucro = lucro_atual / faturamento_mensal * 100
+
+    custo_produto_percentual = _numeric(frame, "custo_produto_percentual", 0.0)
+    custo_produto_percentual = np.where(
+        custo_produto_percentual > 0, custo_produto_percentual, 20.0
+    )
+    custo_produto_potencial = faturamento_potencial * (custo_produto_percentual / 100)
+
+    custo_fixo = despesa_total - despesa_produtos
+    lucro_potencial = faturamento_potencial - custo_produto_potencial - custo_fixo
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tem_despesa = despesa_total > 0
+        proporcao_pessoal = np.where(
+            tem_despesa, despesa_pessoal / despesa_total * 100, 60.0
+        )
+        proporcao_produtos = np.where(
+            tem_despesa, despesa_produtos / despesa_total * 100, 20.0
+        )
+        proporcao_aluguel = np.where(
+            tem_despesa, despesa_aluguel / despesa_total * 100, 15.0
+        )
+
+        funcionarios_banho_tosa = _numeric(frame, "funcionarios_banho_tosa", 0.0)
+        tem_funcionarios = funcionarios_banho_tosa > 0
+        atendimentos_por_funcionario = np.where(
+            tem_funcionarios,
+            _numeric(frame, "numero_atendimentos_mes", 0.0) / funcionarios_banho_tosa,
+            0.0,
+        )
+        atendimentos_potenciais_por_funcionario = np.where(
+            tem_funcionarios, capacidade_mensal_ideal / funcionarios_banho_tosa, 0.0
+        )
+        receita_por_funcionario = np.where(
+            tem_funcionarios, faturamento_mensal / funcionarios_banho_tosa, 0.0
+        )
+        receita_potencial_por_funcionario = np.where(
+            tem_funcionarios, faturamento_potencial / funcionarios_banho_tosa, 0.0
+        )
+
+        margem_contribuicao_unitaria = ticket_medio * (
+            (100 - custo_produto_percentual) / 100
+        )
+        ponto_equilibrio_atendimentos = np.where(
+            margem_contribuicao_unitaria > 0,
+            np.trunc(custo_fixo / margem_contribuicao_unitaria),
+            0,
+        )
+
+        faturamento_mes_anterior = _numeric(frame, "faturamento_mes_anterior")
+        crescimento_receita = np.where(
+            faturamento_mes_anterior > 0,
+            (faturamento_mensal - faturamento_mes_anterior)
+            / faturamento_mes_anterior
+            * 100,
+            np.nan,
+        )
+
+    return {
+        "faturamento_mensal": faturamento_mensal,
+        "despesa_total": despesa_total,
+        "despesa_pessoal": despesa_pessoal,
+        "faturamento_potencial": faturamento_potencial,
+        "faturamento_nao_realizado": faturamento_nao_realizado,
+        "lucro_atual": lucro_atual,
+        "lucro_potencial": lucro_potencial,
+        "margem_lucro": margem_lucro,
+        "proporcao_pessoal": proporcao_pessoal,
+        "proporcao_produtos": proporcao_produtos,
+        "proporcao_aluguel": proporcao_aluguel,
+        "custo_fixo": custo_fixo,
+        "custo_variavel": despesa_produtos,
+        "atendimentos_por_funcionario": atendimentos_por_funcionario,
+        "atendimentos_potenciais_por_funcionario": atendimentos_potenciais_por_funcionario,
+        "receita_por_funcionario": receita_por_funcionario,
+        "receita_potencial_por_funcionario": receita_potencial_por_funcionario,
+        "ponto_equilibrio_atendimentos": ponto_equilibrio_atendimentos,
+        "crescimento_receita": crescimento_receita,
+        "diferenca_meta": lucro_atual - _numeric(frame, "meta_lucro"),
+    }
+
+
+def analyze_petshop_batch(dados):
+    """
+    Análise vetorizada de vários petshops de uma só vez.
+
+    Aplica as mesmas regras de analyze_petshop_data (fallbacks e limites
+    mínimos) usando operações em arrays, sem criar um AnalisysResult por linha.
+
+    Args:
+        dados: DataFrame com as colunas do PetshopData ou lista de PetshopData
+
+    Returns:
+        pd.DataFrame: Uma linha por petshop com os campos do AnalisysResult,
+            mantendo o índice da entrada. Campos opcionais ausentes são NaN.
+    """
+    frame = _to_frame(dados)
+
+    faltando = [coluna for coluna in REQUIRED_COLUMNS if coluna not in frame]
+    if faltando:
+        raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(faltando)}")
+
+    logger.info("Analisando %d petshops em lote", len(frame))
+
+    horas_operacao = calculate_working_hours_batch(frame)
+    capacidade = calculate_capacity_metrics_batch(frame, horas_operacao)
+    financeiro = calculate_financial_metrics_batch(frame, capacidade)
+
+    faturamento_atual = financeiro["faturamento_mensal"]
+    faturamento_potencial = np.where(
+        financeiro["faturamento_potencial"] > 0,
+        financeiro["faturamento_potencial"],
+        faturamento_atual * 1.5,
+    )
+
+    resultado = pd.DataFrame(
+        {
+            "faturamento_atual": faturamento_atual,
+            "faturamento_potencial": faturamento_potencial,
+            "faturamento_nao_realizado": financeiro["faturamento_nao_realizado"],
+            "percentual_capacidade_utilizada": capacidade["percentual_capacidade"],
+            "projecao_anual_atual": faturamento_atual * 12,
+            "projecao_anual_potencial": faturamento_potencial * 12,
+            "capacidade_diaria_ideal": capacidade["capacidade_diaria_ideal"].astype(
+                np.int64
+            ),
+            "capacidade_mensal_ideal": capacidade["capacidade_mensal_ideal"].astype(
+                np.int64
+            ),
+            "ocupacao_atual_percentual": capacidade["percentual_capacidade"],
+            "tempo_ocioso_diario": capacidade["tempo_ocioso_diario"],
+            "despesa_total": financeiro["despesa_total"],
+            "despesa_pessoal": financeiro["despesa_pessoal"],
+            "lucro_atual": financeiro["lucro_atual"],
+            "lucro_potencial": financeiro["lucro_potencial"],
+            "margem_lucro": financeiro["margem_lucro"],
+            "atendimentos_por_funcionario": financeiro["atendimentos_por_funcionario"],
+            "atendimentos_potenciais_por_funcionario": financeiro[
+                "atendimentos_potenciais_por_funcionario"
+            ],
+            "receita_por_funcionario": financeiro["receita_por_funcionario"],
+            "receita_potencial_por_funcionario": financeiro[
+                "receita_potencial_por_funcionario"
+            ],
+            "proporcao_pessoal": financeiro["proporcao_pessoal"],
+            "proporcao_produtos": financeiro["proporcao_produtos"],
+            "proporcao_aluguel": financeiro["proporcao_aluguel"],
+            "custo_fixo": financeiro["custo_fixo"],
+            "custo_variavel": financeiro["custo_variavel"],
+            "ponto_equilibrio_atendimentos": financeiro[
+                "ponto_equilibrio_atendimentos"
+            ].astype(np.int64),
+            "crescimento_receita": financeiro["crescimento_receita"],
+            "diferenca_meta": financeiro["diferenca_meta"],
+        },
+        index=frame.index,
+    )
+
+    return resultado[RESULT_COLUMNS]
+
+
+def batch_to_results(frame):
+    """Converte o DataFrame de analyze_petshop_batch em objetos AnalisysResult"""
+    registros = frame.astype(object).where(frame.notna(), None).to_dict("records")
+    return [AnalisysResult(**registro) for registro in registros]
@@ -0,0 +1,140 @@
+from .calculate_working_hours import calculate_working_hours
+from .calculate_capacity_metrics import calculate_capacity_metrics
+from .calculate_financial_metrics import calculate_financial_metrics
+from .analysis_trace import start_trace
+from .avisos import registrar_aviso
+from common.tracing import traced
+from dataclass import AnalisysResult
+import logging
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Código do aviso exibido ao usuário pela interface
+FATURAMENTO_ATUAL_ZERADO = "faturamento_atual_zerado"
+
+
+@traced("analysis.analyze_petshop_data")
+def analyze_petshop_data(dados, avisos=None, trace=None):
+    """
+    Função principal para análise de dados do petshop
+
+    Não depende de Streamlit: os avisos da análise são acumulados em `avisos`
+    (lista de AnalysisWarning) para que a camada de interface decida como exibi-los.
+
+    Args:
+        dados: Dados do petshop (PetshopData)
+        avisos: Lista opcional que recebe os avisos gerados em todas as etapas
+        trace: AnalysisTrace opcional que recebe os valores de todas as etapas.
+            Se omitido, um rastro é criado e emitido em DEBUG para as análises
+            sorteadas (ver ANALYSIS_DEBUG_SAMPLE_RATE)
+
+    Returns:
+        AnalisysResult: Resultado da análise
+    """
+    emitir_rastro = trace is None
+    if trace is None:
+        trace = start_trace(logger, dados.nome_petshop)
+    if trace is not None:
+        trace.record("entrada", **dados.dict())
+
+    # Verificar dados de entrada
+    if not dados.faturamento_mensal or dados.faturamento_mensal <= 0:
+        registrar_aviso(
+            avisos,
+            logger,
+            "analise",
+            "faturamento_mensal_zerado",
+            "Faturamento mensal está zerado ou negativo. Usando valor padrão.",
+            campo="faturamento_mensal",
+        )
+        dados.faturamento_mensal = 18000.0
+
+    # Calcular horas de operação
+    horas_operacao = calculate_working_hours(dados, avisos, trace)
+
+    # Calcular métricas de capacidade
+    capacidade = calculate_capacity_metrics(dados, horas_operacao, avisos, trace)
+
+    # Calcular métricas financeiras
+    financeiro = calculate_financial_metrics(dados, capacidade, avisos, trace)
+
+    # Verificar valores importantes
+    if financeiro["faturamento_potencial"] <= 0:
+        registrar_aviso(
+            avisos,
+            logger,
+            "analise",
+            "faturamento_potencial_zerado",
+            "Faturamento potencial está zerado. Usando valor baseado no faturamento atual.",
+        )
+        financeiro["faturamento_potencial"] = dados.faturamento_mensal * 1.5
+
+    if financeiro["lucro_atual"] == 0 and dados.faturamento_mensal > 0:
+        registrar_aviso(
+            avisos,
+            logger,
+            "analise",
+            "lucro_zerado",
+            "Lucro calculado zerado com faturamento positivo. Verificando cálculos.",
+        )
+
+    # Compilar resultados em um objeto AnalisysResult
+    resultado = AnalisysResult(
+        faturamento_atual=dados.faturamento_mensal,
+        faturamento_potencial=financeiro["faturamento_potencial"],
+        faturamento_nao_realizado=financeiro["faturamento_nao_realizado"],
+        percentual_capacidade_utilizada=capacidade["percentual_capacidade"],
+        projecao_anual_atual=dados.faturamento_mensal * 12,
+        projecao_anual_potencial=financeiro["faturamento_potencial"] * 12,
+        capacidade_diaria_ideal=capacidade["capacidade_diaria_ideal"],
+        capacidade_mensal_ideal=capacidade["capacidade_mensal_ideal"],
+        ocupacao_atual_percentual=capacidade["percentual_capacidade"],
+        tempo_ocioso_diario=capacidade["tempo_ocioso_diario"],
+        despesa_total=financeiro["despesa_total"],
+        despesa_pessoal=financeiro["despesa_pessoal"],
+        lucro_atual=financeiro["lucro_atual"],
+        lucro_potencial=financeiro["lucro_potencial"],
+        margem_lucro=financeiro["margem_lucro"],
+        atendimentos_por_funcionario=financeiro["atendimentos_por_funcionario"],
+        atendimentos_potenciais_por_funcionario=financeiro[
+            "atendimentos_potenciais_por_funcionario"
+        ],
+        receita_por_funcionario=financeiro["receita_por_funcionario"],
+        receita_potencial_por_funcionario=financeiro[
+            "receita_potencial_por_funcionario"
+        ],
+        proporcao_pessoal=financeiro["proporcao_pessoal"],
+        proporcao_produtos=financeiro["proporcao_produtos"],
+        proporcao_aluguel=financeiro["proporcao_aluguel"],
+        custo_fixo=financeiro["custo_fixo"],
+        custo_variavel=financeiro["custo_variavel"],
+        ponto_equilibrio_atendimentos=financeiro["ponto_equilibrio_atendimentos"],
+        crescimento_receita=financeiro["crescimento_receita"],
+        diferenca_meta=financeiro["diferenca_meta"],
+    )
+
+    # Verificação final para garantir valores não zerados nos principais campos
+    if resultado.faturamento_atual <= 0:
+        registrar_aviso(
+            avisos,
+            logger,
+            "analise",
+            FATURAMENTO_ATUAL_ZERADO,
+            "Atenção: o faturamento calculado está zerado",
+        )
+
+    if trace is not None:
+        trace.record(
+            "resultado",
+            ocupacao_atual_percentual=resultado.ocupacao_atual_percentual,
+            lucro_atual=resultado.lucro_atual,
+            lucro_potencial=resultado.lucro_potencial,
+            faturamento_nao_realizado=resultado.faturamento_nao_realizado,
+            avisos=[aviso.codigo for aviso in avisos or []],
+        )
+        if emitir_rastro:
+            # Uma única linha por análise, formatada apenas aqui
+            logger.debug("Rastro da análise: %s", trace)
+
+    return resultado
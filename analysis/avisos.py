@@ -0,0 +1,20 @@
+from dataclass import AnalysisWarning
+
+
+def registrar_aviso(avisos, logger, etapa, codigo, mensagem, campo=None):
+    """
+    Registra um aviso no log e, se fornecida, na lista de avisos da análise.
+
+    Args:
+        avisos: Lista que acumula os avisos ou None para apenas registrar no log
+        logger: Logger do módulo que gerou o aviso
+        etapa: Etapa da análise (ex: "capacidade", "financeiro")
+        codigo: Código estável do aviso
+        mensagem: Mensagem legível do aviso
+        campo: Campo do PetshopData relacionado ao aviso (opcional)
+    """
+    logger.warning(mensagem)
+    if avisos is not None:
+        avisos.append(
+            AnalysisWarning(codigo=codigo, mensagem=mensagem, etapa=etapa, campo=campo)
+        )
@@ -1,14 +1,23 @@
 import logging
 
+from common.tracing import traced
+from .avisos import registrar_aviso
+
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 
-def calculate_capacity_metrics(dados, horas_operacao):
-    """Calcula métricas de capacidade e ocupação"""
-    logger.info(f"Calculando métricas de capacidade com: {dados}")
-    logger.info(f"Horas de operação: {horas_operacao}")
+@traced("analysis.calculate_capacity_metrics")
+def calculate_capacity_metrics(dados, horas_operacao, avisos=None, trace=None):
+    """
+    Calcula métricas de capacidade e ocupação
 
+    Args:
+        dados: Dados do petshop
+        horas_operacao: Resultado de calculate_working_hours
+        avisos: Lista opcional que recebe os avisos (AnalysisWarning) gerados
+        trace: AnalysisTrace opcional que recebe os valores intermediários
+    """
     # Verificar valores importantes
     tempo_medio_banho_tosa = max(
         30, dados.tempo_medio_banho_tosa
@@ -30,18 +39,12 @@ def calculate_capacity_metrics(dados, horas_operacao):
         horas_diarias * 60 * eficiencia_trabalho
     ) / tempo_medio_banho_tosa  # animais/dia
 
-    logger.info(
-        f"Capacidade por funcionário: {capacidade_funcionario} atendimentos/dia"
-    )
-
     # Capacidade diária total da equipe de banho e tosa
     capacidade_diaria_ideal = int(capacidade_funcionario * funcionarios_banho_tosa)
-    logger.info(f"Capacidade diária ideal: {capacidade_diaria_ideal} atendimentos/dia")
 
     # Capacidade mensal ideal
     dias_uteis = max(1, horas_operacao.get("dias_uteis", 22))  # Padrão de 22 dias úteis
     capacidade_mensal_ideal = int(capacidade_diaria_ideal * dias_uteis)
-    logger.info(f"Capacidade mensal ideal: {capacidade_mensal_ideal} atendimentos/mês")
 
     # Certificar-se de que o número de atendimentos mensais seja válido
     numero_atendimentos_mes = max(0, dados.numero_atendimentos_mes)
@@ -51,18 +54,26 @@ def calculate_capacity_metrics(dados, horas_operacao):
         percentual_capacidade = numero_atendimentos_mes / capacidade_mensal_ideal * 100
     else:
         percentual_capacidade = 0
-        logger.warning(
-            "Capacidade mensal ideal zerada. Percentual de capacidade não calculado."
+        registrar_aviso(
+            avisos,
+            logger,
+            "capacidade",
+            "capacidade_mensal_zerada",
+            "Capacidade mensal ideal zerada. Percentual de capacidade não calculado.",
         )
 
-    logger.info(f"Percentual da capacidade utilizada: {percentual_capacidade}%")
-
     # Tempo ocioso diário em horas
     if dias_uteis > 0:
         atendimentos_diarios_atuais = numero_atendimentos_mes / dias_uteis
     else:
         atendimentos_diarios_atuais = 0
-        logger.warning("Dias úteis zerados. Atendimentos diários não calculados.")
+        registrar_aviso(
+            avisos,
+            logger,
+            "capacidade",
+            "dias_uteis_zerados",
+            "Dias úteis zerados. Atendimentos diários não calculados.",
+        )
 
     if dados.tempo_medio_banho_tosa > 0:
         horas_produtivas_diarias = (
@@ -70,8 +81,13 @@ def calculate_capacity_metrics(dados, horas_operacao):
         ) / 60
     else:
         horas_produtivas_diarias = 0
-        logger.warning(
-            "Tempo médio de banho/tosa zerado. Horas produtivas não calculadas."
+        registrar_aviso(
+            avisos,
+            logger,
+            "capacidade",
+            "tempo_medio_zerado",
+            "Tempo médio de banho/tosa zerado. Horas produtivas não calculadas.",
+            campo="tempo_medio_banho_tosa",
         )
 
     horas_potenciais_diarias = (
@@ -79,7 +95,17 @@ def calculate_capacity_metrics(dados, horas_operacao):
     )
 
     tempo_ocioso_diario = max(0, horas_potenciais_diarias - horas_produtivas_diarias)
-    logger.info(f"Tempo ocioso diário: {tempo_ocioso_diario} horas")
+
+    if trace is not None:
+        trace.record(
+            "capacidade",
+            horas_operacao=horas_operacao,
+            capacidade_funcionario=capacidade_funcionario,
+            capacidade_diaria_ideal=capacidade_diaria_ideal,
+            capacidade_mensal_ideal=capacidade_mensal_ideal,
+            percentual_capacidade=percentual_capacidade,
+            tempo_ocioso_diario=tempo_ocioso_diario,
+        )
 
     return {
         "capacidade_diaria_ideal": capacidade_diaria_ideal,
@@ -1,25 +1,39 @@
 import logging
 
+from common.tracing import traced
+from .avisos import registrar_aviso
+
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 
-def calculate_financial_metrics(dados, capacidade):
-    """Calcula métricas financeiras"""
-    # Log dos dados recebidos
-    logger.info(f"Calculando métricas financeiras para: {dados}")
-    logger.info(f"Capacidade calculada: {capacidade}")
+@traced("analysis.calculate_financial_metrics")
+def calculate_financial_metrics(dados, capacidade, avisos=None, trace=None):
+    """
+    Calcula métricas financeiras
 
+    Args:
+        dados: Dados do petshop
+        capacidade: Resultado de calculate_capacity_metrics
+        avisos: Lista opcional que recebe os avisos (AnalysisWarning) gerados
+        trace: AnalysisTrace opcional que recebe os valores intermediários
+    """
     # Verificar faturamento mensal
     if dados.faturamento_mensal <= 0:
-        logger.warning("Faturamento mensal zerado ou negativo. Usando valor padrão.")
+        registrar_aviso(
+            avisos,
+            logger,
+            "financeiro",
+            "faturamento_mensal_zerado",
+            "Faturamento mensal zerado ou negativo. Usando valor padrão.",
+            campo="faturamento_mensal",
+        )
         faturamento_mensal = 18000.0
     else:
         faturamento_mensal = dados.faturamento_mensal
 
     # Despesas com pessoal
     despesa_pessoal = dados.salario_medio * dados.numero_funcionarios
-    logger.info(f"Despesa com pessoal calculada: {despesa_pessoal}")
 
     # Despesas totais
     despesa_total = (
@@ -29,34 +43,41 @@ def calculate_financial_metrics(dados, capacidade):
         + (dados.despesa_aluguel or 0)
         + (dados.despesa_outros or 0)
     )
-    logger.info(f"Despesa total calculada: {despesa_total}")
 
     # Faturamento potencial mensal
     ticket_medio = dados.ticket_medio if dados.ticket_medio > 0 else 90.0
     if capacidade["capacidade_mensal_ideal"] <= 0:
-        logger.warning("Capacidade mensal ideal zerada. Usando valor mínimo.")
+        registrar_aviso(
+            avisos,
+            logger,
+            "financeiro",
+            "capacidade_mensal_zerada",
+            "Capacidade mensal ideal zerada. Usando valor mínimo.",
+        )
         capacidade_mensal_ideal = 200  # Valor padrão se a capacidade for zero
     else:
         capacidade_mensal_ideal = capacidade["capacidade_mensal_ideal"]
 
     faturamento_potencial = capacidade_mensal_ideal * ticket_medio
-    logger.info(f"Faturamento potencial calculado: {faturamento_potencial}")
 
     # Faturamento não realizado (potencial perdido)
     faturamento_nao_realizado = max(0, faturamento_potencial - faturamento_mensal)
-    logger.info(f"Faturamento não realizado calculado: {faturamento_nao_realizado}")
 
     # Lucratividade
     lucro_atual = faturamento_mensal - despesa_total
-    logger.info(f"Lucro atual calculado: {lucro_atual}")
 
     if faturamento_mensal > 0:
         margem_lucro = lucro_atual / faturamento_mensal * 100
     else:
         margem_lucro = 0
-        logger.warning("Faturamento zerado ao calcular margem de lucro.")
-
-    logger.info(f"Margem de lucro calculada: {margem_lucro}%")
+        registrar_aviso(
+            avisos,
+            logger,
+            "financeiro",
+            "faturamento_zerado_margem",
+            "Faturamento zerado ao calcular margem de lucro.",
+            campo="faturamento_mensal",
+        )
 
     # Lucro potencial
     if dados.custo_produto_percentual and dados.custo_produto_percentual > 0:
@@ -64,8 +85,13 @@ def calculate_financial_metrics(dados, capacidade):
     else:
         # Valor padrão se não informado ou zerado
         custo_produto_percentual = 20
-        logger.warning(
-            f"Percentual de custo de produto não válido, usando padrão: {custo_produto_percentual}%"
+        registrar_aviso(
+            avisos,
+            logger,
+            "financeiro",
+            "custo_produto_percentual_padrao",
+            f"Percentual de custo de produto não válido, usando padrão: {custo_produto_percentual}%",
+            campo="custo_produto_percentual",
         )
 
     custo_produto_potencial = faturamento_potencial * (custo_produto_percentual / 100)
@@ -73,7 +99,6 @@ def calculate_financial_metrics(dados, capacidade):
     # Simplificação - considerando produtos como único custo variável
     custo_fixo = despesa_total - dados.despesa_produtos
     lucro_potencial = faturamento_potencial - custo_produto_potencial - custo_fixo
-    logger.info(f"Lucro potencial calculado: {lucro_potencial}")
 
     # Estrutura de Custos
     if despesa_total > 0:
@@ -84,8 +109,12 @@ def calculate_financial_metrics(dados, capacidade):
         proporcao_pessoal = 60  # Valores padrão
         proporcao_produtos = 20
         proporcao_aluguel = 15
-        logger.warning(
-            "Despesa total zerada ao calcular proporções. Usando valores padrão."
+        registrar_aviso(
+            avisos,
+            logger,
+            "financeiro",
+            "despesa_total_zerada",
+            "Despesa total zerada ao calcular proporções. Usando valores padrão.",
         )
 
     # Eficiência por funcionário
@@ -105,8 +134,13 @@ def calculate_financial_metrics(dados, capacidade):
         atendimentos_potenciais_por_funcionario = 0
         receita_por_funcionario = 0
         receita_potencial_por_funcionario = 0
-        logger.warning(
-            "Número de funcionários de banho/tosa zerado ao calcular eficiência."
+        registrar_aviso(
+            avisos,
+            logger,
+            "financeiro",
+            "funcionarios_banho_tosa_zerado",
+            "Número de funcionários de banho/tosa zerado ao calcular eficiência.",
+            campo="funcionarios_banho_tosa",
         )
 
     # Ponto de equilíbrio
@@ -117,8 +151,12 @@ def calculate_financial_metrics(dados, capacidade):
         ponto_equilibrio_atendimentos = int(custo_fixo / margem_contribuicao_unitaria)
     else:
         ponto_equilibrio_atendimentos = 0
-        logger.warning(
-            "Margem de contribuição unitária zerada ao calcular ponto de equilíbrio."
+        registrar_aviso(
+            avisos,
+            logger,
+            "financeiro",
+            "margem_contribuicao_zerada",
+            "Margem de contribuição unitária zerada ao calcular ponto de equilíbrio.",
         )
 
     # Crescimento
@@ -130,7 +168,7 @@ def calculate_financial_metrics(dados, capacidade):
         )
     else:
         crescimento_receita = None
-        logger.info(
+        logger.debug(
             "Faturamento do mês anterior não informado ou zerado. Crescimento não calculado."
         )
 
@@ -140,8 +178,19 @@ def calculate_financial_metrics(dados, capacidade):
     else:
         diferenca_meta = None
 
-    # Log do resultado final
-    logger.info("Métricas financeiras calculadas com sucesso")
+    if trace is not None:
+        trace.record(
+            "financeiro",
+            despesa_pessoal=despesa_pessoal,
+            despesa_total=despesa_total,
+            faturamento_potencial=faturamento_potencial,
+            faturamento_nao_realizado=faturamento_nao_realizado,
+            lucro_atual=lucro_atual,
+            margem_lucro=margem_lucro,
+            lucro_potencial=lucro_potencial,
+            ponto_equilibrio_atendimentos=ponto_equilibrio_atendimentos,
+            crescimento_receita=crescimento_receita,
+        )
 
     return {
         "despesa_total": despesa_total,
@@ -3,6 +3,9 @@ import logging
 import re
 
 from assets import WORKING_DAYS_IN_THE_MONTH
+from common.tracing import traced
+from dataclass import AnalysisWarning
+from .avisos import registrar_aviso
 
 # Configurar logging
 logger = logging.getLogger(__name__)
@@ -13,24 +16,40 @@ def validar_formato_hora(hora_str):
     return bool(re.match(r"^\d{1,2}:\d{2}$", hora_str))
 
 
-def calculate_working_hours(dados):
-    """Calcula horas de trabalho diárias e mensais"""
-    logger.info(f"Calculando horas de trabalho para: {dados}")
+@traced("analysis.calculate_working_hours")
+def calculate_working_hours(dados, avisos=None, trace=None):
+    """
+    Calcula horas de trabalho diárias e mensais
 
+    Args:
+        dados: Dados do petshop
+        avisos: Lista opcional que recebe os avisos (AnalysisWarning) gerados
+        trace: AnalysisTrace opcional que recebe os valores intermediários
+    """
     formato = "%H:%M"
 
     # Validar formato das horas
     if not validar_formato_hora(dados.horario_abertura):
-        logger.warning(
-            f"Formato de horário de abertura inválido: {dados.horario_abertura}. Usando padrão 08:00."
+        registrar_aviso(
+            avisos,
+            logger,
+            "horas",
+            "horario_abertura_invalido",
+            f"Formato de horário de abertura inválido: {dados.horario_abertura}. Usando padrão 08:00.",
+            campo="horario_abertura",
         )
         hora_abertura_str = "08:00"
     else:
         hora_abertura_str = dados.horario_abertura
 
     if not validar_formato_hora(dados.horario_fechamento):
-        logger.warning(
-            f"Formato de horário de fechamento inválido: {dados.horario_fechamento}. Usando padrão 18:00."
+        registrar_aviso(
+            avisos,
+            logger,
+            "horas",
+            "horario_fechamento_invalido",
+            f"Formato de horário de fechamento inválido: {dados.horario_fechamento}. Usando padrão 18:00.",
+            campo="horario_fechamento",
         )
         hora_fechamento_str = "18:00"
     else:
@@ -42,8 +61,13 @@ def calculate_working_hours(dados):
 
         # Ajuste para horários que passam da meia-noite
         if hora_fechamento < hora_abertura:
-            logger.warning(
-                "Horário de fechamento anterior ao de abertura. Ajustando para 23:59."
+            registrar_aviso(
+                avisos,
+                logger,
+                "horas",
+                "fechamento_antes_abertura",
+                "Horário de fechamento anterior ao de abertura. Ajustando para 23:59.",
+                campo="horario_fechamento",
             )
             hora_fechamento = datetime.strptime("23:59", formato)
 
@@ -51,8 +75,12 @@ def calculate_working_hours(dados):
 
         # Garantir valor mínimo para horas de operação
         if horas_operacao_diaria < 1:
-            logger.warning(
-                "Horas de operação diária muito baixas. Ajustando para mínimo de 6 horas."
+            registrar_aviso(
+                avisos,
+                logger,
+                "horas",
+                "horas_operacao_baixas",
+                "Horas de operação diária muito baixas. Ajustando para mínimo de 6 horas.",
             )
             horas_operacao_diaria = 6
 
@@ -67,9 +95,13 @@ def calculate_working_hours(dados):
 
         horas_operacao_mensal = horas_operacao_diaria * dias_uteis
 
-        logger.info(f"Horas de operação diária: {horas_operacao_diaria}")
-        logger.info(f"Dias úteis por mês: {dias_uteis}")
-        logger.info(f"Horas de operação mensal: {horas_operacao_mensal}")
+        if trace is not None:
+            trace.record(
+                "horas",
+                diaria=horas_operacao_diaria,
+                dias_uteis=dias_uteis,
+                mensal=horas_operacao_mensal,
+            )
 
         return {
             "diaria": horas_operacao_diaria,
@@ -77,7 +109,15 @@ def calculate_working_hours(dados):
             "dias_uteis": dias_uteis,
         }
     except Exception as e:
-        logger.error(f"Erro ao calcular horas de trabalho: {str(e)}")
+        logger.error("Erro ao calcular horas de trabalho: %s", e)
+        if avisos is not None:
+            avisos.append(
+                AnalysisWarning(
+                    codigo="erro_calculo_horas",
+                    mensagem=f"Erro ao calcular horas de trabalho: {str(e)}. Usando valores padrão.",
+                    etapa="horas",
+                )
+            )
         # Valores padrão caso ocorra algum erro
         return {
             "diaria": 8,  # 8 horas por dia
@@ -0,0 +1,179 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from dataclass import PetshopData
+from .analyze_petshop_batch import (
+    calculate_capacity_metrics_batch,
+    calculate_financial_metrics_batch,
+    calculate_working_hours_batch,
+)
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Número padrão de sorteios por simulação
+MONTE_CARLO_DRAWS = int(os.getenv("MONTE_CARLO_DRAWS", "20000"))
+
+# Incerteza padrão de cada entrada, como coeficiente de variação (desvio / média)
+DEFAULT_UNCERTAINTY = {
+    "numero_atendimentos_mes": 0.15,
+    "ticket_medio": 0.10,
+    "tempo_medio_banho_tosa": 0.15,
+}
+
+# Percentis das faixas de resultado
+PERCENTIS = (10, 50, 90)
+
+# Métricas resumidas na tabela de faixas
+MONTE_CARLO_METRICS = [
+    "faturamento_atual",
+    "lucro_atual",
+    "margem_lucro",
+    "ponto_equilibrio_atendimentos",
+    "ocupacao_atual_percentual",
+    "faturamento_potencial",
+    "lucro_potencial",
+    "projecao_anual_atual",
+    "projecao_anual_potencial",
+    "projecao_anual_lucro",
+]
+
+# Entradas informadas como número inteiro no formulário
+_CAMPOS_INTEIROS = {"numero_atendimentos_mes", "tempo_medio_banho_tosa"}
+
+
+def _sortear(rng, valor, incerteza, n):
+    """
+    Sorteia n valores de uma entrada.
+
+    Args:
+        rng: Gerador do NumPy
+        valor: Valor informado (média da distribuição)
+        incerteza: Coeficiente de variação (lognormal com média no valor
+            informado) ou tupla (mínimo, moda, máximo) de uma distribuição
+            triangular
+        n: Número de sorteios
+    """
+    if isinstance(incerteza, (tuple, list)):
+        minimo, moda, maximo = incerteza
+        return rng.triangular(minimo, moda, maximo, n)
+
+    if valor <= 0 or incerteza <= 0:
+        return np.full(n, float(valor))
+
+    # Lognormal: mantém os valores positivos e a média no valor informado
+    sigma2 = np.log1p(incerteza**2)
+    return rng.lognormal(np.log(valor) - sigma2 / 2, np.sqrt(sigma2), n)
+
+
+def simulate_petshop(dados, n_draws=None, incerteza=None, seed=None):
+    """
+    Simula as métricas do petshop tratando entradas incertas como distribuições.
+
+    Os sorteios passam pelas mesmas fórmulas vetorizadas de analyze_petshop_batch.
+    O faturamento e a despesa com produtos acompanham a variação de atendimentos
+    e ticket sorteados, para que a mediana fique próxima da análise pontual.
+
+    Args:
+        dados: PetshopData (ou dict com os mesmos campos)
+        n_draws: Número de sorteios (padrão MONTE_CARLO_DRAWS)
+        incerteza: Dict campo -> incerteza (ver _sortear), mesclado com
+            DEFAULT_UNCERTAINTY; use 0 para manter um campo fixo
+        seed: Semente do gerador, para resultados reproduzíveis
+
+    Returns:
+        pd.DataFrame: Uma linha por métrica de MONTE_CARLO_METRICS com as colunas
+            p10, p50, p90 e media, e a coluna prob_negativo (fração de sorteios
+            com valor abaixo de zero)
+    """
+    if not isinstance(dados, PetshopData):
+        dados = PetshopData(**dados)
+
+    n = n_draws or MONTE_CARLO_DRAWS
+    if n < 1:
+        raise ValueError("O número de sorteios deve ser positivo")
+
+    incertezas = {**DEFAULT_UNCERTAINTY, **(incerteza or {})}
+    desconhecidos = [campo for campo in incertezas if campo not in DEFAULT_UNCERTAINTY]
+    if desconhecidos:
+        raise ValueError(f"Campos sem simulação: {', '.join(desconhecidos)}")
+
+    logger.info("Simulando %d sorteios para %s", n, dados.nome_petshop)
+
+    rng = np.random.default_rng(seed)
+    base = dados.dict()
+    sorteios = {}
+    for campo, parametro in incertezas.items():
+        valores = _sortear(rng, base[campo], parametro, n)
+        if campo in _CAMPOS_INTEIROS:
+            valores = np.maximum(0, np.rint(valores))
+        sorteios[campo] = valores
+
+    # Receita e produtos variam com o volume (e a receita com o preço) sorteados
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fator_volume = np.where(
+            base["numero_atendimentos_mes"] > 0,
+            sorteios["numero_atendimentos_mes"] / base["numero_atendimentos_mes"],
+            1.0,
+        )
+        fator_preco = np.where(
+            base["ticket_medio"] > 0,
+            sorteios["ticket_medio"] / base["ticket_medio"],
+            1.0,
+        )
+
+    # Horário e dias não são sorteados: calculados uma vez e aplicados a todos
+    horas_operacao = calculate_working_hours_batch(pd.DataFrame([base]))
+
+    frame = pd.DataFrame(
+        {
+            **{
+                campo: valor
+                for campo, valor in base.items()
+                if isinstance(valor, (int, float))
+            },
+            **sorteios,
+            "faturamento_mensal": base["faturamento_mensal"]
+            * fator_volume
+            * fator_preco,
+            "despesa_produtos": base["despesa_produtos"] * fator_volume,
+        },
+        index=pd.RangeIndex(n),
+    )
+
+    capacidade = calculate_capacity_metrics_batch(frame, horas_operacao)
+    financeiro = calculate_financial_metrics_batch(frame, capacidade)
+
+    faturamento_atual = financeiro["faturamento_mensal"]
+    faturamento_potencial = np.where(
+        financeiro["faturamento_potencial"] > 0,
+        financeiro["faturamento_potencial"],
+        faturamento_atual * 1.5,
+    )
+    metricas = np.vstack(
+        [
+            faturamento_atual,
+            financeiro["lucro_atual"],
+            financeiro["margem_lucro"],
+            financeiro["ponto_equilibrio_atendimentos"],
+            capacidade["percentual_capacidade"],
+            faturamento_potencial,
+            financeiro["lucro_potencial"],
+            faturamento_atual * 12,
+            faturamento_potencial * 12,
+            financeiro["lucro_atual"] * 12,
+        ]
+    )
+
+    faixas = np.percentile(metricas, PERCENTIS, axis=1)
+    tabela = pd.DataFrame(
+        faixas.T,
+        index=MONTE_CARLO_METRICS,
+        columns=[f"p{percentil}" for percentil in PERCENTIS],
+    )
+    tabela["media"] = metricas.mean(axis=1)
+    tabela["prob_negativo"] = (metricas < 0).mean(axis=1)
+    return tabela
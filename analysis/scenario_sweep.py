@@ -0,0 +1,166 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+from pydantic import ValidationError
+
+from dataclass import PetshopData
+from .analyze_petshop_batch import analyze_petshop_batch
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Limite de combinações por simulação, para proteger sessões interativas
+SCENARIO_MAX_COMBINATIONS = int(os.getenv("SCENARIO_MAX_COMBINATIONS", "100000"))
+
+# Métricas do AnalisysResult exibidas na tabela comparativa
+SCENARIO_METRICS = [
+    "capacidade_mensal_ideal",
+    "ocupacao_atual_percentual",
+    "faturamento_potencial",
+    "despesa_total",
+    "lucro_atual",
+    "margem_lucro",
+    "lucro_potencial",
+    "ponto_equilibrio_atendimentos",
+]
+
+# Métricas comparadas com o cenário base (colunas delta_<métrica>)
+SCENARIO_DELTAS = ["lucro_atual", "lucro_potencial", "ponto_equilibrio_atendimentos"]
+
+
+def build_scenario_grid(base, overrides):
+    """
+    Monta o produto cartesiano das variações sobre os dados de um petshop.
+
+    Ao variar funcionarios_banho_tosa sem informar numero_funcionarios, o total
+    de funcionários acompanha a mesma diferença, para que a folha de pagamento
+    reflita a contratação (ou demissão) simulada.
+
+    Args:
+        base: PetshopData do cenário atual
+        overrides: Dict campo -> lista de valores a simular
+            (ex: {"funcionarios_banho_tosa": [2, 3], "ticket_medio": [80, 100]})
+
+    Returns:
+        pd.DataFrame: Uma linha por combinação, com todas as colunas do PetshopData
+    """
+    if not overrides:
+        raise ValueError("Informe ao menos um campo para simular")
+
+    campos = type(base).model_fields
+    campos_invalidos = [campo for campo in overrides if campo not in campos]
+    if campos_invalidos:
+        raise ValueError(f"Campos desconhecidos: {', '.join(campos_invalidos)}")
+
+    overrides = {campo: list(opcoes) for campo, opcoes in overrides.items()}
+    vazios = [campo for campo, opcoes in overrides.items() if not opcoes]
+    if vazios:
+        raise ValueError(f"Campos sem valores para simular: {', '.join(vazios)}")
+
+    valores = {
+        campo: _validar_valores(base, campo, opcoes, overrides)
+        for campo, opcoes in overrides.items()
+    }
+
+    total = int(np.prod([len(opcoes) for opcoes in valores.values()]))
+    if total > SCENARIO_MAX_COMBINATIONS:
+        raise ValueError(
+            f"{total} combinações excedem o limite de {SCENARIO_MAX_COMBINATIONS}"
+        )
+
+    grade = pd.MultiIndex.from_product(
+        list(valores.values()), names=list(valores)
+    ).to_frame(index=False)
+
+    # Campos não simulados repetem o valor do cenário base
+    for campo, valor in base.dict().items():
+        if campo not in grade:
+            grade[campo] = valor
+
+    if "funcionarios_banho_tosa" in valores and "numero_funcionarios" not in valores:
+        diferenca = grade["funcionarios_banho_tosa"] - base.funcionarios_banho_tosa
+        grade["numero_funcionarios"] = np.maximum(
+            base.numero_funcionarios + diferenca, grade["funcionarios_banho_tosa"]
+        )
+
+    excedentes = grade["funcionarios_banho_tosa"] > grade["numero_funcionarios"]
+    if excedentes.any():
+        raise ValueError(
+            f"{int(excedentes.sum())} combinações têm mais funcionários de banho e "
+            "tosa do que o total de funcionários"
+        )
+
+    return grade
+
+
+def _validar_valores(base, campo, opcoes, overrides):
+    """
+    Valida cada valor distinto de um campo com as regras do PetshopData.
+
+    Returns:
+        List: Valores distintos já convertidos pelo modelo (ex: "5" -> 5)
+    """
+    dados_base = base.dict()
+    validados = []
+    for valor in dict.fromkeys(opcoes):
+        dados = {**dados_base, campo: valor}
+        try:
+            # A regra "banho e tosa <= total" é verificada na grade, já com os
+            # dois campos combinados (e com o total ajustado à contratação)
+            if campo == "funcionarios_banho_tosa":
+                dados["numero_funcionarios"] = max(base.numero_funcionarios, valor)
+            elif (
+                campo == "numero_funcionarios"
+                and "funcionarios_banho_tosa" in overrides
+            ):
+                dados["funcionarios_banho_tosa"] = min(
+                    base.funcionarios_banho_tosa, valor
+                )
+            validados.append(getattr(type(base)(**dados), campo))
+        except (ValidationError, TypeError) as e:
+            mensagens = (
+                "; ".join(erro["msg"] for erro in e.errors())
+                if isinstance(e, ValidationError)
+                else str(e)
+            )
+            raise ValueError(f"Valor inválido para {campo}: {valor!r} ({mensagens})")
+    return validados
+
+
+def scenario_sweep(base, overrides):
+    """
+    Avalia todas as combinações de variações em uma única passada vetorizada.
+
+    Args:
+        base: PetshopData do cenário atual
+        overrides: Dict campo -> lista de valores a simular
+
+    Returns:
+        pd.DataFrame: Uma linha por combinação com os campos simulados, as
+            métricas de SCENARIO_METRICS e, para SCENARIO_DELTAS, a diferença
+            em relação ao cenário base (colunas delta_<métrica>)
+    """
+    if not isinstance(base, PetshopData):
+        base = PetshopData(**base)
+
+    grade = build_scenario_grid(base, overrides)
+    logger.info("Simulando %d cenários para %s", len(grade), base.nome_petshop)
+
+    # O cenário base entra na mesma passada, como primeira linha
+    entrada = pd.concat([pd.DataFrame([base.dict()]), grade], ignore_index=True)
+    analise = analyze_petshop_batch(entrada)
+    resultado = analise[SCENARIO_METRICS].assign(
+        **{
+            f"delta_{metrica}": analise[metrica] - analise[metrica].iloc[0]
+            for metrica in SCENARIO_DELTAS
+        }
+    )
+    resultado = resultado.iloc[1:].reset_index(drop=True)
+
+    colunas = list(overrides)
+    if "numero_funcionarios" not in colunas and "funcionarios_banho_tosa" in colunas:
+        colunas.append("numero_funcionarios")
+
+    return pd.concat([grade[colunas], resultado], axis=1)
@@ -0,0 +1,166 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from assets import SERVICES_TIME
+from .analyze_petshop_batch import _numeric, _to_frame, calculate_working_hours_batch
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Serviços na ordem das colunas das matrizes de mix
+SERVICES = tuple(SERVICES_TIME)
+
+# Fração do tempo da equipe dedicada a atendimentos (a mesma de calculate_capacity_metrics)
+EFICIENCIA_TRABALHO = 0.85
+
+# Unidades aceitas para o mix de serviços
+UNIDADES_MIX = ("proporcao", "quantidade")
+
+
+def mix_matrix(mix):
+    """
+    Converte um ou vários mixes de serviços em matriz (mixes x SERVICES).
+
+    Args:
+        mix: Dict servico -> quantidade, lista de dicts ou DataFrame com uma
+            coluna por serviço. Serviços ausentes valem zero.
+
+    Returns:
+        np.ndarray: Matriz float com uma linha por mix
+    """
+    if isinstance(mix, dict):
+        mix = [mix]
+    frame = mix if isinstance(mix, pd.DataFrame) else pd.DataFrame(list(mix))
+
+    desconhecidos = [
+        servico for servico in frame.columns if servico not in SERVICES_TIME
+    ]
+    if desconhecidos:
+        raise ValueError(
+            f"Serviços desconhecidos: {', '.join(map(str, desconhecidos))}. "
+            f"Disponíveis: {', '.join(SERVICES)}"
+        )
+
+    matriz = frame.reindex(columns=list(SERVICES)).fillna(0).to_numpy(dtype=float)
+    if (matriz < 0).any():
+        raise ValueError("O mix de serviços não pode ter valores negativos")
+    if (matriz.sum(axis=1) <= 0).any():
+        raise ValueError("Cada mix deve ter ao menos um serviço")
+    return matriz
+
+
+def service_mix_capacity(dados, mix, unidade, tickets=None):
+    """
+    Capacidade, ocupação e faturamento potencial a partir do mix de serviços.
+
+    Em vez de um único tempo_medio_banho_tosa, usa a duração de cada serviço
+    (SERVICES_TIME). Todos os serviços disputam o tempo da equipe de banho e
+    tosa, que é o gargalo do petshop; o serviço gargalo é o que consome a maior
+    parte desse tempo.
+
+    O mix é informado em quantidades mensais (a soma é o volume atual de
+    atendimentos) ou em proporções somando 1 (o volume atual vem de
+    numero_atendimentos_mes), conforme `unidade`.
+
+    Args:
+        dados: PetshopData (ou dict) aplicado a todos os mixes, ou DataFrame /
+            lista de PetshopData com um petshop por mix
+        mix: Mix de serviços (ver mix_matrix)
+        unidade: "proporcao" (cada linha soma 1) ou "quantidade"
+            (atendimentos por mês de cada serviço)
+        tickets: Dict servico -> preço. Serviços sem preço usam o ticket médio
+            do petshop proporcional à duração do serviço.
+
+    Returns:
+        pd.DataFrame: Uma linha por mix com os indicadores agregados e, por
+            serviço, capacidade_<servico> (atendimentos/mês no mix informado)
+            e faturamento_potencial_<servico>
+    """
+    if unidade not in UNIDADES_MIX:
+        raise ValueError(
+            f"Unidade inválida: {unidade}. Use {' ou '.join(UNIDADES_MIX)}"
+        )
+
+    matriz = mix_matrix(mix)
+    n = len(matriz)
+    totais = matriz.sum(axis=1)
+    if unidade == "proporcao" and not np.isclose(totais, 1.0).all():
+        invalidas = np.flatnonzero(~np.isclose(totais, 1.0))
+        raise ValueError(
+            f"As proporções do mix devem somar 1 (linhas {invalidas[:10].tolist()} "
+            f"somam {np.round(totais[invalidas[:10]], 4).tolist()})"
+        )
+
+    if hasattr(dados, "dict") or isinstance(dados, dict):
+        dados = [dados]
+    frame = _to_frame(dados).reset_index(drop=True)
+    if len(frame) not in (1, n):
+        raise ValueError(
+            f"Informe um petshop ou um por mix ({len(frame)} petshops, {n} mixes)"
+        )
+
+    tempos = np.array([SERVICES_TIME[servico] for servico in SERVICES], dtype=float)
+
+    # Preços: informados por serviço ou proporcionais à duração (preço por minuto)
+    ticket_medio = _numeric(frame, "ticket_medio", 0.0)
+    ticket_medio = np.where(ticket_medio > 0, ticket_medio, 90.0)
+    tempo_medio = np.maximum(30, _numeric(frame, "tempo_medio_banho_tosa", 0.0))
+    precos = (ticket_medio / tempo_medio)[:, None] * tempos
+    for servico, preco in (tickets or {}).items():
+        if servico not in SERVICES_TIME:
+            raise ValueError(f"Serviço desconhecido em tickets: {servico}")
+        precos[:, SERVICES.index(servico)] = preco
+    precos = np.broadcast_to(precos, (n, len(SERVICES)))
+
+    # Proporções de cada serviço e volume atual
+    proporcoes = matriz / totais[:, None]
+    if unidade == "proporcao":
+        atendimentos_atuais = np.broadcast_to(
+            np.maximum(0, _numeric(frame, "numero_atendimentos_mes", 0.0)), (n,)
+        )
+    else:
+        atendimentos_atuais = totais
+
+    tempo_ponderado = proporcoes @ tempos
+    ticket_ponderado = (proporcoes * precos).sum(axis=1)
+
+    # Tempo disponível da equipe, como em calculate_capacity_metrics
+    horas_operacao = calculate_working_hours_batch(frame)
+    horas_diarias = np.maximum(1, horas_operacao["diaria"])
+    dias_uteis = np.maximum(1, horas_operacao["dias_uteis"])
+    funcionarios = np.maximum(1, _numeric(frame, "funcionarios_banho_tosa", 0.0))
+    minutos_diarios = horas_diarias * 60 * EFICIENCIA_TRABALHO * funcionarios
+    minutos_mensais = minutos_diarios * dias_uteis
+
+    capacidade_diaria = np.trunc(minutos_diarios / tempo_ponderado)
+    capacidade_mensal = np.trunc(capacidade_diaria * dias_uteis)
+    capacidade_servicos = proporcoes * capacidade_mensal[:, None]
+    faturamento_servicos = capacidade_servicos * precos
+
+    # Ocupação do gargalo: minutos demandados pelo mix atual / minutos disponíveis
+    minutos_demandados = atendimentos_atuais * tempo_ponderado
+    participacao_tempo = proporcoes * tempos / tempo_ponderado[:, None]
+    gargalo = participacao_tempo.argmax(axis=1)
+
+    colunas = {
+        "atendimentos_atuais": atendimentos_atuais,
+        "tempo_medio_ponderado": tempo_ponderado,
+        "ticket_medio_ponderado": ticket_ponderado,
+        "capacidade_diaria_ideal": capacidade_diaria.astype(np.int64),
+        "capacidade_mensal_ideal": capacidade_mensal.astype(np.int64),
+        "utilizacao_gargalo_percentual": minutos_demandados / minutos_mensais * 100,
+        "tempo_ocioso_mensal_horas": np.maximum(0, minutos_mensais - minutos_demandados)
+        / 60,
+        "servico_gargalo": np.array(SERVICES)[gargalo],
+        "participacao_tempo_gargalo": participacao_tempo[np.arange(n), gargalo],
+        "faturamento_mix_atual": atendimentos_atuais * ticket_ponderado,
+        "faturamento_potencial": faturamento_servicos.sum(axis=1),
+    }
+    for i, servico in enumerate(SERVICES):
+        colunas[f"capacidade_{servico}"] = capacidade_servicos[:, i]
+        colunas[f"faturamento_potencial_{servico}"] = faturamento_servicos[:, i]
+
+    logger.debug("Capacidade calculada para %d mixes de serviços", n)
+    return pd.DataFrame(colunas)
@@ -0,0 +1,174 @@
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from reportlab.lib.utils import ImageReader
+
+logger = logging.getLogger(__name__)
+
+# Imagens distribuídas junto com o código
+IMAGES_DIR = Path(__file__).parent / "images"
+
+# Origem das imagens que ainda não foram incluídas em assets/images
+ASSET_BASE_URL = os.getenv(
+    "ASSET_BASE_URL", "https://dogs-club-source.s3.us-east-1.amazonaws.com"
+)
+ASSET_CACHE_DIR = Path(
+    os.getenv(
+        "ASSET_CACHE_DIR", os.path.join(tempfile.gettempdir(), "dogs_club_assets")
+    )
+)
+ASSET_FETCH_TIMEOUT = float(os.getenv("ASSET_FETCH_TIMEOUT", "5"))
+# Intervalo antes de tentar baixar de novo uma imagem que falhou
+ASSET_RETRY_SECONDS = float(os.getenv("ASSET_RETRY_SECONDS", "300"))
+
+LOGO = "logo.png"
+LOGO_URL = f"{ASSET_BASE_URL}/{LOGO}"
+
+_lock = threading.Lock()
+_images: Dict[str, Tuple[bytes, ImageReader]] = {}
+_failures: Dict[str, float] = {}
+# Imagens sendo carregadas em segundo plano (protegido por _loading_lock, e não
+# por _lock, que fica retido durante o download)
+_loading_lock = threading.Lock()
+_loading: Set[str] = set()
+
+
+def get_image_bytes(name: str) -> Optional[bytes]:
+    """
+    Retorna o conteúdo de uma imagem, carregado uma única vez por processo.
+
+    A imagem é procurada em assets/images, depois no cache local em disco e,
+    por último, baixada de ASSET_BASE_URL e gravada no cache em disco.
+
+    Args:
+        name: Nome do arquivo (ex: "logo.png")
+
+    Returns:
+        bytes: Conteúdo da imagem ou None se não estiver disponível
+    """
+    image = _load(name)
+    return image[0] if image else None
+
+
+def get_cached_image_bytes(name: str) -> Optional[bytes]:
+    """
+    Retorna o conteúdo de uma imagem já carregada, sem bloquear.
+
+    Se a imagem ainda não estiver em memória, inicia o carregamento em segundo
+    plano e retorna None; a interface pode exibir a URL da imagem enquanto isso.
+
+    Args:
+        name: Nome do arquivo (ex: "logo.png")
+
+    Returns:
+        bytes: Conteúdo da imagem ou None se ainda não estiver carregada
+    """
+    image = _images.get(name)
+    if image is not None:
+        return image[0]
+
+    _load_in_background(name)
+    return None
+
+
+def get_image_reader(name: str) -> Optional[ImageReader]:
+    """
+    Retorna o ImageReader já decodificado de uma imagem, compartilhado por todos os PDFs.
+
+    Args:
+        name: Nome do arquivo (ex: "logo.png")
+
+    Returns:
+        ImageReader: Imagem decodificada ou None se não estiver disponível
+    """
+    image = _load(name)
+    return image[1] if image else None
+
+
+def preload_images(names: Iterable[str] = (LOGO,), background: bool = False) -> None:
+    """
+    Carrega e decodifica as imagens na inicialização da aplicação.
+
+    Args:
+        names: Nomes dos arquivos
+        background: Carrega em uma thread, sem bloquear quem chama (ex: a
+            renderização da página enquanto a imagem é baixada)
+    """
+    for name in names:
+        if background:
+            _load_in_background(name)
+        else:
+            _load(name)
+
+
+def _load_in_background(name: str) -> None:
+    with _loading_lock:
+        if name in _images or name in _loading:
+            return
+        _loading.add(name)
+
+    def run() -> None:
+        try:
+            _load(name)
+        finally:
+            with _loading_lock:
+                _loading.discard(name)
+
+    threading.Thread(target=run, name=f"load-image-{name}", daemon=True).start()
+
+
+def _load(name: str) -> Optional[Tuple[bytes, ImageReader]]:
+    image = _images.get(name)
+    if image is not None:
+        return image
+
+    with _lock:
+        image = _images.get(name)
+        if image is not None:
+            return image
+
+        failed_at = _failures.get(name)
+        if failed_at is not None and time.monotonic() - failed_at < ASSET_RETRY_SECONDS:
+            return None
+
+        try:
+            content = _read_or_fetch(name)
+            reader = ImageReader(io.BytesIO(content))
+            # Força a decodificação agora, e não no primeiro PDF
+            reader.getSize()
+        except Exception as e:
+            logger.warning(f"Imagem {name} indisponível: {e}")
+            _failures[name] = time.monotonic()
+            return None
+
+        _failures.pop(name, None)
+        _images[name] = (content, reader)
+        return _images[name]
+
+
+def _read_or_fetch(name: str) -> bytes:
+    for path in (IMAGES_DIR / name, ASSET_CACHE_DIR / name):
+        if path.is_file():
+            return path.read_bytes()
+
+    url = f"{ASSET_BASE_URL}/{name}"
+    with urllib.request.urlopen(url, timeout=ASSET_FETCH_TIMEOUT) as response:
+        content = response.read()
+
+    try:
+        ASSET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=ASSET_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(tmp_path, ASSET_CACHE_DIR / name)
+    except OSError as e:
+        logger.warning(f"Falha ao gravar {name} no cache de imagens: {e}")
+
+    return content
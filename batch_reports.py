@@ -0,0 +1,66 @@
+"""
+Dog's Club - Geração de relatórios PDF em lote
+
+Lê os dados dos petshops de um arquivo CSV ou JSONL e gera um relatório PDF por
+petshop em paralelo, gravando em um diretório, em um arquivo .zip/.tar ou em
+um tar na saída padrão.
+
+Exemplos:
+    python batch_reports.py leads.csv relatorios/
+    python batch_reports.py leads.jsonl relatorios.zip --workers 8
+    python batch_reports.py leads.jsonl - > relatorios.tar
+"""
+
+import argparse
+import logging
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from functions.batch_reports import generate_reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Gera relatórios PDF em lote a partir de um arquivo CSV ou JSONL"
+    )
+    parser.add_argument(
+        "input", help="Arquivo .csv ou .jsonl ('-' para JSONL na entrada padrão)"
+    )
+    parser.add_argument(
+        "output",
+        help="Diretório, arquivo .zip, .tar, .tar.gz ou '-' para tar na saída padrão",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Número de processos (padrão: CPUs)"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=4,
+        help="Petshops enviados por vez a cada processo",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    stats = generate_reports(
+        args.input, args.output, workers=args.workers, chunksize=args.chunksize
+    )
+
+    # Com tar na saída padrão, as estatísticas vão para a saída de erro
+    out = sys.stderr if args.output == "-" else sys.stdout
+    print(
+        f"{stats['gerados']}/{stats['total']} relatórios em {stats['segundos']}s "
+        f"({stats['pdfs_por_segundo']} PDFs/s, {stats['workers']} processos, "
+        f"{stats['mb_gerados']} MB) | por relatório: p50 {stats['p50_ms']} ms, "
+        f"p95 {stats['p95_ms']} ms | falhas: {stats['falhas']}",
+        file=out,
+    )
+    return 1 if stats["falhas"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
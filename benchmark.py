@@ -0,0 +1,92 @@
+"""
+Dog's Club - Benchmarks dos caminhos críticos
+
+Mede a análise, cada gráfico, o PDF, a renderização do template e a montagem
+MIME com dados sintéticos (perfis small, typical e extreme). O SES e o
+DynamoDB são substituídos por implementações locais, sem acesso à rede.
+
+Exemplos:
+    python benchmark.py --output benchmark_baseline.json
+    python benchmark.py --baseline benchmark_baseline.json --tolerance 0.2
+    python benchmark.py --profiles typical --only chart. pdf.
+"""
+
+import argparse
+import json
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from benchmarks import PROFILES, compare_with_baseline, run_benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do Dog's Club Reports")
+    parser.add_argument(
+        "--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES)
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--only", nargs="+", default=None, help="Prefixos das etapas (ex: chart. pdf.)"
+    )
+    parser.add_argument(
+        "--output", help="Salva os resultados em JSON (nova linha de base)"
+    )
+    parser.add_argument(
+        "--baseline", help="JSON de uma execução anterior para comparar"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Aumento da mediana tolerado antes de acusar regressão (0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.profiles, args.iterations, args.warmup, args.only)
+
+    print(
+        f"{'etapa':<52} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} "
+        f"{'pico KB':>9} {'blocos':>8}"
+    )
+    for case, stats in results["cases"].items():
+        print(
+            f"{case:<52} {stats['p50_ms']:>9.2f} {stats['p90_ms']:>9.2f} "
+            f"{stats['p99_ms']:>9.2f} {stats['alloc_peak_kb']:>9.1f} "
+            f"{stats['alloc_blocks']:>8}"
+        )
+    for profile, rss in results["meta"]["peak_rss_mb"].items():
+        print(f"Pico de RSS do processo do perfil {profile}: {rss} MB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    regressoes = 0
+    print(f"\n{'etapa':<52} {'base ms':>9} {'atual ms':>9} {'razão':>7}")
+    for row in compare_with_baseline(results, baseline, args.tolerance):
+        if row["ratio"] is None:
+            print(f"{row['case']:<52} {'-':>9} {row['current_ms']:>9.2f} {'novo':>7}")
+            continue
+        regressoes += row["regression"]
+        marca = "  REGRESSÃO" if row["regression"] else ""
+        print(
+            f"{row['case']:<52} {row['baseline_ms']:>9.2f} "
+            f"{row['current_ms']:>9.2f} {row['ratio']:>7.2f}{marca}"
+        )
+
+    print(f"\n{regressoes} regressões acima de {args.tolerance:.0%}")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+# Benchmarks dos caminhos críticos (análise, gráficos, PDF e email)
+from .synthetic_data import PROFILES, synthetic_petshop
+from .harness import build_cases, compare_with_baseline, measure, run_benchmarks
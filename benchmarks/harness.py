@@ -0,0 +1,303 @@
+import gc
+import io
+import multiprocessing
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import analysis
+from functions.chart_artifacts import CHART_NAMES, CHART_DPI, render_chart_images
+from functions.create_data_visualizations import create_data_visualizations
+from functions.export_pdf import export_dashboard_pdf
+from functions.prepare_financial_report import prepare_financial_report
+from utils import build_raw_message, format_currency, render_template
+
+from .stubs import stub_email_handler, stub_lead_handler
+from .synthetic_data import PROFILES, synthetic_petshop
+
+# Data fixa para que o PDF gerado não dependa do dia da execução
+_DATA_FIXA = datetime(2025, 1, 1)
+
+
+def build_cases(profile: str, seed: int = 0) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    Prepara as etapas medidas para um perfil de petshop.
+
+    As entradas de cada etapa (análise, gráficos, PDF) são geradas uma vez
+    aqui, para que cada medição inclua apenas a etapa em si.
+
+    Args:
+        profile: Perfil dos dados sintéticos
+        seed: Semente dos dados sintéticos
+
+    Returns:
+        List: Pares (nome da etapa, função sem argumentos)
+    """
+    dados = synthetic_petshop(profile, seed)
+    resultado = analysis.analyze_petshop_data(dados.copy())
+    relatorio = prepare_financial_report(dados, resultado)
+    figuras = create_data_visualizations(resultado)
+    imagens = render_chart_images(resultado)
+    pdf = export_dashboard_pdf(
+        dados, resultado, relatorio, imagens, data_geracao=_DATA_FIXA
+    ).getvalue()
+
+    email_handler = stub_email_handler()
+    lead_handler = stub_lead_handler()
+    variaveis = {
+        "nome": dados.nome,
+        "petshop_name": dados.nome_petshop,
+        "faturamento_nao_realizado": format_currency(
+            resultado.faturamento_nao_realizado
+        ),
+        "data": _DATA_FIXA.strftime("%d/%m/%Y"),
+    }
+    html = render_template("pdf_report", variaveis)
+
+    def salvar_grafico(figura):
+        def run():
+            figura.savefig(
+                io.BytesIO(), format="png", bbox_inches="tight", dpi=CHART_DPI
+            )
+
+        return run
+
+    cases = [
+        (
+            "analysis.analyze_petshop_data",
+            lambda: analysis.analyze_petshop_data(dados.copy()),
+        ),
+        (
+            "analysis.simulate_petshop",
+            lambda: analysis.simulate_petshop(dados, seed=0),
+        ),
+        (
+            "report.prepare_financial_report",
+            lambda: prepare_financial_report(dados, resultado),
+        ),
+        (
+            "charts.create_data_visualizations",
+            lambda: create_data_visualizations(resultado),
+        ),
+    ]
+    cases += [
+        (f"chart.{nome}", salvar_grafico(figura))
+        for nome, figura in zip(CHART_NAMES, figuras)
+    ]
+    cases += [
+        (
+            "pdf.export_dashboard_pdf",
+            lambda: export_dashboard_pdf(dados, resultado, relatorio, imagens),
+        ),
+        ("email.render_template", lambda: render_template("pdf_report", variaveis)),
+        (
+            "email.build_raw_message",
+            lambda: build_raw_message(
+                email_handler.source_email,
+                [dados.email_contato],
+                f"Análise Financeira - {dados.nome_petshop}",
+                [("html", html)],
+                attachments=[
+                    {
+                        "name": "analise.pdf",
+                        "content": pdf,
+                        "content_type": "application/pdf",
+                    }
+                ],
+            ),
+        ),
+        (
+            "email.send_pdf_report",
+            lambda: email_handler.send_pdf_report(
+                nome=dados.nome,
+                email=dados.email_contato,
+                petshop_name=dados.nome_petshop,
+                faturamento_nao_realizado=resultado.faturamento_nao_realizado,
+                pdf_buffer=io.BytesIO(pdf),
+            ),
+        ),
+        (
+            "dynamodb.create_lead",
+            lambda: lead_handler.create_lead(
+                name=dados.nome,
+                email=dados.email_contato,
+                whatsapp="11999999999",
+                petshop_name=dados.nome_petshop,
+                message="benchmark",
+            ),
+        ),
+    ]
+    return cases
+
+
+def measure(
+    func: Callable[[], Any], iterations: int = 20, warmup: int = 2
+) -> Dict[str, float]:
+    """
+    Mede a latência e as alocações de uma função.
+
+    A latência é medida sem o tracemalloc ativo; as alocações são medidas em
+    uma execução separada.
+
+    Args:
+        func: Função sem argumentos
+        iterations: Número de execuções medidas
+        warmup: Execuções descartadas antes da medição
+
+    Returns:
+        Dict: Percentis e média em ms, pico de memória alocada (KB) e blocos
+        de memória que continuaram alocados após a execução
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        inicio = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - inicio)
+
+    gc.collect()
+    blocos = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        func()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    blocos = sys.getallocatedblocks() - blocos
+
+    ms = np.array(samples) * 1000
+    p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+    return {
+        "n": iterations,
+        "p50_ms": round(float(p50), 3),
+        "p90_ms": round(float(p90), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(ms.mean()), 3),
+        "min_ms": round(float(ms.min()), 3),
+        "alloc_peak_kb": round(pico / 1024, 1),
+        "alloc_blocks": blocos,
+    }
+
+
+def peak_rss_mb() -> float:
+    """Pico de memória residente (RSS) do processo em MB"""
+    import resource
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS em bytes
+    return round(maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _run_profile(
+    profile: str, iterations: int, warmup: int, only: Optional[Sequence[str]]
+) -> Tuple[Dict[str, Dict[str, float]], float]:
+    """
+    Mede as etapas de um perfil; executado em um processo próprio por run_benchmarks.
+
+    Returns:
+        Tuple: Medições por "<perfil>/<etapa>" e pico de RSS do processo em MB
+    """
+    resultados = {}
+    for nome, func in build_cases(profile):
+        if only and not nome.startswith(tuple(only)):
+            continue
+        resultados[f"{profile}/{nome}"] = measure(func, iterations, warmup)
+    return resultados, peak_rss_mb()
+
+
+def run_benchmarks(
+    profiles: Sequence[str] = tuple(PROFILES),
+    iterations: int = 20,
+    warmup: int = 2,
+    only: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Executa todas as etapas para cada perfil.
+
+    Cada perfil roda em um processo novo (spawn, sem herdar a memória deste
+    processo): o ru_maxrss é o pico do processo inteiro e nunca diminui, então
+    medir todos os perfis no mesmo processo atribuiria aos perfis seguintes o
+    pico dos anteriores.
+
+    Args:
+        profiles: Perfis de dados sintéticos
+        iterations: Execuções medidas por etapa
+        warmup: Execuções descartadas por etapa
+        only: Prefixos das etapas a medir (ex: ["chart.", "pdf."])
+
+    Returns:
+        Dict: "meta" (ambiente e pico de RSS do processo de cada perfil) e
+        "cases", com as medições por "<perfil>/<etapa>"
+    """
+    resultados = {}
+    rss = {}
+    for profile in profiles:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            casos, rss[profile] = executor.submit(
+                _run_profile, profile, iterations, warmup, only
+            ).result()
+        resultados.update(casos)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+            "peak_rss_mb": rss,
+        },
+        "cases": resultados,
+    }
+
+
+def compare_with_baseline(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Compara a mediana de cada etapa com a da linha de base.
+
+    Args:
+        results: Retorno de run_benchmarks
+        baseline: Retorno de run_benchmarks salvo anteriormente
+        tolerance: Aumento relativo tolerado (0.2 = 20% mais lento)
+
+    Returns:
+        List: Por etapa, "case", "baseline_ms", "current_ms", "ratio" e
+        "regression" (None quando a etapa não existe na linha de base)
+    """
+    anteriores = baseline.get("cases", {})
+    comparacao = []
+    for case, stats in results["cases"].items():
+        anterior = anteriores.get(case)
+        if anterior is None or not anterior.get("p50_ms"):
+            comparacao.append(
+                {
+                    "case": case,
+                    "baseline_ms": None,
+                    "current_ms": stats["p50_ms"],
+                    "ratio": None,
+                    "regression": None,
+                }
+            )
+            continue
+        ratio = stats["p50_ms"] / anterior["p50_ms"]
+        comparacao.append(
+            {
+                "case": case,
+                "baseline_ms": anterior["p50_ms"],
+                "current_ms": stats["p50_ms"],
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1 + tolerance,
+            }
+        )
+    return comparacao
@@ -0,0 +1,50 @@
+import itertools
+import os
+from typing import Any, Dict
+
+from handlers.dynamodb_memory import InMemoryDynamoDB
+from handlers.email_handler import EmailHandler
+from handlers.lead_handler import LeadHandler
+from handlers.ses_rate_limiter import SESSendLimiter
+
+
+class _StubMeta:
+    region_name = "local"
+
+
+class StubSESClient:
+    """Cliente SES local: responde sem rede e com cota ilimitada"""
+
+    meta = _StubMeta()
+
+    def __init__(self) -> None:
+        self._ids = itertools.count(1)
+        self.sent_bytes = 0
+
+    def get_send_quota(self) -> Dict[str, float]:
+        return {"Max24HourSend": -1, "MaxSendRate": 1e9, "SentLast24Hours": 0}
+
+    def send_email(self, **kwargs: Any) -> Dict[str, str]:
+        return {"MessageId": f"stub-{next(self._ids)}"}
+
+    def send_raw_email(self, RawMessage: Dict[str, bytes], **kwargs: Any) -> Dict:
+        self.sent_bytes += len(RawMessage["Data"])
+        return {"MessageId": f"stub-{next(self._ids)}"}
+
+
+def stub_email_handler() -> EmailHandler:
+    """EmailHandler que envia para o StubSESClient"""
+    # O cliente boto3 criado pelo handler é substituído antes de qualquer chamada
+    handler = EmailHandler(region_name=os.getenv("AWS_REGION") or "us-east-1")
+    client = StubSESClient()
+    handler.ses_handler.ses_client = client
+    handler.ses_handler.rate_limiter = SESSendLimiter(client)
+    handler.source_email = handler.source_email or "benchmark@example.com"
+    return handler
+
+
+def stub_lead_handler() -> LeadHandler:
+    """LeadHandler sobre uma tabela em memória"""
+    table = os.getenv("LEADS_TABLE") or "leads"
+    os.environ.setdefault("LEADS_TABLE", table)
+    return LeadHandler(dynamodb=InMemoryDynamoDB({table: ("lead_id", None)}))
@@ -0,0 +1,91 @@
+import random
+from typing import Dict
+
+from dataclass import PetshopData
+
+# Faixas de valores de cada perfil: (mínimo, máximo)
+PROFILES: Dict[str, Dict[str, tuple]] = {
+    # Petshop de bairro com um único tosador
+    "small": {
+        "funcionarios_banho_tosa": (1, 1),
+        "funcionarios_extra": (0, 1),
+        "dias_funcionamento_semana": (5, 6),
+        "tempo_medio_banho_tosa": (60, 120),
+        "ocupacao": (0.3, 0.7),
+        "ticket_medio": (50.0, 90.0),
+        "salario_medio": (1412.0, 1800.0),
+    },
+    # Perfil mais comum entre os leads
+    "typical": {
+        "funcionarios_banho_tosa": (2, 4),
+        "funcionarios_extra": (1, 3),
+        "dias_funcionamento_semana": (6, 6),
+        "tempo_medio_banho_tosa": (60, 90),
+        "ocupacao": (0.5, 0.85),
+        "ticket_medio": (80.0, 150.0),
+        "salario_medio": (1800.0, 2500.0),
+    },
+    # Rede grande, funcionando todos os dias e acima da capacidade
+    "extreme": {
+        "funcionarios_banho_tosa": (20, 40),
+        "funcionarios_extra": (10, 20),
+        "dias_funcionamento_semana": (7, 7),
+        "tempo_medio_banho_tosa": (30, 45),
+        "ocupacao": (0.9, 1.3),
+        "ticket_medio": (150.0, 400.0),
+        "salario_medio": (2500.0, 5000.0),
+    },
+}
+
+
+def synthetic_petshop(profile: str = "typical", seed: int = 0) -> PetshopData:
+    """
+    Gera dados de um petshop fictício, reprodutíveis pela semente.
+
+    Args:
+        profile: Perfil do petshop ("small", "typical" ou "extreme")
+        seed: Semente do gerador aleatório
+
+    Returns:
+        PetshopData: Dados válidos do perfil
+    """
+    faixas = PROFILES[profile]
+    rng = random.Random(f"{profile}:{seed}")
+
+    def inteiro(campo):
+        return rng.randint(*faixas[campo])
+
+    def decimal(campo):
+        return round(rng.uniform(*faixas[campo]), 2)
+
+    funcionarios_banho_tosa = inteiro("funcionarios_banho_tosa")
+    dias = inteiro("dias_funcionamento_semana")
+    tempo = inteiro("tempo_medio_banho_tosa")
+    abertura = rng.choice([7, 8, 9])
+    fechamento = abertura + rng.choice([9, 10, 12])
+
+    # Atendimentos a partir da capacidade teórica e da ocupação do perfil
+    capacidade = (fechamento - abertura) * 60 / tempo * funcionarios_banho_tosa
+    atendimentos = max(1, int(capacidade * dias * 4.3 * decimal("ocupacao")))
+    ticket = decimal("ticket_medio")
+    faturamento = round(atendimentos * ticket, 2)
+
+    return PetshopData(
+        nome="Benchmark",
+        nome_petshop=f"Pet {profile.title()} {seed}",
+        email_contato="benchmark@example.com",
+        horario_abertura=f"{abertura:02d}:00",
+        horario_fechamento=f"{fechamento:02d}:00",
+        dias_funcionamento_semana=dias,
+        numero_funcionarios=funcionarios_banho_tosa + inteiro("funcionarios_extra"),
+        funcionarios_banho_tosa=funcionarios_banho_tosa,
+        salario_medio=decimal("salario_medio"),
+        tempo_medio_banho_tosa=tempo,
+        numero_atendimentos_mes=atendimentos,
+        ticket_medio=ticket,
+        faturamento_mensal=faturamento,
+        despesa_agua_luz=round(faturamento * rng.uniform(0.03, 0.06), 2),
+        despesa_produtos=round(faturamento * rng.uniform(0.15, 0.25), 2),
+        despesa_aluguel=round(faturamento * rng.uniform(0.08, 0.15), 2),
+        despesa_outros=round(faturamento * rng.uniform(0.02, 0.05), 2),
+    )
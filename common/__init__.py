@@ -1,3 +1,11 @@
 # Common module initialization
 from .utils import get_timestamp, get_datetime_from_timestamp, format_iso_date
-from .enums import EmailContentType, EmailPriority, EntityStatus, FilterOperator
+from .enums import (
+    EmailContentType,
+    EmailPriority,
+    EntityStatus,
+    FilterOperator,
+    JobStatus,
+    OutboxStatus,
+    DeliveryStatus,
+)
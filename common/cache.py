@@ -0,0 +1,283 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def canonical_hash(dados: Any, *extras: Any) -> str:
+    """
+    Gera um hash determinístico (SHA-256) para um modelo pydantic ou dict.
+
+    Os campos são serializados em JSON com chaves ordenadas, de forma que dois
+    objetos com os mesmos valores sempre geram o mesmo hash, entre processos e
+    entre máquinas.
+
+    Args:
+        dados: Modelo pydantic (ex: PetshopData) ou dicionário
+        extras: Valores adicionais que fazem parte da chave (ex: versão do template)
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    payload = dados.dict() if hasattr(dados, "dict") else dados
+    canonical = json.dumps(
+        [payload, list(extras)],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiskCodec(NamedTuple):
+    """Conversão de um valor do cache para tipos JSON (dump) e de volta (load)"""
+
+    dump: Callable[[Any], Any]
+    load: Callable[[Any], Any]
+
+
+# Codec de valores que já são JSON (dicts, listas, strings e números)
+JSON_CODEC = DiskCodec(dump=lambda value: value, load=lambda value: value)
+
+
+class ResultCache:
+    """
+    Cache LRU com expiração (TTL) e camada opcional em disco.
+
+    Seguro para uso entre threads. Os valores devem ser tratados como somente
+    leitura por quem os recebe, pois o mesmo objeto é devolvido a todas as
+    chamadas com a mesma chave.
+
+    A camada em disco grava apenas JSON, nunca pickle: ler um arquivo do
+    diretório não executa código, mesmo que o diretório seja compartilhado.
+    Somente os valores armazenados com um DiskCodec vão para o disco; os
+    demais ficam apenas em memória.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 256,
+        ttl_seconds: Optional[float] = 3600,
+        disk_path: Optional[str] = None,
+    ) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            max_items: Número máximo de itens mantidos em memória
+            ttl_seconds: Tempo de vida de cada item em segundos (None para não expirar)
+            disk_path: Diretório para a camada em disco (opcional)
+        """
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = Path(disk_path) if disk_path else None
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._key_locks: dict = {}
+
+        if self.disk_path:
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+
+    def get(
+        self, key: str, default: Any = None, codec: Optional[DiskCodec] = None
+    ) -> Any:
+        """
+        Retorna o valor da chave ou `default` se ausente ou expirado.
+
+        A camada em disco só é consultada quando `codec` é informado.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at is None or expires_at > time.monotonic():
+                    self._items.move_to_end(key)
+                    return value
+                del self._items[key]
+
+        value = self._read_disk(key, codec)
+        if value is _MISSING:
+            return default
+
+        self._set_memory(key, value)
+        return value
+
+    def set(self, key: str, value: Any, codec: Optional[DiskCodec] = None) -> None:
+        """Armazena um valor em memória e, com `codec` e disco configurado, em disco."""
+        self._set_memory(key, value)
+        self._write_disk(key, value, codec)
+
+    def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        codec: Optional[DiskCodec] = None,
+    ) -> Any:
+        """
+        Retorna o valor em cache ou calcula com `factory` e armazena.
+
+        Chamadas concorrentes para a mesma chave executam `factory` uma única vez.
+
+        Args:
+            key: Chave do valor
+            factory: Função sem argumentos que calcula o valor
+            codec: Conversão para JSON, para guardar o valor também em disco
+        """
+        value = self.get(key, _MISSING, codec)
+        if value is not _MISSING:
+            return value
+
+        # Cada chave tem um lock e o número de chamadas que o usam; o lock só
+        # é removido quando ninguém mais espera por ele
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                value = self.get(key, _MISSING, codec)
+                if value is _MISSING:
+                    value = factory()
+                    self.set(key, value, codec)
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    self._key_locks.pop(key, None)
+
+        return value
+
+    def clear(self) -> None:
+        """Remove todos os itens em memória e em disco."""
+        with self._lock:
+            self._items.clear()
+
+        if self.disk_path:
+            for file_path in self.disk_path.glob("*.json"):
+                file_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def _set_memory(self, key: str, value: Any) -> None:
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else None
+        )
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def _disk_file(self, key: str) -> Path:
+        # A chave pode conter separadores; o nome do arquivo usa o hash dela
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.disk_path / f"{name}.json"
+
+    def _read_disk(self, key: str, codec: Optional[DiskCodec]) -> Any:
+        if not self.disk_path or codec is None:
+            return _MISSING
+
+        file_path = self._disk_file(key)
+        try:
+            if (
+                self.ttl_seconds is not None
+                and time.time() - file_path.stat().st_mtime > self.ttl_seconds
+            ):
+                file_path.unlink(missing_ok=True)
+                return _MISSING
+
+            with open(file_path, "r", encoding="utf-8") as file:
+                return codec.load(json.load(file))
+        except FileNotFoundError:
+            return _MISSING
+        except Exception as e:
+            logger.warning(f"Falha ao ler item do cache em disco {file_path}: {e}")
+            return _MISSING
+
+    def _write_disk(self, key: str, value: Any, codec: Optional[DiskCodec]) -> None:
+        if not self.disk_path or codec is None:
+            return
+
+        file_path = self._disk_file(key)
+        try:
+            content = json.dumps(codec.dump(value), ensure_ascii=False)
+            # Escrita atômica para que leitores concorrentes nunca vejam arquivos parciais
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_path, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            logger.warning(f"Falha ao gravar item do cache em disco {file_path}: {e}")
+
+
+class ContentAddressedStore:
+    """
+    Armazenamento de artefatos binários (ex: PDFs) em disco, endereçado por hash.
+
+    Cada chave vira um arquivo `<dir>/<2 primeiros caracteres>/<chave><sufixo>`,
+    gravado de forma atômica. Como o conteúdo de uma chave nunca muda, o mesmo
+    diretório pode ser compartilhado entre processos e máquinas (ex: volume
+    de rede montado localmente) sem coordenação.
+    """
+
+    def __init__(self, directory: str, suffix: str = "") -> None:
+        """
+        Inicializa o armazenamento.
+
+        Args:
+            directory: Diretório raiz dos artefatos
+            suffix: Extensão dos arquivos (ex: ".pdf")
+        """
+        self.directory = Path(directory)
+        self.suffix = suffix
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key: str) -> Path:
+        """Caminho do arquivo de uma chave (hash hexadecimal)"""
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Retorna o conteúdo da chave ou None se ausente."""
+        try:
+            with open(self.path(key), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Falha ao ler artefato {key}: {e}")
+            return None
+
+    def set(self, key: str, content: bytes) -> None:
+        """Grava o conteúdo da chave (falhas são registradas e ignoradas)."""
+        file_path = self.path(key)
+        try:
+            file_path.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            logger.warning(f"Falha ao gravar artefato {key}: {e}")
+
+    def get_or_set(self, key: str, factory: Callable[[], bytes]) -> bytes:
+        """Retorna o conteúdo armazenado ou gera com `factory` e grava."""
+        content = self.get(key)
+        if content is None:
+            content = factory()
+            self.set(key, content)
+        return content
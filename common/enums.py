@@ -29,3 +29,22 @@ class FilterOperator(Enum):
     BETWEEN = "between"
     BEGINS_WITH = "begins_with"
     CONTAINS = "contains"
+
+
+class JobStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class OutboxStatus(Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class DeliveryStatus(Enum):
+    SENT = "sent"
+    FAILED = "failed"
@@ -0,0 +1,131 @@
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from common.enums import JobStatus
+from common.utils import get_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """
+    Fila local de tarefas executadas em segundo plano por um pool de threads.
+
+    O número de workers limita quantas tarefas rodam ao mesmo tempo no processo;
+    as demais aguardam na fila. O estado de cada tarefa pode ser consultado por
+    `get` enquanto ela não expirar.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        ttl_seconds: int = 3600,
+        thread_name_prefix: str = "job",
+    ) -> None:
+        """
+        Inicializa a fila.
+
+        Args:
+            max_workers: Número máximo de tarefas executadas em paralelo
+            ttl_seconds: Tempo que tarefas finalizadas permanecem consultáveis
+            thread_name_prefix: Prefixo do nome das threads do pool
+        """
+        self.max_workers = max_workers
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        job_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Enfileira uma tarefa e retorna imediatamente.
+
+        Se `job_id` for informado e já existir uma tarefa pendente ou em execução
+        com esse id, nenhuma nova tarefa é criada.
+
+        Args:
+            func: Função a ser executada
+            args: Argumentos posicionais da função
+            job_id: Identificador da tarefa (opcional)
+            kwargs: Argumentos nomeados da função
+
+        Returns:
+            str: Identificador da tarefa
+        """
+        job_id = job_id or str(uuid.uuid4())
+
+        with self._lock:
+            self._purge_expired()
+
+            job = self._jobs.get(job_id)
+            if job and job["status"] in (JobStatus.PENDING, JobStatus.RUNNING):
+                return job_id
+
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "status": JobStatus.PENDING,
+                "result": None,
+                "error": None,
+                "created_at": get_timestamp(),
+                "started_at": None,
+                "finished_at": None,
+            }
+
+        self._executor.submit(self._run, job_id, func, args, kwargs)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Retorna uma cópia do estado da tarefa ou None se não existir."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Encerra o pool, aguardando as tarefas em andamento se `wait` for True."""
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job_id: str, func: Callable, args: tuple, kwargs: dict) -> None:
+        self._update(job_id, status=JobStatus.RUNNING, started_at=get_timestamp())
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Falha na tarefa {job_id}")
+            self._update(
+                job_id,
+                status=JobStatus.FAILED,
+                error=str(e),
+                finished_at=get_timestamp(),
+            )
+        else:
+            self._update(
+                job_id,
+                status=JobStatus.SUCCEEDED,
+                result=result,
+                finished_at=get_timestamp(),
+            )
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _purge_expired(self) -> None:
+        limite = get_timestamp() - self.ttl_seconds * 1000
+        expirados = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job["finished_at"] is not None and job["finished_at"] < limite
+        ]
+        for job_id in expirados:
+            del self._jobs[job_id]
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Limitador de taxa do tipo token bucket, seguro para uso entre threads.
+
+    Os tokens são repostos continuamente a `rate` por segundo até `capacity`.
+    Pedidos maiores que a capacidade são aceitos quando o balde está cheio e
+    deixam o saldo negativo, de forma que os próximos pedidos aguardam a
+    reposição e a taxa média é respeitada.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        Inicializa o limitador.
+
+        Args:
+            rate: Tokens repostos por segundo
+            capacity: Máximo de tokens acumulados (padrão: um segundo de taxa)
+        """
+        self._condition = threading.Condition()
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Atualiza a taxa (ex: após consultar a cota do serviço)"""
+        with self._condition:
+            self._refill()
+            self._rate = rate
+            self._capacity = capacity if capacity is not None else max(rate, 1.0)
+            self._tokens = min(self._tokens, self._capacity)
+            self._condition.notify_all()
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda até que `tokens` estejam disponíveis e os consome.
+
+        Args:
+            tokens: Quantidade de tokens
+            timeout: Tempo máximo de espera em segundos (None para esperar sempre)
+
+        Returns:
+            bool: True se os tokens foram consumidos, False se o tempo esgotou
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        with self._condition:
+            while True:
+                self._refill()
+                needed = min(tokens, self._capacity)
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return True
+
+                wait = (needed - self._tokens) / self._rate if self._rate > 0 else 1.0
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                self._condition.wait(wait)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
@@ -0,0 +1,204 @@
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Desativa a coleta (ex: em benchmarks) sem remover a instrumentação
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "1").lower() not in ("0", "false")
+
+# Limites (em segundos) dos buckets do histograma de duração
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_PREFIX = "dogs_club_stage"
+
+
+class _StageStats:
+    """Totais acumulados de uma etapa do pipeline"""
+
+    __slots__ = ("count", "errors", "total_seconds", "max_seconds", "bytes", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+        # Um contador por bucket, mais o bucket +Inf
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)
+
+
+_lock = threading.Lock()
+_stages: Dict[str, _StageStats] = {}
+
+
+def record(
+    stage: str, seconds: float, size: Optional[int] = None, error: bool = False
+) -> None:
+    """
+    Registra uma execução de uma etapa no registro do processo.
+
+    Args:
+        stage: Nome da etapa (ex: "ses.SendRawEmail")
+        seconds: Duração da execução
+        size: Tamanho em bytes do que foi produzido ou enviado (opcional)
+        error: Se a execução terminou com erro
+    """
+    if not TRACING_ENABLED:
+        return
+
+    bucket = bisect_left(DURATION_BUCKETS, seconds)
+    with _lock:
+        stats = _stages.get(stage)
+        if stats is None:
+            stats = _stages[stage] = _StageStats()
+        stats.count += 1
+        stats.errors += error
+        stats.total_seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.buckets[bucket] += 1
+        if size:
+            stats.bytes += size
+
+
+class Span:
+    """Execução em andamento de uma etapa; o tamanho pode ser informado no corpo"""
+
+    __slots__ = ("stage", "size")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self.size: Optional[int] = None
+
+
+@contextmanager
+def span(stage: str) -> Iterator[Span]:
+    """
+    Mede a duração do bloco e registra erros (a exceção é propagada).
+
+    Exemplo:
+        with span("chart.ocupacao") as s:
+            imagem = renderizar()
+            s.size = len(imagem)
+    """
+    current = Span(stage)
+    inicio = time.perf_counter()
+    try:
+        yield current
+    except BaseException:
+        record(stage, time.perf_counter() - inicio, current.size, error=True)
+        raise
+    record(stage, time.perf_counter() - inicio, current.size)
+
+
+def traced(
+    stage: str, size: Optional[Callable[[Any], Optional[int]]] = None
+) -> Callable:
+    """
+    Decorador que registra cada chamada da função como uma execução da etapa.
+
+    Args:
+        stage: Nome da etapa
+        size: Função opcional que calcula o tamanho em bytes a partir do retorno
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage) as current:
+                result = func(*args, **kwargs)
+                if size is not None and result is not None:
+                    current.size = size(result)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Retorna uma cópia dos totais de todas as etapas.
+
+    Returns:
+        Dict: Por etapa, "count", "errors", "total_seconds", "avg_seconds",
+        "max_seconds", "bytes" e "buckets" (contagem acumulada por limite "le")
+    """
+    with _lock:
+        stages = {
+            stage: (
+                stats.count,
+                stats.errors,
+                stats.total_seconds,
+                stats.max_seconds,
+                stats.bytes,
+                list(stats.buckets),
+            )
+            for stage, stats in _stages.items()
+        }
+
+    result = {}
+    for stage, (count, errors, total, maximum, size, buckets) in sorted(stages.items()):
+        cumulative = {}
+        acumulado = 0
+        for limite, quantidade in zip(DURATION_BUCKETS + ("+Inf",), buckets):
+            acumulado += quantidade
+            cumulative[str(limite)] = acumulado
+        result[stage] = {
+            "count": count,
+            "errors": errors,
+            "total_seconds": round(total, 6),
+            "avg_seconds": round(total / count, 6) if count else 0.0,
+            "max_seconds": round(maximum, 6),
+            "bytes": size,
+            "buckets": cumulative,
+        }
+    return result
+
+
+def export_json() -> str:
+    """Exporta o registro em JSON"""
+    return json.dumps(snapshot(), ensure_ascii=False, indent=2)
+
+
+def export_prometheus() -> str:
+    """Exporta o registro no formato de texto do Prometheus"""
+    stages = snapshot()
+    duration = f"{METRIC_PREFIX}_duration_seconds"
+    lines = [
+        f"# HELP {duration} Duração das etapas do pipeline.",
+        f"# TYPE {duration} histogram",
+    ]
+    for stage, stats in stages.items():
+        label = _label(stage)
+        for limite, acumulado in stats["buckets"].items():
+            lines.append(
+                f'{duration}_bucket{{stage="{label}",le="{limite}"}} {acumulado}'
+            )
+        lines.append(f'{duration}_sum{{stage="{label}"}} {stats["total_seconds"]}')
+        lines.append(f'{duration}_count{{stage="{label}"}} {stats["count"]}')
+
+    for metric, key, help_text in (
+        ("errors_total", "errors", "Execuções das etapas que terminaram com erro."),
+        ("bytes_total", "bytes", "Bytes produzidos ou enviados pelas etapas."),
+    ):
+        name = f"{METRIC_PREFIX}_{metric}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for stage, stats in stages.items():
+            lines.append(f'{name}{{stage="{_label(stage)}"}} {stats[key]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    """Zera o registro"""
+    with _lock:
+        _stages.clear()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
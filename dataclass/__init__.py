@@ -1,2 +1,3 @@
 from .analysis_result import AnalisysResult
+from .analysis_warning import AnalysisWarning
 from .petshop import PetshopData
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class AnalysisWarning(BaseModel):
+    """Modelo para avisos gerados durante a análise"""
+
+    codigo: str
+    mensagem: str
+    etapa: str
+    campo: Optional[str] = None
@@ -1,10 +1,16 @@
+from analysis import (
+    analyze_petshop_batch,
+    batch_to_results,
+    calculate_capacity_metrics,
+    calculate_financial_metrics,
+    calculate_working_hours,
+)
 from .analyze_petshop_data import analyze_petshop_data
-from .calculate_capacity_metrics import calculate_capacity_metrics
-from .calculate_financial_metrics import calculate_financial_metrics
-from .calculate_working_hours import calculate_working_hours
 from .create_data_visualizations import create_data_visualizations
+from .create_scenario_heatmap import create_scenario_heatmap
 from .create_sidebar import create_sidebar
 from .extract_form_data import extract_form_data
 from .prepare_financial_report import prepare_financial_report
 from .show_results import show_results
-from .css import define_css
\ No newline at end of file
+from .css import define_css
+from .admin_panel import admin_panel_requested, show_admin_panel
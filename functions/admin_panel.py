@@ -0,0 +1,77 @@
+import hmac
+import os
+
+import pandas as pd
+import streamlit as st
+
+from common import tracing
+
+
+def admin_panel_requested():
+    """
+    Indica se a página foi aberta com ?admin=<token> e o token confere com
+    DOGS_CLUB_ADMIN_TOKEN. Sem token configurado, o painel fica desativado.
+    """
+    token = os.getenv("DOGS_CLUB_ADMIN_TOKEN")
+    if not token:
+        return False
+    informado = st.query_params.get("admin", "")
+    return hmac.compare_digest(informado.encode("utf-8"), token.encode("utf-8"))
+
+
+def show_admin_panel():
+    """Exibe os tempos por etapa do pipeline registrados neste processo"""
+    st.title("Tempos do pipeline")
+    st.caption(
+        "Totais acumulados desde o início do processo (ou do último reset), "
+        "de todas as sessões atendidas por ele."
+    )
+
+    etapas = tracing.snapshot()
+    if not etapas:
+        st.info("Nenhuma etapa registrada ainda.")
+    else:
+        tabela = pd.DataFrame(
+            [
+                {
+                    "Etapa": etapa,
+                    "Execuções": stats["count"],
+                    "Erros": stats["errors"],
+                    "Média (ms)": stats["avg_seconds"] * 1000,
+                    "Máximo (ms)": stats["max_seconds"] * 1000,
+                    "Total (s)": stats["total_seconds"],
+                    "Bytes": stats["bytes"],
+                }
+                for etapa, stats in etapas.items()
+            ]
+        ).sort_values("Total (s)", ascending=False)
+        st.dataframe(
+            tabela,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Média (ms)": st.column_config.NumberColumn(format="%.1f"),
+                "Máximo (ms)": st.column_config.NumberColumn(format="%.1f"),
+                "Total (s)": st.column_config.NumberColumn(format="%.3f"),
+            },
+        )
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.download_button(
+            "Exportar Prometheus",
+            tracing.export_prometheus(),
+            file_name="metrics.prom",
+            mime="text/plain",
+        )
+    with col2:
+        st.download_button(
+            "Exportar JSON",
+            tracing.export_json(),
+            file_name="metrics.json",
+            mime="application/json",
+        )
+    with col3:
+        if st.button("Zerar métricas"):
+            tracing.reset()
+            st.rerun()
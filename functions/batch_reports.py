@@ -0,0 +1,233 @@
+import csv
+import io
+import json
+import logging
+import os
+import re
+import statistics
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from importlib import import_module
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def load_petshop_rows(input_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lê os dados dos petshops de um arquivo CSV ou JSONL.
+
+    Args:
+        input_path: Caminho do arquivo (.csv ou .jsonl); "-" lê JSONL da entrada padrão
+
+    Returns:
+        Iterator[Dict]: Um dicionário com os campos de PetshopData por petshop
+    """
+    if input_path == "-":
+        yield from _read_jsonl(sys.stdin)
+        return
+
+    with open(input_path, "r", encoding="utf-8", newline="") as file:
+        if input_path.lower().endswith(".csv"):
+            for row in csv.DictReader(file):
+                # Células vazias usam o valor padrão do modelo
+                yield {k: v for k, v in row.items() if v not in ("", None)}
+        else:
+            yield from _read_jsonl(file)
+
+
+def _read_jsonl(file) -> Iterator[Dict[str, Any]]:
+    for line in file:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _init_worker() -> None:
+    """Prepara o processo: backend Agg, módulos de gráficos/PDF e imagens carregados"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    from assets.images import preload_images
+
+    # Importar uma vez por processo os módulos de gráficos e PDF (estilos e fontes)
+    for module in ("chart_artifacts", "export_pdf"):
+        import_module(f".{module}", __package__)
+    preload_images()
+
+
+def render_report_pdf(
+    item: Tuple[int, Dict[str, Any]]
+) -> Tuple[int, str, Optional[bytes], Optional[str], float]:
+    """
+    Executa análise, relatório, gráficos e PDF para um petshop.
+
+    Args:
+        item: Par (índice, dados do petshop)
+
+    Returns:
+        Tuple: (índice, nome do petshop, PDF ou None, erro ou None, segundos gastos)
+    """
+    from analysis import analyze_petshop_data
+    from dataclass import PetshopData
+
+    from .chart_artifacts import render_chart_images
+    from .export_pdf import export_dashboard_pdf
+    from .prepare_financial_report import prepare_financial_report
+
+    index, row = item
+    inicio = time.perf_counter()
+    nome = str(row.get("nome_petshop", f"petshop_{index}"))
+    try:
+        dados = PetshopData(**row)
+        resultado = analyze_petshop_data(dados)
+        relatorio = prepare_financial_report(dados, resultado)
+        imagens = render_chart_images(resultado)
+        pdf = export_dashboard_pdf(dados, resultado, relatorio, imagens).getvalue()
+        return index, nome, pdf, None, time.perf_counter() - inicio
+    except Exception as e:
+        return index, nome, None, str(e), time.perf_counter() - inicio
+
+
+def _render_chunk(
+    items: List[Tuple[int, Dict[str, Any]]]
+) -> List[Tuple[int, str, Optional[bytes], Optional[str], float]]:
+    """Gera os PDFs de um lote de petshops (ver render_report_pdf)"""
+    return [render_report_pdf(item) for item in items]
+
+
+class ReportWriter:
+    """Grava os PDFs em um diretório, em um arquivo .zip/.tar(.gz) ou em um tar na saída padrão"""
+
+    def __init__(self, output: str) -> None:
+        """
+        Inicializa o destino.
+
+        Args:
+            output: Diretório, arquivo .zip, .tar, .tar.gz/.tgz ou "-" (tar na saída padrão)
+        """
+        self.output = output
+        self._zip = None
+        self._tar = None
+        lower = output.lower()
+
+        if output == "-":
+            self._tar = tarfile.open(fileobj=sys.stdout.buffer, mode="w|")
+        elif lower.endswith(".zip"):
+            # PDFs já são comprimidos; armazenar sem recomprimir
+            self._zip = zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED)
+        elif lower.endswith((".tar.gz", ".tgz")):
+            self._tar = tarfile.open(output, "w:gz")
+        elif lower.endswith(".tar"):
+            self._tar = tarfile.open(output, "w")
+        else:
+            Path(output).mkdir(parents=True, exist_ok=True)
+
+    def write(self, name: str, content: bytes) -> None:
+        if self._zip is not None:
+            self._zip.writestr(name, content)
+        elif self._tar is not None:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mtime = int(time.time())
+            self._tar.addfile(info, io.BytesIO(content))
+        else:
+            with open(Path(self.output) / name, "wb") as file:
+                file.write(content)
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+
+
+def report_file_name(index: int, nome_petshop: str) -> str:
+    """Nome do arquivo PDF de um petshop (índice garante nomes únicos)"""
+    slug = re.sub(r"[^a-z0-9]+", "_", nome_petshop.lower()).strip("_") or "petshop"
+    return f"{index:05d}_{slug}.pdf"
+
+
+def generate_reports(
+    input_path: str,
+    output: str,
+    workers: Optional[int] = None,
+    chunksize: int = 4,
+) -> Dict[str, Any]:
+    """
+    Gera os relatórios PDF de todos os petshops de um arquivo em paralelo.
+
+    Os petshops são lidos e enviados aos processos aos poucos: no máximo dois
+    lotes por processo ficam pendentes, e cada PDF é gravado assim que o seu
+    lote termina. A memória fica limitada mesmo para arquivos grandes; a ordem
+    de gravação pode variar, mas o nome de cada arquivo leva o índice da linha.
+
+    Args:
+        input_path: Arquivo CSV/JSONL com os dados dos petshops
+        output: Destino dos PDFs (ver ReportWriter)
+        workers: Número de processos (padrão: número de CPUs)
+        chunksize: Petshops enviados por vez a cada processo
+
+    Returns:
+        Dict: Estatísticas da execução
+    """
+    workers = workers or os.cpu_count() or 1
+    writer = ReportWriter(output)
+    tempos = []
+    falhas = 0
+    total_bytes = 0
+    inicio = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        ) as executor:
+            linhas = enumerate(load_petshop_rows(input_path), start=1)
+            pendentes = set()
+            while True:
+                while len(pendentes) < 2 * workers:
+                    lote = list(islice(linhas, chunksize))
+                    if not lote:
+                        break
+                    pendentes.add(executor.submit(_render_chunk, lote))
+                if not pendentes:
+                    break
+
+                concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in concluidos:
+                    for index, nome, pdf, erro, segundos in futuro.result():
+                        tempos.append(segundos)
+                        if erro is not None:
+                            falhas += 1
+                            logger.error(
+                                f"Falha ao gerar relatório {index} ({nome}): {erro}"
+                            )
+                            continue
+                        writer.write(report_file_name(index, nome), pdf)
+                        total_bytes += len(pdf)
+    finally:
+        writer.close()
+
+    duracao = time.perf_counter() - inicio
+    gerados = len(tempos) - falhas
+    return {
+        "total": len(tempos),
+        "gerados": gerados,
+        "falhas": falhas,
+        "workers": workers,
+        "segundos": round(duracao, 3),
+        "pdfs_por_segundo": round(gerados / duracao, 2) if duracao else 0.0,
+        "mb_gerados": round(total_bytes / 1e6, 2),
+        "p50_ms": round(statistics.median(tempos) * 1000, 1) if tempos else 0.0,
+        "p95_ms": (
+            round(statistics.quantiles(tempos, n=20)[-1] * 1000, 1)
+            if len(tempos) >= 2
+            else round(tempos[0] * 1000, 1) if tempos else 0.0
+        ),
+    }
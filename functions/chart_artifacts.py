@@ -0,0 +1,49 @@
+import io
+
+from common.cache import canonical_hash
+from common.tracing import span
+from .create_data_visualizations import create_data_visualizations
+from .pipeline_cache import pipeline_cache
+
+# Resolução usada tanto no dashboard quanto no PDF
+CHART_DPI = 150
+
+# Nomes dos gráficos, na ordem de create_data_visualizations
+CHART_NAMES = ("ocupacao", "estrutura_custos", "faturamento", "margem_lucro")
+
+
+def render_chart_images(resultado, formato="png", dpi=CHART_DPI):
+    """
+    Renderiza os gráficos da análise em bytes e libera as figuras.
+
+    Args:
+        resultado: Resultado da análise (AnalisysResult)
+        formato: Formato da imagem ("png" ou "svg")
+        dpi: Resolução das imagens rasterizadas
+
+    Returns:
+        List[bytes]: Uma imagem por gráfico, na ordem de create_data_visualizations
+    """
+    imagens = []
+    figuras = create_data_visualizations(resultado)
+    for nome, figura in zip(CHART_NAMES, figuras):
+        with span(f"chart.{nome}") as etapa:
+            buffer = io.BytesIO()
+            figura.savefig(buffer, format=formato, bbox_inches="tight", dpi=dpi)
+            # Liberar os artistas imediatamente em vez de esperar o coletor de lixo
+            figura.clear()
+            imagens.append(buffer.getvalue())
+            etapa.size = len(imagens[-1])
+    return imagens
+
+
+def get_chart_images(resultado, formato="png", dpi=CHART_DPI):
+    """
+    Retorna as imagens dos gráficos, renderizando apenas uma vez por resultado.
+
+    As mesmas bytes são usadas pelo Streamlit (st.image) e pelo ReportLab.
+    """
+    chave = f"{canonical_hash(resultado)}:graficos:{formato}:{dpi}"
+    return pipeline_cache.get_or_set(
+        chave, lambda: render_chart_images(resultado, formato, dpi)
+    )
@@ -1,34 +1,82 @@
-import matplotlib.pyplot as plt
 import matplotlib as mpl
 import numpy as np
-from matplotlib.patheffects import withStroke
+from matplotlib import font_manager
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Circle
+from matplotlib.patheffects import withStroke
+from matplotlib.text import Text
+from matplotlib.ticker import FuncFormatter
+
+from common.tracing import traced
+
+# Estilo dos gráficos, aplicado a cada figura e eixo (o rcParams global do
+# matplotlib nunca é alterado, então outras renderizações do processo não são
+# afetadas)
+CHART_FONTS = ["Arial", "Helvetica", "DejaVu Sans"]
+# Primeira fonte instalada da lista (a DejaVu Sans acompanha o matplotlib)
+_instaladas = {fonte.name for fonte in font_manager.fontManager.ttflist}
+CHART_FONT = next((f for f in CHART_FONTS if f in _instaladas), "DejaVu Sans")
+
+CHART_TEXT_COLOR = "0.15"
+CHART_EDGE_COLOR = "0.8"
+TITLE_STYLE = {"fontsize": 16, "fontweight": "bold"}
+LABEL_STYLE = {"fontsize": 13, "fontweight": "bold", "color": CHART_TEXT_COLOR}
+TICK_STYLE = {
+    "labelsize": 11,
+    "colors": CHART_TEXT_COLOR,
+    "length": 0,
+    "labelfontfamily": CHART_FONT,
+}
+
+
+def _style_axes(ax):
+    """Aplica o estilo base (grade, bordas, ticks e rótulos) a um eixo"""
+    ax.set_facecolor("white")
+    ax.set_axisbelow(True)
+    for lado, spine in ax.spines.items():
+        spine.set_visible(lado in ("left", "bottom"))
+        spine.set_edgecolor(CHART_EDGE_COLOR)
+    ax.grid(True, color=CHART_EDGE_COLOR, linestyle="-", alpha=0.3)
+    ax.tick_params(**TICK_STYLE)
+    for rotulo in (ax.xaxis.label, ax.yaxis.label):
+        rotulo.set(fontfamily=CHART_FONT, **LABEL_STYLE)
+
+
+def _apply_chart_font(fig):
+    """Usa a fonte dos gráficos em todos os textos já criados na figura"""
+    for texto in fig.findobj(Text):
+        texto.set_fontfamily(CHART_FONT)
+
+
+def _new_figure(figsize):
+    """Cria uma figura com canvas Agg próprio e eixo já estilizado, fora do pyplot"""
+    fig = Figure(figsize=figsize, facecolor="white")
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    _style_axes(ax)
+    return fig, ax
+
+
+@traced("charts.create_data_visualizations")
+def create_data_visualizations(resultado):
+    """
+    Cria gráficos para visualizar diferentes aspectos dos resultados com estilo moderno
 
+    As figuras não passam pelo pyplot nem alteram o rcParams: podem ser
+    renderizadas em paralelo por várias threads. Quem as recebe deve liberá-las
+    com figura.clear() depois de renderizar, como faz render_chart_images.
+    """
+    figuras = _draw_figures(resultado)
+    for figura in figuras:
+        _apply_chart_font(figura)
+    return figuras
 
-def create_data_visualizations(resultado):
-    """Cria gráficos para visualizar diferentes aspectos dos resultados com estilo moderno"""
-    # Configurar estilo moderno
-    plt.style.use("seaborn-v0_8-whitegrid")
-
-    # Configurações globais para todos os gráficos
-    plt.rcParams.update(
-        {
-            "font.family": "sans-serif",
-            "font.sans-serif": ["Arial", "Helvetica", "DejaVu Sans"],
-            "font.size": 12,
-            "axes.titlesize": 16,
-            "axes.titleweight": "bold",
-            "axes.labelsize": 13,
-            "axes.labelweight": "bold",
-            "axes.spines.top": False,
-            "axes.spines.right": False,
-            "axes.grid": True,
-            "grid.alpha": 0.3,
-            "xtick.labelsize": 11,
-            "ytick.labelsize": 11,
-        }
-    )
 
+def _draw_figures(resultado):
+    """Desenha as quatro figuras da análise"""
     # Paleta de cores moderna
     color_palette = {
         "primary": "#0a8a40",  # Verde principal
@@ -85,7 +133,7 @@ def create_data_visualizations(resultado):
         ax.tick_params(colors=color_palette["dark"])
 
     # 1. Faturamento Atual vs Potencial - Gráfico de barras moderno
-    fig3, ax1 = plt.subplots(figsize=(10, 8), facecolor="white")
+    fig3, ax1 = _new_figure(figsize=(10, 8))
     labels = ["Atual", "Potencial"]
     valores = [resultado.faturamento_atual, resultado.faturamento_potencial]
 
@@ -163,7 +211,7 @@ def create_data_visualizations(resultado):
     style_chart(ax1)
 
     # Eixo Y com formatação monetária
-    ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, pos: f"R$ {x/1000:.0f}k"))
+    ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, pos: f"R$ {x/1000:.0f}k"))
 
     # Adicionar rótulos nas barras
     for i, (label, valor) in enumerate(zip(labels, valores)):
@@ -187,9 +235,10 @@ def create_data_visualizations(resultado):
     fig3.tight_layout(pad=3.5)
 
     # 2. Gráfico de ocupação - Donut chart
-    fig1, ax2 = plt.subplots(figsize=(8, 9), facecolor="white")
+    fig1, ax2 = _new_figure(figsize=(8, 9))
     ocupacao = resultado.ocupacao_atual_percentual
-    livre = 100 - ocupacao
+    # Acima de 100% (atendimentos além da capacidade) não há fatia livre
+    livre = max(0, 100 - ocupacao)
 
     # Definir cores baseadas no nível de ocupação
     if ocupacao < 50:
@@ -212,11 +261,11 @@ def create_data_visualizations(resultado):
     )
 
     # Círculo central para efeito de donut
-    circle = plt.Circle((0, 0), 0.2, fc="white")
+    circle = Circle((0, 0), 0.2, fc="white")
     ax2.add_artist(circle)
 
     # Adicionar texto central no donut com fundo para melhor visibilidade
-    central_bg = plt.Circle((0, 0), 0.18, fc="white", ec="#dddddd", alpha=0.9)
+    central_bg = Circle((0, 0), 0.18, fc="white", ec="#dddddd", alpha=0.9)
     ax2.add_patch(central_bg)
 
     ax2.text(
@@ -244,7 +293,7 @@ def create_data_visualizations(resultado):
     # Adicionar legendas personalizadas com melhor posicionamento
     labels = ["Utilizada", "Não utilizada"]
     legend_elements = [
-        plt.Line2D(
+        Line2D(
             [0],
             [0],
             marker="o",
@@ -253,7 +302,7 @@ def create_data_visualizations(resultado):
             markersize=12,
             label=f"{labels[0]}: {ocupacao:.1f}%",
         ),
-        plt.Line2D(
+        Line2D(
             [0],
             [0],
             marker="o",
@@ -281,7 +330,7 @@ def create_data_visualizations(resultado):
     fig1.tight_layout(pad=4.0)
 
     # 3. Margem de Lucro Atual vs Padrão do Setor
-    fig4, ax3 = plt.subplots(figsize=(10, 8), facecolor="white")
+    fig4, ax3 = _new_figure(figsize=(10, 8))
 
     margem_atual = resultado.margem_lucro
     margem_min, margem_max = 15, 25  # Valores padrão do setor
@@ -490,7 +539,7 @@ def create_data_visualizations(resultado):
     fig4.tight_layout(pad=4.0)
 
     # 4. Estrutura de Custos - Gráfico de pizza moderno
-    fig2, ax4 = plt.subplots(figsize=(8, 9), facecolor="white")
+    fig2, ax4 = _new_figure(figsize=(8, 9))
 
     # Calcular componentes de custo
     custo_pessoal = max(0, getattr(resultado, "despesa_pessoal", 0))
@@ -536,7 +585,7 @@ def create_data_visualizations(resultado):
         for i, (label, pct) in enumerate(zip(labels, percents)):
             # Criar elemento da legenda com percentual
             legend_elements.append(
-                plt.Line2D(
+                Line2D(
                     [0],
                     [0],
                     marker="o",
@@ -559,7 +608,7 @@ def create_data_visualizations(resultado):
         )
 
         # Adicionar valor total no centro com fundo para melhor visibilidade
-        central_bg = plt.Circle((0, 0), 0.25, fc="white", ec="#dddddd", alpha=0.9)
+        central_bg = Circle((0, 0), 0.25, fc="white", ec="#dddddd", alpha=0.9)
         ax4.add_patch(central_bg)
 
         ax4.text(
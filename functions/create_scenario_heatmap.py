@@ -0,0 +1,120 @@
+import numpy as np
+from matplotlib.colors import TwoSlopeNorm
+
+from common.tracing import traced
+from utils import format_currency, format_percent
+from .create_data_visualizations import (
+    CHART_EDGE_COLOR,
+    LABEL_STYLE,
+    TICK_STYLE,
+    TITLE_STYLE,
+    _apply_chart_font,
+    _new_figure,
+)
+
+# Título e formatação das células de cada métrica exibida no mapa de calor
+HEATMAP_METRICS = {
+    "lucro_potencial": (
+        "Lucro Potencial (R$)",
+        lambda v: format_currency(v, "R$", 0),
+    ),
+    "lucro_atual": ("Lucro Atual (R$)", lambda v: format_currency(v, "R$", 0)),
+    "ponto_equilibrio_atendimentos": (
+        "Ponto de Equilíbrio (atendimentos)",
+        lambda v: f"{v:,.0f}".replace(",", "."),
+    ),
+    "faturamento_potencial": (
+        "Faturamento Potencial (R$)",
+        lambda v: format_currency(v, "R$", 0),
+    ),
+    "ocupacao_atual_percentual": (
+        "Ocupação Atual (%)",
+        lambda v: format_percent(v, 0),
+    ),
+}
+
+# Métricas em que valores menores são melhores (escala de cores invertida)
+_MENOR_MELHOR = {"ponto_equilibrio_atendimentos", "ocupacao_atual_percentual"}
+
+# Acima deste número de células os valores não são escritos no gráfico
+_MAX_CELULAS_ANOTADAS = 144
+
+_NOMES_CAMPOS = {
+    "funcionarios_banho_tosa": "Funcionários de banho e tosa",
+    "dias_funcionamento_semana": "Dias de funcionamento por semana",
+    "ticket_medio": "Ticket médio (R$)",
+    "horario_fechamento": "Horário de fechamento",
+    "horario_abertura": "Horário de abertura",
+}
+
+
+@traced("charts.create_scenario_heatmap")
+def create_scenario_heatmap(
+    tabela, linhas, colunas, metrica="lucro_potencial", agregacao="mean"
+):
+    """
+    Cria um mapa de calor de uma métrica sobre dois campos da simulação.
+
+    Args:
+        tabela: Retorno de analysis.scenario_sweep
+        linhas: Campo simulado exibido no eixo vertical
+        colunas: Campo simulado exibido no eixo horizontal
+        metrica: Coluna da tabela exibida nas células
+        agregacao: Como combinar os cenários dos demais campos simulados
+            ("mean", "min", "max" ou "median")
+
+    Returns:
+        Figure: Figura do matplotlib (sem registro no pyplot)
+    """
+    grade = tabela.pivot_table(
+        index=linhas, columns=colunas, values=metrica, aggfunc=agregacao
+    )
+    valores = grade.to_numpy(dtype=float)
+    titulo, formato = HEATMAP_METRICS.get(metrica, (metrica, "{:,.1f}".format))
+
+    cmap = "RdYlGn_r" if metrica in _MENOR_MELHOR else "RdYlGn"
+    norm = None
+    minimo, maximo = np.nanmin(valores), np.nanmax(valores)
+    if minimo < 0 < maximo:
+        # Prejuízo em vermelho e lucro em verde, com o zero no centro da escala
+        norm = TwoSlopeNorm(vcenter=0, vmin=minimo, vmax=maximo)
+
+    largura = min(14, max(7, 1.1 * grade.shape[1] + 3))
+    altura = min(10, max(4.5, 0.6 * grade.shape[0] + 2))
+    fig, ax = _new_figure((largura, altura))
+
+    imagem = ax.imshow(valores, cmap=cmap, norm=norm, aspect="auto")
+    barra = fig.colorbar(imagem, ax=ax)
+    barra.ax.set_ylabel(titulo, **LABEL_STYLE)
+    barra.ax.tick_params(**TICK_STYLE)
+    barra.outline.set_edgecolor(CHART_EDGE_COLOR)
+    # Com TwoSlopeNorm a barra precisa de escala linear para mostrar os dois lados
+    barra.ax.set_yscale("linear")
+
+    ax.set_xticks(range(grade.shape[1]), labels=[str(c) for c in grade.columns])
+    ax.set_yticks(range(grade.shape[0]), labels=[str(i) for i in grade.index])
+    ax.set_xlabel(_NOMES_CAMPOS.get(colunas, colunas))
+    ax.set_ylabel(_NOMES_CAMPOS.get(linhas, linhas))
+    ax.grid(False)
+    ax.set_title(titulo, pad=15, **TITLE_STYLE)
+
+    if valores.size <= _MAX_CELULAS_ANOTADAS:
+        cores = imagem.cmap(imagem.norm(valores))
+        for (i, j), valor in np.ndenumerate(valores):
+            if np.isnan(valor):
+                continue
+            # Texto escuro em células claras e claro em células escuras
+            luminancia = cores[i, j, :3] @ [0.299, 0.587, 0.114]
+            ax.text(
+                j,
+                i,
+                formato(valor),
+                ha="center",
+                va="center",
+                fontsize=9,
+                color="#2c3e50" if luminancia > 0.5 else "white",
+            )
+
+    _apply_chart_font(fig)
+    fig.tight_layout()
+    return fig
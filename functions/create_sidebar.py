@@ -1,12 +1,10 @@
 import streamlit as st
+from assets.images import LOGO, LOGO_URL, get_cached_image_bytes
 
 
 def create_sidebar():
     """Cria a barra lateral com informações e links úteis"""
-    st.sidebar.image(
-        "https://dogs-club-source.s3.us-east-1.amazonaws.com/logo.png",
-        width=200,
-    )
+    st.sidebar.image(get_cached_image_bytes(LOGO) or LOGO_URL, width=200)
 
     st.sidebar.markdown("## Sobre a Dog's Club")
     st.sidebar.markdown(
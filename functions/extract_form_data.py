@@ -1,12 +1,13 @@
 import streamlit as st
+from common.tracing import traced
 from dataclass import PetshopData
 import logging
 
 # Configurar logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@traced("extract_form_data")
 def extract_form_data():
     """Extrai os dados dos formulários e cria um objeto PetshopData"""
     dados = {}
@@ -73,9 +74,12 @@ def extract_form_data():
     dados["principal_desafio"] = st.session_state.get("principal_desafio")
 
     # Registrar valores importantes para depuração
-    logger.info(f"Faturamento mensal: {dados['faturamento_mensal']}")
-    logger.info(f"Ticket médio: {dados['ticket_medio']}")
-    logger.info(f"Atendimentos por mês: {dados['numero_atendimentos_mes']}")
+    logger.debug(
+        "Faturamento mensal: %s, ticket médio: %s, atendimentos por mês: %s",
+        dados["faturamento_mensal"],
+        dados["ticket_medio"],
+        dados["numero_atendimentos_mes"],
+    )
 
     # Calcular percentual de produtos sobre o faturamento
     if dados["faturamento_mensal"] > 0:
@@ -96,7 +100,7 @@ def extract_form_data():
     # Certificar que não há valores zerados importantes
     for key in ["faturamento_mensal", "ticket_medio", "numero_atendimentos_mes"]:
         if not dados[key]:
-            logger.warning(f"Valor crítico está zerado: {key}")
+            logger.warning("Valor crítico está zerado: %s", key)
             if key == "faturamento_mensal":
                 dados[key] = 18000.0
             elif key == "ticket_medio":
@@ -106,9 +110,9 @@ def extract_form_data():
 
     try:
         petshop_data = PetshopData(**dados)
-        logger.info(f"Objeto PetshopData criado com sucesso: {petshop_data}")
+        logger.debug("Objeto PetshopData criado com sucesso: %r", petshop_data)
         return petshop_data
     except Exception as e:
         st.error(f"Erro ao validar os dados: {str(e)}")
-        logger.error(f"Erro ao criar objeto PetshopData: {str(e)}")
+        logger.error("Erro ao criar objeto PetshopData: %s", e)
         return None
@@ -0,0 +1,67 @@
+import io
+import os
+from datetime import date
+
+from common.cache import canonical_hash
+from common.job_queue import JobQueue
+from .chart_artifacts import get_chart_images
+from .export_pdf import export_dashboard_pdf
+from .pipeline_cache import cached_financial_report, cached_pdf
+
+# Limita quantos PDFs são gerados ao mesmo tempo neste processo
+pdf_job_queue = JobQueue(
+    max_workers=int(os.getenv("PDF_JOB_WORKERS", "2")),
+    thread_name_prefix="pdf-job",
+)
+
+
+def pdf_job_id(dados):
+    """Identificador da tarefa: pedidos repetidos para o mesmo envio são agrupados"""
+    return canonical_hash(dados, "pdf_email")
+
+
+def generate_and_send_pdf(email_handler, dados, resultado):
+    """
+    Gera o relatório PDF e o envia por email. Executado fora da thread do Streamlit.
+
+    Args:
+        email_handler: Instância de EmailHandler usada no envio
+        dados: Dados do petshop
+        resultado: Resultados da análise
+
+    Returns:
+        Dict: Resposta de EmailHandler.send_pdf_report
+    """
+    email = dados.email_contato
+    if not email or email.strip() == "":
+        raise ValueError("Email de contato não pode ser vazio")
+
+    relatorio = cached_financial_report(dados, resultado)
+    data_geracao = date.today()
+
+    def gerar_pdf():
+        imagens = get_chart_images(resultado)
+        return export_dashboard_pdf(
+            dados, resultado, relatorio, imagens, data_geracao=data_geracao
+        ).getvalue()
+
+    # Pedidos repetidos no mesmo dia para os mesmos dados reutilizam o PDF
+    pdf_buffer = io.BytesIO(cached_pdf(dados, data_geracao, gerar_pdf))
+
+    # Usar o nome do usuário se disponível, caso contrário usar o nome do petshop
+    if getattr(dados, "nome", None):
+        nome_usuario = dados.nome
+    else:
+        nome_usuario = (
+            dados.nome_petshop.split()[0]
+            if " " in dados.nome_petshop
+            else dados.nome_petshop
+        )
+
+    return email_handler.send_pdf_report(
+        nome=nome_usuario,
+        email=email,
+        petshop_name=dados.nome_petshop,
+        faturamento_nao_realizado=resultado.faturamento_nao_realizado,
+        pdf_buffer=pdf_buffer,
+    )
@@ -0,0 +1,244 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, TableStyle
+
+# Cores principais do tema
+AZUL_PRINCIPAL = colors.HexColor("#3498db")
+AZUL_SECUNDARIO = colors.HexColor("#2980b9")
+AZUL_ESCURO = colors.HexColor("#082f42")
+CINZA_TEXTO = colors.HexColor("#2c3e50")
+CINZA_CLARO = colors.HexColor("#f5f5f5")
+CINZA_BORDA = colors.HexColor("#e0e0e0")
+VERMELHO = colors.HexColor("#e74c3c")
+VERDE = colors.HexColor("#2ecc71")
+VERDE_ESCURO = colors.HexColor("#0a8a40")
+
+
+@dataclass(frozen=True)
+class PdfLayout:
+    """Formato de página e margens dos relatórios em PDF"""
+
+    pagesize: tuple = A4
+    margin: float = 36  # Margens menores para maior espaço
+
+    def new_document(
+        self, buffer, title: str, invariant: bool = False
+    ) -> SimpleDocTemplate:
+        """
+        Cria o documento do ReportLab para escrever em `buffer`.
+
+        Com `invariant`, o ReportLab usa data de criação e ID fixos, e o mesmo
+        conteúdo sempre gera os mesmos bytes.
+        """
+        return SimpleDocTemplate(
+            buffer,
+            pagesize=self.pagesize,
+            rightMargin=self.margin,
+            leftMargin=self.margin,
+            topMargin=self.margin,
+            bottomMargin=self.margin,
+            title=title,
+            invariant=1 if invariant else None,
+        )
+
+
+def _build_paragraph_styles() -> dict:
+    styles = getSampleStyleSheet()
+
+    title = ParagraphStyle(
+        "CustomTitle",
+        parent=styles["Heading1"],
+        fontSize=26,
+        spaceAfter=20,
+        textColor=AZUL_ESCURO,
+        alignment=TA_CENTER,
+        fontName="Helvetica-Bold",
+        italic=False,
+    )
+    subtitle = ParagraphStyle(
+        "CustomSubTitle",
+        parent=styles["Heading2"],
+        fontSize=20,
+        spaceAfter=15,
+        textColor=CINZA_TEXTO,
+        alignment=TA_CENTER,
+        fontName="Helvetica-Bold",
+        italic=False,
+    )
+    section = ParagraphStyle(
+        "CustomSection",
+        parent=styles["Heading3"],
+        fontSize=16,
+        spaceAfter=10,
+        textColor=AZUL_PRINCIPAL,
+        borderPadding=(0, 0, 5, 0),
+        borderWidth=0,
+        borderColor=CINZA_BORDA,
+        borderRadius=5,
+        fontName="Helvetica-Bold",
+        italic=False,
+    )
+
+    # Texto normal com quebra de linha adequada
+    normal = ParagraphStyle(
+        "NormalWrapped",
+        parent=styles["Normal"],
+        wordWrap="CJK",
+        alignment=0,  # Alinhamento à esquerda
+        firstLineIndent=0,
+        leading=14,  # Espaçamento entre linhas
+        spaceAfter=6,  # Espaço após o parágrafo
+        textColor=CINZA_TEXTO,
+    )
+
+    def section_variant(name, color, **kwargs):
+        return ParagraphStyle(
+            name,
+            parent=section,
+            textColor=color,
+            fontName="Helvetica-Bold",
+            fontSize=16,
+            **kwargs,
+        )
+
+    def item_title(name, color):
+        return ParagraphStyle(
+            name,
+            parent=normal,
+            textColor=color,
+            fontName="Helvetica-Bold",
+            fontSize=12,
+            spaceBefore=10,
+            spaceAfter=2,
+        )
+
+    def item_description(name):
+        return ParagraphStyle(name, parent=normal, leftIndent=15, textColor=CINZA_TEXTO)
+
+    def badge(name, color, background):
+        return ParagraphStyle(
+            name,
+            parent=normal,
+            textColor=color,
+            fontName="Helvetica-Bold",
+            fontSize=10,
+            leftIndent=15,
+            backgroundColor=colors.HexColor(background),
+            borderPadding=(5, 5, 5, 5),
+            borderRadius=5,
+        )
+
+    return {
+        "title": title,
+        "subtitle": subtitle,
+        "section": section,
+        "normal": normal,
+        "date": ParagraphStyle(
+            "Date", parent=styles["Normal"], alignment=TA_CENTER, textColor=CINZA_TEXTO
+        ),
+        # Estilo que permite processamento de tags HTML
+        "html": ParagraphStyle(
+            "HTMLStyle",
+            parent=styles["Normal"],
+            wordWrap="CJK",
+            leading=14,
+            textColor=CINZA_TEXTO,
+        ),
+        "potential_section": section_variant("PotentialSection", VERMELHO),
+        "inefficiency_section": section_variant(
+            "InefficiencySection", VERMELHO, alignment=TA_LEFT
+        ),
+        "recommendation_section": section_variant(
+            "RecommendationSection", VERDE_ESCURO, alignment=TA_LEFT
+        ),
+        "priority_section": section_variant(
+            "PrioritySection", VERDE_ESCURO, alignment=TA_LEFT
+        ),
+        "goal_section": section_variant(
+            "GoalSection", AZUL_PRINCIPAL, alignment=TA_LEFT
+        ),
+        "red_alert": ParagraphStyle(
+            "RedAlert",
+            parent=normal,
+            textColor=VERMELHO,
+            fontName="Helvetica-Bold",
+            fontSize=12,
+        ),
+        "inefficiency_title": item_title("InefficiencyTitle", VERMELHO),
+        "inefficiency_description": item_description("InefficiencyDescription"),
+        "recommendation_title": item_title("RecommendationTitle", VERDE_ESCURO),
+        "recommendation_description": item_description("RecommendationDescription"),
+        "impact": badge("ImpactStyle", VERDE_ESCURO, "#e8f8e8"),
+        "deadline": badge("DeadlineStyle", AZUL_PRINCIPAL, "#e3f2fd"),
+        "priority_title": item_title("PriorityTitle", VERDE_ESCURO),
+        "priority_description": item_description("PriorityDescription"),
+        "goal_title": item_title("GoalTitle", AZUL_PRINCIPAL),
+        "goal_description": item_description("GoalDescription"),
+    }
+
+
+def _build_table_styles() -> dict:
+    return {
+        "metrics": TableStyle(
+            [
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 12),
+                # Tamanho maior e negrito para os valores principais
+                ("FONTSIZE", (0, 1), (-1, 1), 14),
+                ("FONTNAME", (0, 1), (-1, 1), "Helvetica-Bold"),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                # Cabeçalho azul Dogs Club com texto branco
+                ("BACKGROUND", (0, 0), (-1, 0), AZUL_PRINCIPAL),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("BACKGROUND", (0, 1), (-1, 1), colors.HexColor("#f8f9fa")),
+                ("BACKGROUND", (0, 2), (-1, 2), colors.white),
+                ("BOX", (0, 0), (-1, -1), 1, CINZA_BORDA),
+                ("GRID", (0, 0), (-1, -1), 1, CINZA_BORDA),
+                # Linha mais grossa abaixo do cabeçalho
+                ("LINEBELOW", (0, 0), (-1, 0), 2, AZUL_PRINCIPAL),
+                ("ROUNDEDCORNERS", [10, 10, 10, 10]),
+            ]
+        ),
+        "potential": TableStyle(
+            [
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 12),
+                ("FONTSIZE", (0, 1), (-1, 1), 16),  # Valores destacados maiores
+                ("FONTNAME", (0, 1), (-1, 1), "Helvetica-Bold"),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                # Vermelho para alertar, com fundo claro e valores em vermelho
+                ("BACKGROUND", (0, 0), (-1, 0), VERMELHO),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("BACKGROUND", (0, 1), (-1, 1), colors.HexColor("#fff8f8")),
+                ("TEXTCOLOR", (0, 1), (-1, 1), VERMELHO),
+                ("BOX", (0, 0), (-1, -1), 1, CINZA_BORDA),
+                ("GRID", (0, 0), (-1, -1), 1, CINZA_BORDA),
+            ]
+        ),
+        "figures": TableStyle(
+            [
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                ("LEFTPADDING", (0, 0), (-1, -1), 5),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 5),
+                ("TOPPADDING", (0, 0), (-1, -1), 5),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+            ]
+        ),
+    }
+
+
+# Registros criados uma vez por processo e compartilhados por todos os PDFs.
+# Os estilos não devem ser alterados por quem os usa.
+PDF_STYLES = MappingProxyType(_build_paragraph_styles())
+TABLE_STYLES = MappingProxyType(_build_table_styles())
+PDF_LAYOUT = PdfLayout()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+
+from common.cache import (
+    JSON_CODEC,
+    ContentAddressedStore,
+    DiskCodec,
+    ResultCache,
+    canonical_hash,
+)
+from dataclass import AnalisysResult, AnalysisWarning
+from .export_pdf import PDF_TEMPLATE_VERSION
+from .prepare_financial_report import prepare_financial_report
+
+# Cache compartilhado por todas as sessões do processo. Em REPORT_CACHE_DIR são
+# gravados apenas a análise e o relatório, em JSON; gráficos ficam em memória e
+# os PDFs têm o próprio armazenamento (pdf_store)
+pipeline_cache = ResultCache(
+    max_items=int(os.getenv("REPORT_CACHE_SIZE", "512")),
+    ttl_seconds=float(os.getenv("REPORT_CACHE_TTL", "3600")),
+    disk_path=os.getenv("REPORT_CACHE_DIR"),
+)
+
+# PDFs endereçados por hash dos dados; o diretório pode ser compartilhado entre nós
+pdf_store = ContentAddressedStore(
+    os.getenv("PDF_CACHE_DIR")
+    or os.path.join(tempfile.gettempdir(), "dogs_club_pdf_cache"),
+    suffix=".pdf",
+)
+
+
+# Análise em disco: resultado e avisos como JSON, reconstruídos pelos modelos
+ANALYSIS_CODEC = DiskCodec(
+    dump=lambda analise: {
+        "resultado": analise[0].dict(),
+        "avisos": [aviso.dict() for aviso in analise[1]],
+    },
+    load=lambda dados: (
+        AnalisysResult(**dados["resultado"]),
+        [AnalysisWarning(**aviso) for aviso in dados["avisos"]],
+    ),
+)
+
+
+def petshop_cache_key(dados):
+    """Retorna a chave de cache (hash canônico) dos dados do petshop"""
+    return canonical_hash(dados)
+
+
+def cached_financial_report(dados, resultado):
+    """Retorna o relatório financeiro do cache ou o gera e armazena"""
+    chave = f"{petshop_cache_key(dados)}:relatorio"
+    return pipeline_cache.get_or_set(
+        chave, lambda: prepare_financial_report(dados, resultado), JSON_CODEC
+    )
+
+
+def pdf_cache_key(dados, data_geracao):
+    """
+    Chave do PDF: hash dos dados do petshop, da versão do layout do relatório e
+    da data exibida no documento
+    """
+    return canonical_hash(
+        dados, "pdf", PDF_TEMPLATE_VERSION, data_geracao.strftime("%Y-%m-%d")
+    )
+
+
+def cached_pdf(dados, data_geracao, factory):
+    """
+    Retorna o PDF do petshop do cache ou o gera com `factory`.
+
+    O PDF deve ser gerado de forma determinística (ver export_dashboard_pdf),
+    pois o mesmo arquivo é reutilizado em todos os envios para dados iguais.
+    A data exibida faz parte da chave: envios em outro dia geram um novo PDF.
+
+    Args:
+        dados: Dados do petshop
+        data_geracao: Data exibida no relatório (a mesma passada ao factory)
+        factory: Função sem argumentos que gera o PDF em bytes
+
+    Returns:
+        bytes: Conteúdo do PDF
+    """
+    chave = pdf_cache_key(dados, data_geracao)
+    return pipeline_cache.get_or_set(
+        f"{chave}:pdf", lambda: pdf_store.get_or_set(chave, factory)
+    )
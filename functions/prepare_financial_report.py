@@ -1,6 +1,8 @@
+from common.tracing import traced
 from utils import format_currency, format_percent
 
 
+@traced("prepare_financial_report")
 def prepare_financial_report(dados, resultado):
     """Gera um relatório financeiro com recomendações personalizadas"""
     # Valores padrão do setor para comparação
@@ -0,0 +1,87 @@
+import streamlit as st
+
+from analysis import simulate_petshop
+from utils import format_currency, format_percent
+
+# Métricas exibidas e sua formatação
+_LINHAS = {
+    "lucro_atual": ("Lucro mensal", format_currency),
+    "margem_lucro": ("Margem de lucro", format_percent),
+    "ponto_equilibrio_atendimentos": (
+        "Ponto de equilíbrio (atendimentos/mês)",
+        lambda v: f"{v:,.0f}".replace(",", "."),
+    ),
+    "projecao_anual_atual": ("Faturamento anual", format_currency),
+    "projecao_anual_potencial": ("Faturamento anual potencial", format_currency),
+    "projecao_anual_lucro": ("Lucro anual", format_currency),
+}
+
+
+@st.fragment
+def show_projection_bands(dados):
+    """
+    Exibe as faixas P10/P50/P90 das projeções simuladas (Monte Carlo).
+
+    Roda como fragmento: alterar a incerteza recalcula apenas esta seção.
+
+    Args:
+        dados: Dados do petshop
+    """
+    st.markdown(
+        "<div class='section-header'>🎲 Faixas de Projeção</div>",
+        unsafe_allow_html=True,
+    )
+    st.caption(
+        "Atendimentos, ticket e tempo de serviço variam de mês a mês. "
+        "Simulamos milhares de meses possíveis para mostrar o intervalo provável "
+        "dos seus resultados."
+    )
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        atendimentos = st.slider(
+            "Variação de atendimentos (%)", 0, 50, 15, key="incerteza_atendimentos"
+        )
+    with col2:
+        ticket = st.slider(
+            "Variação do ticket médio (%)", 0, 50, 10, key="incerteza_ticket"
+        )
+    with col3:
+        tempo = st.slider(
+            "Variação do tempo de serviço (%)", 0, 50, 15, key="incerteza_tempo"
+        )
+
+    faixas = simulate_petshop(
+        dados,
+        incerteza={
+            "numero_atendimentos_mes": atendimentos / 100,
+            "ticket_medio": ticket / 100,
+            "tempo_medio_banho_tosa": tempo / 100,
+        },
+        seed=0,
+    )
+
+    st.table(
+        {
+            "Métrica": [nome for nome, _ in _LINHAS.values()],
+            "Cenário baixo (P10)": [
+                formatar(faixas.at[metrica, "p10"])
+                for metrica, (_, formatar) in _LINHAS.items()
+            ],
+            "Mediana (P50)": [
+                formatar(faixas.at[metrica, "p50"])
+                for metrica, (_, formatar) in _LINHAS.items()
+            ],
+            "Cenário alto (P90)": [
+                formatar(faixas.at[metrica, "p90"])
+                for metrica, (_, formatar) in _LINHAS.items()
+            ],
+        }
+    )
+
+    prob_prejuizo = faixas.at["lucro_atual", "prob_negativo"]
+    if prob_prejuizo > 0:
+        st.warning(
+            f"Em {format_percent(prob_prejuizo * 100)} dos cenários simulados o mês "
+            "fecha com prejuízo."
+        )
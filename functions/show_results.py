@@ -1,22 +1,44 @@
+import functools
 import streamlit as st
 import os
 
+from common.enums import JobStatus
 from utils import format_currency, format_percent
-from .create_data_visualizations import create_data_visualizations
-from .prepare_financial_report import prepare_financial_report
-from .export_pdf import export_dashboard_pdf
+from .chart_artifacts import get_chart_images
+from .pdf_jobs import generate_and_send_pdf, pdf_job_id, pdf_job_queue
+from .pipeline_cache import cached_financial_report
+from .show_projection_bands import show_projection_bands
+from .show_scenario_sweep import show_scenario_sweep
 from handlers.email_handler import EmailHandler
+from handlers.email_outbox import EmailOutbox, default_outbox_path
 from handlers.lead_handler import LeadHandler
 
-# Configuração dos handlers
-email_handler = EmailHandler()
-lead_handler = LeadHandler()
+
+# Configuração dos handlers (criados no primeiro uso e compartilhados pelo processo)
+@functools.lru_cache(maxsize=None)
+def get_email_handler() -> EmailHandler:
+    """Handler de emails do processo, criado no primeiro uso"""
+    return EmailHandler()
+
+
+@functools.lru_cache(maxsize=None)
+def get_lead_handler() -> LeadHandler:
+    """Handler de leads do processo, criado no primeiro uso"""
+    return LeadHandler()
+
+
+@functools.lru_cache(maxsize=None)
+def get_email_outbox() -> EmailOutbox:
+    """Fila persistente de emails do processo, com a thread de envio iniciada"""
+    outbox = EmailOutbox(get_email_handler().ses_handler, db_path=default_outbox_path())
+    outbox.start()
+    return outbox
 
 
 def handle_export_pdf(dados, resultado):
     """
     Função centralizada para lidar com a exportação de PDF que será usada por ambos os botões.
-    Gera PDF e envia por email sem opção de download.
+    Enfileira a geração do PDF e o envio por email sem bloquear a sessão.
 
     Args:
         dados: Dados do petshop
@@ -30,51 +52,78 @@ def handle_export_pdf(dados, resultado):
             )
             return
 
-        # Gerar relatório PDF
-        with st.spinner("Gerando relatório PDF e enviando para seu email..."):
-            relatorio = prepare_financial_report(dados, resultado)
-            figuras = create_data_visualizations(resultado)
-            pdf_buffer = export_dashboard_pdf(dados, resultado, relatorio, figuras)
-
-            # Garantir que email não seja vazio
-            email = dados.email_contato
-            if not email or email.strip() == "":
-                raise ValueError("Email de contato não pode ser vazio")
-
-            # Usar o nome do usuário se disponível, caso contrário usar o nome do petshop
-            nome_usuario = ""
-            if hasattr(dados, "nome") and dados.nome:
-                nome_usuario = dados.nome
-            else:
-                # Fallback para o nome do petshop como antes
-                nome_usuario = (
-                    dados.nome_petshop.split()[0]
-                    if " " in dados.nome_petshop
-                    else dados.nome_petshop
-                )
-
-            # Enviar email com PDF anexado
-            email_result = email_handler.send_pdf_report(
-                nome=nome_usuario,
-                email=email,
-                petshop_name=dados.nome_petshop,
-                faturamento_nao_realizado=resultado.faturamento_nao_realizado,
-                pdf_buffer=pdf_buffer,
-            )
-
-            if email_result["success"]:
-                st.success(
-                    f"Relatório PDF enviado com sucesso para {email}! Verifique sua caixa de entrada.",
-                    icon="✅",
-                )
-            else:
-                st.error(
-                    f"Não foi possível enviar o email. Erro: {email_result.get('error', 'Desconhecido')}"
-                )
+        # Cliques repetidos enquanto o envio está em andamento reutilizam a mesma tarefa
+        st.session_state["pdf_job_id"] = pdf_job_queue.submit(
+            generate_and_send_pdf,
+            get_email_handler(),
+            dados,
+            resultado,
+            job_id=pdf_job_id(dados),
+        )
     except Exception as e:
         st.error(f"Erro ao gerar ou enviar o PDF: {str(e)}")
 
 
+# Estados em que a tarefa do PDF ainda pode mudar
+_PDF_JOB_ACTIVE = (JobStatus.PENDING, JobStatus.RUNNING)
+
+
+def _current_pdf_job():
+    """Tarefa de PDF da sessão ou None"""
+    job_id = st.session_state.get("pdf_job_id")
+    return pdf_job_queue.get(job_id) if job_id else None
+
+
+def show_pdf_job_status(email):
+    """
+    Exibe o andamento do envio do PDF.
+
+    Enquanto a tarefa está pendente ou em execução, o status é atualizado a cada
+    2 segundos por um fragmento; depois que ela termina, o resultado é exibido
+    sem atualização periódica.
+
+    Args:
+        email: Email de destino do relatório
+    """
+    job = _current_pdf_job()
+    if job and job["status"] in _PDF_JOB_ACTIVE:
+        _poll_pdf_job_status(email)
+    else:
+        _render_pdf_job_status(job, email)
+
+
+@st.fragment(run_every=2)
+def _poll_pdf_job_status(email):
+    """Atualiza apenas este fragmento enquanto a tarefa do PDF está em andamento"""
+    job = _current_pdf_job()
+    if job and job["status"] in _PDF_JOB_ACTIVE:
+        _render_pdf_job_status(job, email)
+        return
+
+    # Tarefa concluída: recarrega a página para exibir o resultado e parar o polling
+    st.rerun()
+
+
+def _render_pdf_job_status(job, email):
+    """Exibe o status de uma tarefa de PDF (nada se não houver tarefa)"""
+    if not job:
+        return
+
+    if job["status"] in _PDF_JOB_ACTIVE:
+        st.info("Gerando relatório PDF e enviando para seu email...", icon="⏳")
+    elif job["status"] == JobStatus.FAILED:
+        st.error(f"Erro ao gerar ou enviar o PDF: {job['error']}")
+    elif job["result"]["success"]:
+        st.success(
+            f"Relatório PDF enviado com sucesso para {email}! Verifique sua caixa de entrada.",
+            icon="✅",
+        )
+    else:
+        st.error(
+            f"Não foi possível enviar o email. Erro: {job['result'].get('error', 'Desconhecido')}"
+        )
+
+
 def create_pdf_email_button(dados, resultado, key_suffix, col_widths=[2, 3, 2]):
     """
     Função para criar o botão de envio de PDF por email.
@@ -93,8 +142,13 @@ def create_pdf_email_button(dados, resultado, key_suffix, col_widths=[2, 3, 2]):
             key=f"export_pdf_{key_suffix}",
             use_container_width=True,
         ):
+            st.session_state["pdf_job_origin"] = key_suffix
             handle_export_pdf(dados, resultado)
 
+        # O status aparece apenas abaixo do botão que iniciou o envio
+        if st.session_state.get("pdf_job_origin") == key_suffix:
+            show_pdf_job_status(dados.email_contato)
+
 
 def show_results(dados, resultado):
     """Exibe os resultados da análise do petshop"""
@@ -215,22 +269,26 @@ def show_results(dados, resultado):
         "<div class='section-header'>Visualizações</div>", unsafe_allow_html=True
     )
 
-    # Criar gráficos
-    figuras = create_data_visualizations(resultado)
+    # Gráficos renderizados uma única vez e reutilizados no PDF
+    imagens = get_chart_images(resultado)
 
     # Primeira linha de gráficos
     col1, col2 = st.columns(2)
     with col1:
-        st.pyplot(figuras[0])
+        st.image(imagens[0], use_container_width=True)
     with col2:
-        st.pyplot(figuras[1])
+        st.image(imagens[1], use_container_width=True)
 
     # Segunda linha de gráficos
     col1, col2 = st.columns(2)
     with col1:
-        st.pyplot(figuras[2])
+        st.image(imagens[2], use_container_width=True)
     with col2:
-        st.pyplot(figuras[3])
+        st.image(imagens[3], use_container_width=True)
+
+    # Faixas de incerteza das projeções e simulação de cenários
+    show_projection_bands(dados)
+    show_scenario_sweep(dados)
 
     # Botão de exportar PDF em destaque (no topo)
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -308,7 +366,7 @@ def show_results(dados, resultado):
         unsafe_allow_html=True,
     )
 
-    relatorio = prepare_financial_report(dados, resultado)
+    relatorio = cached_financial_report(dados, resultado)
 
     # Saúde Financeira com suporte a HTML
     st.markdown(
@@ -612,7 +670,7 @@ def show_results(dados, resultado):
                 whatsapp = getattr(dados, "whatsapp_contato", "")
                 mensagem = st.session_state.get("contato_mensagem", "")
 
-                lead_handler.create_lead(
+                lead = get_lead_handler().create_lead(
                     name=nome_usuario,
                     email=email,
                     whatsapp=whatsapp,
@@ -621,25 +679,45 @@ def show_results(dados, resultado):
                     source="streamlit",
                 )
 
-                # Enviar email de confirmação para o cliente
-                email_handler.send_contact_confirmation(
-                    nome=nome_usuario,
-                    email=email,
-                    petshop_name=dados.nome_petshop,
-                    mensagem=mensagem,
+                # Os emails são enviados em segundo plano pela fila persistente;
+                # a chave por lead impede envios duplicados
+                email_handler = get_email_handler()
+                outbox = get_email_outbox()
+
+                # Email de confirmação para o cliente
+                outbox.enqueue(
+                    f"{lead['lead_id']}:contact_confirmation",
+                    **email_handler.build_contact_confirmation(
+                        nome=nome_usuario,
+                        email=email,
+                        petshop_name=dados.nome_petshop,
+                        mensagem=mensagem,
+                        current_timestamp=lead["created_at"],
+                    ),
                 )
 
-                # Enviar notificação interna para a equipe
-                internal_recipients = os.getenv("DOGS_CLUB_INTERNAL_EMAILS").split(",")
-                email_handler.send_internal_notification(
-                    nome=nome_usuario,
-                    email=email,
-                    whatsapp=whatsapp,
-                    petshop_name=dados.nome_petshop,
-                    mensagem=mensagem,
-                    fonte="relatorio_financeiro_streamlit",
-                    internal_recipients=internal_recipients,
-                )
+                # Notificação interna para a equipe
+                internal_recipients = [
+                    recipient.strip()
+                    for recipient in os.getenv("DOGS_CLUB_INTERNAL_EMAILS", "").split(
+                        ","
+                    )
+                    if recipient.strip()
+                ]
+                if internal_recipients:
+                    outbox.enqueue(
+                        f"{lead['lead_id']}:internal_notification",
+                        **email_handler.build_internal_notification(
+                            nome=nome_usuario,
+                            email=email,
+                            whatsapp=whatsapp,
+                            petshop_name=dados.nome_petshop,
+                            mensagem=mensagem,
+                            fonte="relatorio_financeiro_streamlit",
+                            internal_recipients=internal_recipients,
+                            current_timestamp=lead["created_at"],
+                        ),
+                    )
 
             st.success(
                 "Solicitação enviada com sucesso! Nossa equipe entrará em contato em até 24 horas.",
@@ -0,0 +1,122 @@
+import io
+
+import streamlit as st
+
+from analysis import scenario_sweep
+from .chart_artifacts import CHART_DPI
+from .create_scenario_heatmap import create_scenario_heatmap
+
+# Variações de ticket médio oferecidas na simulação (percentual sobre o atual)
+_VARIACOES_TICKET = [-10, 0, 10, 20, 30]
+
+
+def _figure_png(figura):
+    """Renderiza a figura em PNG e libera seus artistas"""
+    buffer = io.BytesIO()
+    figura.savefig(buffer, format="png", bbox_inches="tight", dpi=CHART_DPI)
+    figura.clear()
+    return buffer.getvalue()
+
+
+@st.fragment
+def show_scenario_sweep(dados):
+    """
+    Exibe a simulação de cenários (equipe, dias, ticket e horário).
+
+    Roda como fragmento: alterar as opções recalcula apenas esta seção.
+
+    Args:
+        dados: Dados do petshop (cenário base)
+    """
+    st.markdown(
+        "<div class='section-header'>🔮 Simular Cenários</div>", unsafe_allow_html=True
+    )
+    st.caption(
+        "E se você contratasse mais um tosador ou abrisse aos domingos? "
+        "Combine as opções abaixo e compare todos os cenários de uma vez."
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        funcionarios = st.multiselect(
+            "Funcionários de banho e tosa",
+            list(range(1, dados.funcionarios_banho_tosa + 4)),
+            default=[
+                dados.funcionarios_banho_tosa,
+                dados.funcionarios_banho_tosa + 1,
+            ],
+            key="cenario_funcionarios",
+        )
+        variacoes_ticket = st.multiselect(
+            "Variação do ticket médio (%)",
+            _VARIACOES_TICKET,
+            default=[0, 10],
+            key="cenario_ticket",
+        )
+    with col2:
+        dias = st.multiselect(
+            "Dias de funcionamento por semana",
+            list(range(1, 8)),
+            default=sorted(
+                {
+                    dados.dias_funcionamento_semana,
+                    min(7, dados.dias_funcionamento_semana + 1),
+                }
+            ),
+            key="cenario_dias",
+        )
+        fechamentos = st.multiselect(
+            "Horário de fechamento",
+            sorted(
+                {f"{hora:02d}:00" for hora in range(16, 23)}
+                | {dados.horario_fechamento}
+            ),
+            default=[dados.horario_fechamento],
+            key="cenario_fechamento",
+        )
+
+    if not (funcionarios and dias and variacoes_ticket and fechamentos):
+        st.info("Selecione ao menos uma opção em cada campo.")
+        return
+
+    try:
+        tabela = scenario_sweep(
+            dados,
+            {
+                "funcionarios_banho_tosa": sorted(funcionarios),
+                "dias_funcionamento_semana": sorted(dias),
+                "ticket_medio": [
+                    round(dados.ticket_medio * (1 + v / 100), 2)
+                    for v in sorted(variacoes_ticket)
+                ],
+                "horario_fechamento": sorted(fechamentos),
+            },
+        )
+    except ValueError as e:
+        st.error(f"Não foi possível simular os cenários: {e}")
+        return
+
+    if len(variacoes_ticket) > 1 or len(fechamentos) > 1:
+        st.caption(
+            "Cada célula mostra a média dos cenários de ticket e horário selecionados."
+        )
+
+    col1, col2 = st.columns(2)
+    for coluna, metrica in (
+        (col1, "lucro_potencial"),
+        (col2, "ponto_equilibrio_atendimentos"),
+    ):
+        with coluna:
+            figura = create_scenario_heatmap(
+                tabela,
+                "funcionarios_banho_tosa",
+                "dias_funcionamento_semana",
+                metrica=metrica,
+            )
+            st.image(_figure_png(figura), use_container_width=True)
+
+    st.dataframe(
+        tabela.sort_values("lucro_potencial", ascending=False),
+        hide_index=True,
+        use_container_width=True,
+    )
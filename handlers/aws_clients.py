@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+from common.tracing import record
+
+# Configuração compartilhada por todos os clientes AWS do processo
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50")),
+    tcp_keepalive=True,
+    connect_timeout=float(os.getenv("AWS_CONNECT_TIMEOUT", "3")),
+    read_timeout=float(os.getenv("AWS_READ_TIMEOUT", "10")),
+    retries={
+        "mode": "adaptive",
+        "max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "5")),
+    },
+)
+
+_lock = threading.Lock()
+_session: Optional[boto3.session.Session] = None
+_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+_resources: Dict[Tuple[str, Optional[str]], Any] = {}
+
+
+def get_session() -> boto3.session.Session:
+    """
+    Retorna a sessão boto3 do processo, criada com as credenciais do ambiente.
+
+    Returns:
+        boto3.session.Session: Sessão compartilhada
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = boto3.session.Session(
+                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                region_name=os.getenv("AWS_REGION"),
+            )
+        return _session
+
+
+def get_client(service: str, region_name: Optional[str] = None) -> Any:
+    """
+    Retorna o cliente boto3 compartilhado para o serviço e região.
+
+    Clientes boto3 são seguros entre threads; todos os handlers do processo
+    reutilizam o mesmo pool de conexões HTTPS.
+
+    Args:
+        service: Nome do serviço AWS (ex: "ses")
+        region_name: Região AWS opcional. Se não fornecida, usa AWS_REGION.
+
+    Returns:
+        Cliente boto3
+    """
+    session = get_session()
+    key = (service, region_name or session.region_name)
+    with _lock:
+        if key not in _clients:
+            _clients[key] = _instrument(
+                session.client(service, region_name=key[1], config=AWS_CLIENT_CONFIG)
+            )
+        return _clients[key]
+
+
+def get_resource(service: str, region_name: Optional[str] = None) -> Any:
+    """
+    Retorna o recurso boto3 compartilhado para o serviço e região.
+
+    Os handlers só usam operações que delegam ao cliente interno (put_item,
+    query, scan...), que é seguro entre threads.
+
+    Args:
+        service: Nome do serviço AWS (ex: "dynamodb")
+        region_name: Região AWS opcional. Se não fornecida, usa AWS_REGION.
+
+    Returns:
+        Recurso boto3
+    """
+    session = get_session()
+    key = (service, region_name or session.region_name)
+    with _lock:
+        if key not in _resources:
+            _resources[key] = session.resource(
+                service, region_name=key[1], config=AWS_CLIENT_CONFIG
+            )
+            _instrument(_resources[key].meta.client)
+        return _resources[key]
+
+
+def _instrument(client: Any) -> Any:
+    """
+    Registra a duração, o tamanho da requisição e os erros de cada chamada do
+    cliente no registro de tracing, como a etapa "<serviço>.<operação>".
+    A duração inclui as novas tentativas feitas pelo botocore.
+    """
+
+    def before_parameter_build(model, context, **kwargs):
+        # Primeiro evento da chamada: inclui validação e serialização
+        context["tracing_stage"] = f"{model.service_model.service_name}.{model.name}"
+        context["tracing_start"] = time.perf_counter()
+
+    def before_call(params, context, **kwargs):
+        context["tracing_size"] = _request_size(params.get("body"))
+
+    def after_call(http_response, context, **kwargs):
+        _finish(context, error=http_response.status_code >= 400)
+
+    def after_call_error(context, **kwargs):
+        _finish(context, error=True)
+
+    def _finish(context, error):
+        inicio = context.pop("tracing_start", None)
+        if inicio is not None:
+            record(
+                context.pop("tracing_stage"),
+                time.perf_counter() - inicio,
+                context.pop("tracing_size", None),
+                error=error,
+            )
+
+    events = client.meta.events
+    events.register("before-parameter-build", before_parameter_build)
+    events.register("before-call", before_call)
+    events.register("after-call", after_call)
+    events.register("after-call-error", after_call_error)
+    return client
+
+
+def _request_size(body: Any) -> Optional[int]:
+    if isinstance(body, (bytes, bytearray, str)):
+        return len(body)
+    if isinstance(body, dict):
+        # Protocolo query (ex: SES): parâmetros ainda não codificados
+        return sum(len(str(k)) + len(str(v)) for k, v in body.items())
+    return None
+
+
+def reset_clients() -> None:
+    """Descarta a sessão e os clientes (ex: após alterar credenciais no ambiente)"""
+    global _session
+    with _lock:
+        _session = None
+        _clients.clear()
+        _resources.clear()
@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from common.enums import DeliveryStatus
+from common.utils import get_timestamp
+from handlers.lead_handler import LeadHandler
+from handlers.ses import BULK_DESTINATIONS_LIMIT, SESHandler
+
+logger = logging.getLogger(__name__)
+
+# Gravações de status (UpdateItem) em paralelo por lote de envio
+CAMPAIGN_STATUS_WRITE_WORKERS = int(os.getenv("CAMPAIGN_STATUS_WRITE_WORKERS", "8"))
+
+
+def default_template_data(lead: Dict[str, Any]) -> Dict[str, Any]:
+    """Variáveis do template de campanha para um lead"""
+    return {
+        "nome": lead.get("name", ""),
+        "petshop_name": lead.get("petshop_name", ""),
+    }
+
+
+class CampaignHandler:
+    """
+    Handler para enviar campanhas de email a todos os leads do Dog's Club Reports
+    """
+
+    def __init__(
+        self,
+        ses_handler: Optional[SESHandler] = None,
+        lead_handler: Optional[LeadHandler] = None,
+    ):
+        """
+        Inicializa o handler de campanhas.
+
+        Args:
+            ses_handler: Handler do SES (padrão: um novo SESHandler)
+            lead_handler: Handler de leads (padrão: um novo LeadHandler)
+        """
+        self.ses_handler = ses_handler or SESHandler()
+        self.lead_handler = lead_handler or LeadHandler()
+        self.source_email = os.getenv("DOGS_CLUB_EMAIL")
+
+    def send_campaign(
+        self,
+        campaign_id: str,
+        template_name: str,
+        template_data: Callable[[Dict[str, Any]], Dict] = default_template_data,
+        default_data: Optional[Dict[str, Any]] = None,
+        configuration_set: Optional[str] = None,
+        max_workers: int = 4,
+        page_size: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Envia um template do SES a todos os leads ativos.
+
+        Os leads são lidos da tabela página a página e enviados em lotes de 50
+        destinos, com até `max_workers` lotes em paralelo. O limitador do
+        SESHandler controla a taxa de envio. O resultado de cada destinatário é
+        gravado no lead em `campaigns[campaign_id]` com UpdateItem, sem
+        regravar o restante do lead; leads que já receberam a campanha são
+        ignorados, então uma campanha interrompida pode ser executada de novo.
+
+        Args:
+            campaign_id: Identificador da campanha
+            template_name: Nome do template no SES
+            template_data: Função que gera as variáveis do template para um lead
+            default_data: Valores padrão das variáveis do template
+            configuration_set: Nome do conjunto de configuração do SES
+            max_workers: Número de lotes enviados em paralelo
+            page_size: Número de itens avaliados por página do scan
+
+        Returns:
+            Dict: Totais de destinatários "sent", "failed" e "skipped"
+        """
+        totals = {"sent": 0, "failed": 0, "skipped": 0}
+        totals_lock = threading.Lock()
+        # Limita os lotes em memória aos que estão sendo enviados ou aguardando
+        in_flight = threading.BoundedSemaphore(max_workers * 2)
+
+        def count(key: str, value: int) -> None:
+            with totals_lock:
+                totals[key] += value
+
+        def pending_leads() -> Iterator[Dict[str, Any]]:
+            for lead in self.lead_handler.iter_leads(page_size=page_size):
+                campaign = lead.get("campaigns", {}).get(campaign_id, {})
+                if not lead.get("email") or (
+                    campaign.get("status") == DeliveryStatus.SENT.value
+                ):
+                    count("skipped", 1)
+                    continue
+                yield lead
+
+        def send_chunk(leads: List[Dict[str, Any]]) -> None:
+            try:
+                sent, failed = self._send_chunk(
+                    campaign_id,
+                    template_name,
+                    leads,
+                    template_data,
+                    default_data,
+                    configuration_set,
+                )
+                count("sent", sent)
+                count("failed", failed)
+            except Exception as e:
+                logger.error(f"Erro ao enviar lote da campanha {campaign_id}: {e}")
+                count("failed", len(leads))
+            finally:
+                in_flight.release()
+
+        leads = pending_leads()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="campaign"
+        ) as executor:
+            while True:
+                chunk = list(islice(leads, BULK_DESTINATIONS_LIMIT))
+                if not chunk:
+                    break
+                in_flight.acquire()
+                executor.submit(send_chunk, chunk)
+
+        logger.info(
+            f"Campanha {campaign_id}: {totals['sent']} enviados, "
+            f"{totals['failed']} falhas, {totals['skipped']} ignorados"
+        )
+        return totals
+
+    def _send_chunk(
+        self,
+        campaign_id: str,
+        template_name: str,
+        leads: List[Dict[str, Any]],
+        template_data: Callable[[Dict[str, Any]], Dict],
+        default_data: Optional[Dict[str, Any]],
+        configuration_set: Optional[str],
+    ) -> Tuple[int, int]:
+        """Envia um lote de até 50 leads e grava o resultado de cada um"""
+        destinations = [
+            {
+                "Destination": {"ToAddresses": [lead["email"]]},
+                "ReplacementTemplateData": json.dumps(
+                    template_data(lead), ensure_ascii=False, default=str
+                ),
+            }
+            for lead in leads
+        ]
+
+        try:
+            statuses = self.ses_handler.send_bulk_templated_email(
+                source=self.source_email,
+                template_name=template_name,
+                destinations=destinations,
+                configuration_set=configuration_set,
+                default_template_data=default_data,
+            )["Status"]
+        except Exception as e:
+            statuses = [{"Status": "Failed", "Error": str(e)}] * len(leads)
+
+        sent_at = get_timestamp()
+        results = []
+        sent = 0
+        for lead, status in zip(leads, statuses):
+            success = status.get("Status") == "Success"
+            sent += success
+            result = {
+                "status": (
+                    DeliveryStatus.SENT.value
+                    if success
+                    else DeliveryStatus.FAILED.value
+                ),
+                "sent_at": sent_at,
+            }
+            if status.get("MessageId"):
+                result["message_id"] = status["MessageId"]
+            if not success:
+                result["error"] = status.get("Error") or status.get("Status")
+            results.append((lead, result))
+
+        # Apenas campaigns[campaign_id] é gravado (UpdateItem): o lead lido no scan
+        # pode estar desatualizado e não deve sobrescrever alterações posteriores
+        dynamodb_handler = self.lead_handler.dynamodb_handler
+        key_names = dynamodb_handler._key_names()
+
+        def write_result(lead_result: Tuple[Dict[str, Any], Dict[str, Any]]) -> None:
+            lead, result = lead_result
+            key = {name: lead[name] for name in key_names}
+            try:
+                dynamodb_handler.set_map_entry(key, "campaigns", campaign_id, result)
+            except Exception as e:
+                logger.error(
+                    f"Falha ao gravar status da campanha {campaign_id} "
+                    f"para {key}: {e}"
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=CAMPAIGN_STATUS_WRITE_WORKERS,
+            thread_name_prefix="campaign-status",
+        ) as executor:
+            list(executor.map(write_result, results))
+
+        return sent, len(leads) - sent
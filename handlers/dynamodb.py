@@ -1,34 +1,36 @@
-import boto3
 from common.utils import get_timestamp
 from typing import Dict, Any
 from boto3.dynamodb.conditions import Key, Attr
-from boto3.dynamodb.types import TypeDeserializer
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
+import queue
+import random
+import threading
+import time
 
 from common.enums import EntityStatus, FilterOperator
-from typing import Optional, Dict, Union, List, Tuple
+from handlers.aws_clients import get_resource
+from typing import Optional, Dict, Union, List, Tuple, Iterator, Callable
+
+# Limites de itens por chamada impostos pelo DynamoDB
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
 
 
 class DynamoDBHandler:
-    def __init__(self, table: str) -> None:
+    def __init__(self, table: str, dynamodb: Optional[Any] = None) -> None:
         """
         Inicializa o handler do DynamoDB.
 
         Args:
             table: Nome da tabela do DynamoDB
+            dynamodb: Recurso DynamoDB opcional (ex: InMemoryDynamoDB em testes)
         """
-        # Obter credenciais AWS das variáveis de ambiente
-        aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
-        aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        region_name = os.getenv("AWS_REGION")
-
-        # Configurar o recurso DynamoDB com as credenciais e região
-        self.dynamodb = boto3.resource(
-            "dynamodb",
-            region_name=region_name,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-        )
+        # Recurso compartilhado pelo processo (pool de conexões reutilizado)
+        self.dynamodb = dynamodb if dynamodb is not None else get_resource("dynamodb")
         self.table = self.dynamodb.Table(table)
 
     def put_item(self, item: Dict):
@@ -66,6 +68,49 @@ class DynamoDBHandler:
         Returns:
             Dict: Resposta do DynamoDB
         """
+        key_condition_expression, filter_expression = self._build_query_expressions(
+            partition_key, filter_conditions
+        )
+
+        # Preparar parâmetros da consulta
+        query_params = {
+            "IndexName": index_name,
+            "KeyConditionExpression": key_condition_expression,
+        }
+
+        # Adicionar expressão de filtro se existir
+        if filter_expression is not None:
+            query_params["FilterExpression"] = filter_expression
+
+        # Adicionar limit se fornecido
+        if limit is not None:
+            query_params["Limit"] = limit
+
+        # Adicionar chave de início exclusiva para paginação
+        if exclusive_start_key is not None:
+            query_params["ExclusiveStartKey"] = exclusive_start_key
+
+        # Executar a consulta
+        response = self.table.query(**query_params)
+        return response
+
+    def _build_query_expressions(
+        self,
+        partition_key: Dict[str, Any],
+        filter_conditions: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Tuple[Any, Optional[Attr]]:
+        """
+        Constrói as expressões de chave e de filtro de uma query
+
+        Args:
+            partition_key: Dicionário com chave de partição no formato:
+                        {"attribute_name": value}
+            filter_conditions: Dicionário com condições de filtro no formato:
+                            {"attribute_name": {"operator": "between", "value": [min, max]}}
+
+        Returns:
+            Tuple: Expressão de condição de chave e expressão de filtro (ou None)
+        """
         if not partition_key:
             raise ValueError("PartitionKey is required")
 
@@ -94,27 +139,7 @@ class DynamoDBHandler:
                 else:
                     filter_expression &= current_expr
 
-        # Preparar parâmetros da consulta
-        query_params = {
-            "IndexName": index_name,
-            "KeyConditionExpression": key_condition_expression,
-        }
-
-        # Adicionar expressão de filtro se existir
-        if filter_expression is not None:
-            query_params["FilterExpression"] = filter_expression
-
-        # Adicionar limit se fornecido
-        if limit is not None:
-            query_params["Limit"] = limit
-
-        # Adicionar chave de início exclusiva para paginação
-        if exclusive_start_key is not None:
-            query_params["ExclusiveStartKey"] = exclusive_start_key
-
-        # Executar a consulta
-        response = self.table.query(**query_params)
-        return response
+        return key_condition_expression, filter_expression
 
     def query_by_partition_key(self, partition_key: str, value: str):
         response = self.table.query(KeyConditionExpression=Key(partition_key).eq(value))
@@ -137,6 +162,201 @@ class DynamoDBHandler:
         )
         return response
 
+    def put_items(
+        self,
+        items: List[Dict],
+        max_retries: int = 5,
+        base_delay: float = 0.05,
+        max_delay: float = 2.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Grava vários itens com BatchWriteItem, em lotes de 25.
+
+        Itens devolvidos em UnprocessedItems são reenviados com backoff
+        exponencial com jitter. Itens com a mesma chave são gravados uma única
+        vez (prevalece o último), como no `batch_writer` do boto3.
+
+        Args:
+            items: Itens a gravar
+            max_retries: Número máximo de reenvios de itens não processados
+            base_delay: Espera inicial do backoff em segundos
+            max_delay: Espera máxima do backoff em segundos
+
+        Returns:
+            List[Dict]: Um resultado por item, na ordem de entrada, com as chaves
+                "key", "success" e "error"
+        """
+        key_names = self._key_names()
+        requests = {}
+        for item in items:
+            requests[self._key_tuple(item, key_names)] = {"PutRequest": {"Item": item}}
+
+        errors = self._run_batches(
+            list(requests.items()),
+            BATCH_WRITE_LIMIT,
+            lambda chunk: self._write_batch(chunk, key_names),
+            max_retries,
+            base_delay,
+            max_delay,
+        )
+
+        results = []
+        for item in items:
+            key = self._key_tuple(item, key_names)
+            error = errors.get(key)
+            results.append(
+                {
+                    "key": dict(zip(key_names, key)),
+                    "success": error is None,
+                    "error": error,
+                }
+            )
+        return results
+
+    def get_items(
+        self,
+        keys: List[Dict],
+        projection: Optional[List[str]] = None,
+        max_retries: int = 5,
+        base_delay: float = 0.05,
+        max_delay: float = 2.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca vários itens pela chave com BatchGetItem, em lotes de 100.
+
+        Chaves devolvidas em UnprocessedKeys são buscadas de novo com backoff
+        exponencial com jitter.
+
+        Args:
+            keys: Chaves dos itens (partição e, se houver, ordenação)
+            projection: Lista de atributos a retornar (as chaves são sempre incluídas)
+            max_retries: Número máximo de novas tentativas para chaves não processadas
+            base_delay: Espera inicial do backoff em segundos
+            max_delay: Espera máxima do backoff em segundos
+
+        Returns:
+            List[Dict]: Um resultado por chave, na ordem de entrada, com as chaves
+                "key", "item" (None se não encontrado), "success" e "error"
+        """
+        key_names = self._key_names()
+        table_request = {}
+        if projection:
+            attributes = list(dict.fromkeys(key_names + list(projection)))
+            table_request["ProjectionExpression"] = ", ".join(
+                f"#proj{i}" for i in range(len(attributes))
+            )
+            table_request["ExpressionAttributeNames"] = {
+                f"#proj{i}": attribute for i, attribute in enumerate(attributes)
+            }
+
+        unique_keys = {self._key_tuple(key, key_names): key for key in keys}
+        found: Dict[Tuple, Dict] = {}
+        errors = self._run_batches(
+            list(unique_keys.items()),
+            BATCH_GET_LIMIT,
+            lambda chunk: self._get_batch(chunk, key_names, table_request, found),
+            max_retries,
+            base_delay,
+            max_delay,
+        )
+
+        results = []
+        for key in keys:
+            key_tuple = self._key_tuple(key, key_names)
+            error = errors.get(key_tuple)
+            results.append(
+                {
+                    "key": key,
+                    "item": found.get(key_tuple),
+                    "success": error is None,
+                    "error": error,
+                }
+            )
+        return results
+
+    def _run_batches(
+        self,
+        requests: List[Tuple[Tuple, Any]],
+        chunk_size: int,
+        send: Callable[[List[Tuple[Tuple, Any]]], List[Tuple[Tuple, Any]]],
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+    ) -> Dict[Tuple, str]:
+        """
+        Envia as requisições em lotes e reenvia as não processadas com backoff.
+
+        `send` recebe um lote de pares (chave, requisição) e devolve os pares que
+        o DynamoDB não processou.
+
+        Returns:
+            Dict[Tuple, str]: Mensagem de erro por chave que falhou
+        """
+        errors: Dict[Tuple, str] = {}
+        for start in range(0, len(requests), chunk_size):
+            pending = requests[start : start + chunk_size]
+            attempt = 0
+            while pending:
+                try:
+                    pending = send(pending)
+                except Exception as e:
+                    for key, _ in pending:
+                        errors[key] = str(e)
+                    break
+
+                if not pending:
+                    break
+                if attempt >= max_retries:
+                    for key, _ in pending:
+                        errors[key] = f"Unprocessed after {max_retries} retries"
+                    break
+
+                # Backoff exponencial com jitter completo
+                time.sleep(random.uniform(0, min(max_delay, base_delay * 2**attempt)))
+                attempt += 1
+        return errors
+
+    def _write_batch(
+        self, chunk: List[Tuple[Tuple, Dict]], key_names: List[str]
+    ) -> List[Tuple[Tuple, Dict]]:
+        response = self.dynamodb.batch_write_item(
+            RequestItems={self.table.name: [request for _, request in chunk]}
+        )
+        unprocessed = response.get("UnprocessedItems", {}).get(self.table.name, [])
+        return [
+            (self._key_tuple(request["PutRequest"]["Item"], key_names), request)
+            for request in unprocessed
+        ]
+
+    def _get_batch(
+        self,
+        chunk: List[Tuple[Tuple, Dict]],
+        key_names: List[str],
+        table_request: Dict,
+        found: Dict[Tuple, Dict],
+    ) -> List[Tuple[Tuple, Dict]]:
+        response = self.dynamodb.batch_get_item(
+            RequestItems={
+                self.table.name: dict(table_request, Keys=[key for _, key in chunk])
+            }
+        )
+        for item in response.get("Responses", {}).get(self.table.name, []):
+            found[self._key_tuple(item, key_names)] = item
+
+        unprocessed = response.get("UnprocessedKeys", {}).get(self.table.name, {})
+        return [
+            (self._key_tuple(key, key_names), key)
+            for key in unprocessed.get("Keys", [])
+        ]
+
+    def _key_names(self) -> List[str]:
+        """Nomes dos atributos de chave da tabela (partição primeiro)"""
+        schema = sorted(self.table.key_schema, key=lambda k: k["KeyType"] != "HASH")
+        return [k["AttributeName"] for k in schema]
+
+    def _key_tuple(self, item: Dict, key_names: List[str]) -> Tuple:
+        return tuple(item[name] for name in key_names)
+
     def delete_item(self, key: Dict, force_delete: bool = True):
         if force_delete:
             response = self.table.delete_item(Key=key)
@@ -213,6 +433,60 @@ class DynamoDBHandler:
         except Exception as e:
             raise Exception(f"Failed to update item: {str(e)}")
 
+    def set_map_entry(self, key: Dict, attribute: str, entry: str, value: Any):
+        """
+        Grava item[attribute][entry] = value sem reescrever o restante do item.
+
+        Usa UpdateItem condicionado à existência do item, então alterações
+        feitas por outros processos nos demais atributos são preservadas.
+        Se o mapa ainda não existir, ele é criado apenas com essa entrada.
+
+        Args:
+            key: Chave primária do item
+            attribute: Nome do atributo do tipo mapa (ex: "campaigns")
+            entry: Chave dentro do mapa (ex: o ID da campanha)
+            value: Valor a gravar
+
+        Raises:
+            ClientError: ConditionalCheckFailedException se o item não existir
+        """
+        key_names = {f"#k{i}": name for i, name in enumerate(key)}
+        item_exists = " AND ".join(f"attribute_exists({k})" for k in key_names)
+
+        try:
+            return self.table.update_item(
+                Key=key,
+                UpdateExpression="SET #a.#e = :v",
+                ConditionExpression=item_exists,
+                ExpressionAttributeNames={"#a": attribute, "#e": entry, **key_names},
+                ExpressionAttributeValues={":v": value},
+            )
+        except ClientError as e:
+            # O caminho #a.#e é inválido quando o mapa ainda não existe
+            if e.response["Error"]["Code"] != "ValidationException":
+                raise
+
+        try:
+            return self.table.update_item(
+                Key=key,
+                UpdateExpression="SET #a = :m",
+                ConditionExpression=f"{item_exists} AND attribute_not_exists(#a)",
+                ExpressionAttributeNames={"#a": attribute, **key_names},
+                ExpressionAttributeValues={":m": {entry: value}},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+
+        # Outro processo criou o mapa entre as duas chamadas (ou o item sumiu)
+        return self.table.update_item(
+            Key=key,
+            UpdateExpression="SET #a.#e = :v",
+            ConditionExpression=item_exists,
+            ExpressionAttributeNames={"#a": attribute, "#e": entry, **key_names},
+            ExpressionAttributeValues={":v": value},
+        )
+
     def scan(
         self,
         filter_expression: Optional[Attr] = None,
@@ -246,6 +520,358 @@ class DynamoDBHandler:
         except Exception as e:
             raise Exception(f"Failed to scan table: {str(e)}")
 
+    def iter_scan(
+        self,
+        filter_expression: Optional[Attr] = None,
+        expression_attribute_values: Optional[Dict] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        max_items: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Dict]:
+        """
+        Percorre todos os itens da tabela, seguindo o LastEvaluatedKey sob demanda
+
+        Apenas uma página fica em memória por vez; interromper a iteração
+        interrompe também as chamadas ao DynamoDB.
+
+        Args:
+            filter_expression: Expressão de filtro do DynamoDB
+            expression_attribute_values: Valores para substituição na expressão de filtro
+            page_size: Número de itens avaliados por página (Limit do DynamoDB)
+            projection: Lista de atributos a retornar (ProjectionExpression)
+            max_items: Número máximo de itens a retornar no total
+            kwargs: Parâmetros adicionais para a busca
+
+        Returns:
+            Iterator[Dict]: Itens da tabela
+        """
+        scan_params = {}
+
+        if filter_expression:
+            scan_params["FilterExpression"] = filter_expression
+
+        if expression_attribute_values:
+            scan_params["ExpressionAttributeValues"] = expression_attribute_values
+
+        scan_params.update(kwargs)
+
+        return self._iter_items(
+            self.table.scan, scan_params, page_size, projection, max_items
+        )
+
+    def iter_query(
+        self,
+        partition_key: Dict[str, Any],
+        index_name: Optional[str] = None,
+        filter_conditions: Optional[Dict[str, Dict[str, Any]]] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        max_items: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Dict]:
+        """
+        Percorre todos os itens de uma query (na tabela ou em um GSI), página a página
+
+        Args:
+            partition_key: Dicionário com chave de partição no formato:
+                        {"attribute_name": value}
+            index_name: Nome do índice GSI (opcional)
+            filter_conditions: Dicionário com condições de filtro no mesmo formato
+                            de query_using_gsi
+            page_size: Número de itens avaliados por página (Limit do DynamoDB)
+            projection: Lista de atributos a retornar (ProjectionExpression)
+            max_items: Número máximo de itens a retornar no total
+            kwargs: Parâmetros adicionais para a query
+
+        Returns:
+            Iterator[Dict]: Itens encontrados
+        """
+        key_condition_expression, filter_expression = self._build_query_expressions(
+            partition_key, filter_conditions
+        )
+
+        query_params = {"KeyConditionExpression": key_condition_expression}
+
+        if index_name:
+            query_params["IndexName"] = index_name
+
+        if filter_expression is not None:
+            query_params["FilterExpression"] = filter_expression
+
+        query_params.update(kwargs)
+
+        return self._iter_items(
+            self.table.query, query_params, page_size, projection, max_items
+        )
+
+    def parallel_scan(
+        self,
+        total_segments: int = 4,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        filter_expression: Optional[Attr] = None,
+        expression_attribute_values: Optional[Dict] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        **kwargs,
+    ) -> Iterator[Dict]:
+        """
+        Percorre a tabela inteira com um scan paralelo (Segment/TotalSegments)
+
+        Cada segmento é lido por uma thread e as páginas são combinadas em um
+        único iterador, sem ordem garantida entre segmentos. Com `checkpoint_path`,
+        o LastEvaluatedKey de cada segmento é gravado depois que os itens da
+        página foram consumidos, de forma que uma exportação interrompida retoma
+        de onde parou (a página em andamento é lida de novo, então itens podem
+        se repetir). O arquivo é removido quando todos os segmentos terminam.
+
+        Args:
+            total_segments: Número de segmentos do scan
+            max_workers: Número de threads (padrão: total_segments)
+            checkpoint_path: Caminho do arquivo JSON de checkpoint (opcional)
+            filter_expression: Expressão de filtro do DynamoDB
+            expression_attribute_values: Valores para substituição na expressão de filtro
+            page_size: Número de itens avaliados por página (Limit do DynamoDB)
+            projection: Lista de atributos a retornar (ProjectionExpression)
+            kwargs: Parâmetros adicionais para a busca
+
+        Returns:
+            Iterator[Dict]: Itens da tabela
+        """
+        if total_segments < 1:
+            raise ValueError("total_segments must be at least 1")
+
+        checkpoint = self._load_scan_checkpoint(checkpoint_path, total_segments)
+        pending_segments = [
+            segment
+            for segment in range(total_segments)
+            if not checkpoint[segment]["done"]
+        ]
+
+        scan_params = {"TotalSegments": total_segments}
+        if filter_expression:
+            scan_params["FilterExpression"] = filter_expression
+        if expression_attribute_values:
+            scan_params["ExpressionAttributeValues"] = expression_attribute_values
+        scan_params.update(kwargs)
+
+        pages: "queue.Queue" = queue.Queue(maxsize=total_segments * 2)
+        stop = threading.Event()
+
+        def put_page(page) -> bool:
+            # Não bloquear para sempre se o consumidor parar de iterar
+            while not stop.is_set():
+                try:
+                    pages.put(page, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def scan_segment(segment: int) -> None:
+            params = dict(scan_params, Segment=segment)
+            if checkpoint[segment]["last_key"]:
+                params["ExclusiveStartKey"] = checkpoint[segment]["last_key"]
+
+            try:
+                for response in self.iter_pages(
+                    self.table.scan, params, page_size, projection
+                ):
+                    page = (
+                        segment,
+                        response.get("Items", []),
+                        response.get("LastEvaluatedKey"),
+                    )
+                    if not put_page(page):
+                        return
+            except Exception as e:
+                put_page((segment, e, None))
+
+        def generate() -> Iterator[Dict]:
+            if not pending_segments:
+                self._remove_scan_checkpoint(checkpoint_path)
+                return
+
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers or len(pending_segments),
+                thread_name_prefix="dynamodb-scan",
+            )
+            try:
+                for segment in pending_segments:
+                    executor.submit(scan_segment, segment)
+
+                remaining = len(pending_segments)
+                while remaining:
+                    segment, items, last_key = pages.get()
+                    if isinstance(items, Exception):
+                        raise Exception(
+                            f"Failed to scan segment {segment}: {str(items)}"
+                        )
+
+                    yield from items
+
+                    checkpoint[segment] = {
+                        "last_key": last_key,
+                        "done": not last_key,
+                    }
+                    self._save_scan_checkpoint(
+                        checkpoint_path, total_segments, checkpoint
+                    )
+                    if not last_key:
+                        remaining -= 1
+
+                self._remove_scan_checkpoint(checkpoint_path)
+            finally:
+                stop.set()
+                executor.shutdown(wait=False)
+
+        return generate()
+
+    def _load_scan_checkpoint(
+        self, checkpoint_path: Optional[str], total_segments: int
+    ) -> Dict[int, Dict]:
+        """Carrega o estado de cada segmento do arquivo de checkpoint, se existir"""
+        checkpoint = {
+            segment: {"last_key": None, "done": False}
+            for segment in range(total_segments)
+        }
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return checkpoint
+
+        with open(checkpoint_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        if data.get("total_segments") != total_segments:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} was created with "
+                f"{data.get('total_segments')} segments, not {total_segments}"
+            )
+
+        deserializer = TypeDeserializer()
+        for segment, state in data["segments"].items():
+            last_key = state.get("last_key")
+            checkpoint[int(segment)] = {
+                "last_key": (
+                    {k: deserializer.deserialize(v) for k, v in last_key.items()}
+                    if last_key
+                    else None
+                ),
+                "done": state.get("done", False),
+            }
+        return checkpoint
+
+    def _save_scan_checkpoint(
+        self,
+        checkpoint_path: Optional[str],
+        total_segments: int,
+        checkpoint: Dict[int, Dict],
+    ) -> None:
+        """Grava o checkpoint de forma atômica (chaves no formato tipado do DynamoDB)"""
+        if not checkpoint_path:
+            return
+
+        serializer = TypeSerializer()
+        data = {
+            "total_segments": total_segments,
+            "segments": {
+                str(segment): {
+                    "last_key": (
+                        {
+                            k: serializer.serialize(v)
+                            for k, v in state["last_key"].items()
+                        }
+                        if state["last_key"]
+                        else None
+                    ),
+                    "done": state["done"],
+                }
+                for segment, state in checkpoint.items()
+            },
+        }
+
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, checkpoint_path)
+
+    def _remove_scan_checkpoint(self, checkpoint_path: Optional[str]) -> None:
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+    def iter_pages(
+        self,
+        operation: Callable[..., Dict],
+        params: Dict,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Executa uma operação paginada (scan ou query) e retorna as respostas página a página
+
+        Args:
+            operation: Método da tabela (ex: self.table.scan)
+            params: Parâmetros da operação; ExclusiveStartKey retoma de um ponto específico
+            page_size: Número de itens avaliados por página (Limit do DynamoDB)
+            projection: Lista de atributos a retornar (ProjectionExpression)
+
+        Returns:
+            Iterator[Dict]: Respostas do DynamoDB, cada uma com Items e LastEvaluatedKey
+        """
+        params = dict(params)
+
+        if page_size is not None:
+            params["Limit"] = page_size
+
+        if projection:
+            self._apply_projection(params, projection)
+
+        while True:
+            response = operation(**params)
+            yield response
+
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                return
+
+            params["ExclusiveStartKey"] = last_evaluated_key
+
+    def _iter_items(
+        self,
+        operation: Callable[..., Dict],
+        params: Dict,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """Achata as páginas de iter_pages em itens, respeitando max_items"""
+        if max_items is not None and max_items <= 0:
+            return
+
+        returned = 0
+        for response in self.iter_pages(operation, params, page_size, projection):
+            for item in response.get("Items", []):
+                yield item
+                returned += 1
+                if max_items is not None and returned >= max_items:
+                    return
+
+    def _apply_projection(self, params: Dict, projection: List[str]) -> None:
+        """
+        Adiciona a ProjectionExpression usando placeholders, evitando conflito
+        com palavras reservadas do DynamoDB (ex: name, source, status)
+        """
+        attribute_names = dict(params.get("ExpressionAttributeNames", {}))
+        placeholders = []
+
+        for index, attr_name in enumerate(projection):
+            placeholder = f"#proj{index}"
+            attribute_names[placeholder] = attr_name
+            placeholders.append(placeholder)
+
+        params["ProjectionExpression"] = ", ".join(placeholders)
+        params["ExpressionAttributeNames"] = attribute_names
+
     def _build_filter_expression(
         self, attr_name: str, operator: str, value: Union[str, int, float, List, Tuple]
     ) -> Attr:
@@ -0,0 +1,291 @@
+import copy
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import AttributeBase
+from botocore.exceptions import ClientError
+
+
+class InMemoryTable:
+    """
+    Tabela DynamoDB em memória para testes e desenvolvimento local.
+
+    Implementa o subconjunto da API de `boto3.resource("dynamodb").Table` usado
+    pelo DynamoDBHandler: put_item, get_item, delete_item, update_item (apenas
+    SET), scan (com Segment/TotalSegments, Limit e ExclusiveStartKey) e query
+    por chave.
+    As operações em lote ficam em InMemoryDynamoDB, como no boto3.
+    """
+
+    def __init__(self, name: str, partition_key: str, sort_key: Optional[str] = None):
+        """
+        Inicializa a tabela.
+
+        Args:
+            name: Nome da tabela
+            partition_key: Nome do atributo de partição
+            sort_key: Nome do atributo de ordenação (opcional)
+        """
+        self.name = name
+        self.partition_key = partition_key
+        self.sort_key = sort_key
+        self._items: Dict[Tuple, Dict] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def key_schema(self) -> List[Dict[str, str]]:
+        schema = [{"AttributeName": self.partition_key, "KeyType": "HASH"}]
+        if self.sort_key:
+            schema.append({"AttributeName": self.sort_key, "KeyType": "RANGE"})
+        return schema
+
+    def put_item(self, Item: Dict, **kwargs) -> Dict:
+        with self._lock:
+            self._items[self._key_of(Item)] = copy.deepcopy(Item)
+        return {}
+
+    def get_item(self, Key: Dict, **kwargs) -> Dict:
+        with self._lock:
+            item = self._items.get(self._key_of(Key))
+        return {"Item": copy.deepcopy(item)} if item is not None else {}
+
+    def delete_item(self, Key: Dict, **kwargs) -> Dict:
+        with self._lock:
+            self._items.pop(self._key_of(Key), None)
+        return {}
+
+    def update_item(self, Key: Dict, UpdateExpression: str, **params) -> Dict:
+        if not UpdateExpression.startswith("SET "):
+            raise NotImplementedError(f"Unsupported update: {UpdateExpression}")
+        names = params.get("ExpressionAttributeNames", {})
+        values = params.get("ExpressionAttributeValues", {})
+        condition = params.get("ConditionExpression")
+
+        with self._lock:
+            key = self._key_of(Key)
+            current = self._items.get(key)
+            if condition is not None and not _evaluate(
+                condition, current or {}, params
+            ):
+                raise _client_error(
+                    "ConditionalCheckFailedException", "The conditional request failed"
+                )
+
+            # Como no DynamoDB, sem condição o update cria o item
+            item = copy.deepcopy(current) if current is not None else dict(Key)
+            updated = {}
+            for assignment in UpdateExpression[4:].split(","):
+                path, placeholder = (part.strip() for part in assignment.split("="))
+                parts = [names.get(part, part) for part in path.split(".")]
+                target = item
+                for part in parts[:-1]:
+                    if not isinstance(target.get(part), dict):
+                        raise _client_error(
+                            "ValidationException",
+                            "The document path provided in the update expression "
+                            "is invalid for update",
+                        )
+                    target = target[part]
+                target[parts[-1]] = copy.deepcopy(values[placeholder])
+                updated[parts[0]] = item[parts[0]]
+            self._items[key] = item
+        return {"Attributes": copy.deepcopy(updated)}
+
+    def scan(self, **params) -> Dict:
+        segment = params.get("Segment")
+        total_segments = params.get("TotalSegments")
+
+        with self._lock:
+            items = [
+                item
+                for key, item in self._items.items()
+                if segment is None
+                or zlib.crc32(str(key[0]).encode("utf-8")) % total_segments == segment
+            ]
+
+        return self._page(items, params)
+
+    def query(self, **params) -> Dict:
+        key_condition = params["KeyConditionExpression"]
+        with self._lock:
+            items = [
+                item
+                for item in self._items.values()
+                if _evaluate(key_condition, item, params)
+            ]
+        return self._page(items, params)
+
+    def _key_of(self, item: Dict) -> Tuple:
+        return (
+            item[self.partition_key],
+            item.get(self.sort_key) if self.sort_key else None,
+        )
+
+    def _page(self, items: List[Dict], params: Dict) -> Dict:
+        """Aplica paginação, filtro e projeção como o DynamoDB faz"""
+        start = 0
+        if params.get("ExclusiveStartKey"):
+            start_key = self._key_of(params["ExclusiveStartKey"])
+            keys = [self._key_of(item) for item in items]
+            start = keys.index(start_key) + 1 if start_key in keys else len(items)
+
+        limit = params.get("Limit")
+        end = min(start + limit, len(items)) if limit else len(items)
+        evaluated = items[start:end]
+
+        # O Limit conta itens avaliados, antes do filtro
+        filter_expression = params.get("FilterExpression")
+        if filter_expression is not None:
+            evaluated = [
+                item for item in evaluated if _evaluate(filter_expression, item, params)
+            ]
+
+        response = {
+            "Items": [self._project(item, params) for item in evaluated],
+            "Count": len(evaluated),
+            "ScannedCount": end - start,
+        }
+        if end < len(items):
+            last = items[end - 1]
+            response["LastEvaluatedKey"] = {
+                name: last[name] for name in (self.partition_key, self.sort_key) if name
+            }
+        return response
+
+    def _project(self, item: Dict, params: Dict) -> Dict:
+        projection = params.get("ProjectionExpression")
+        if not projection:
+            return copy.deepcopy(item)
+
+        names = params.get("ExpressionAttributeNames", {})
+        attributes = [names.get(p.strip(), p.strip()) for p in projection.split(",")]
+        return {a: copy.deepcopy(item[a]) for a in attributes if a in item}
+
+
+class InMemoryDynamoDB:
+    """
+    Substituto em memória de `boto3.resource("dynamodb")`.
+
+    Exemplo:
+        dynamodb = InMemoryDynamoDB({"leads": ("lead_id", None)})
+        handler = DynamoDBHandler("leads", dynamodb=dynamodb)
+    """
+
+    def __init__(
+        self, key_schema: Optional[Dict[str, Tuple[str, Optional[str]]]] = None
+    ) -> None:
+        """
+        Inicializa o recurso.
+
+        Args:
+            key_schema: Mapa tabela -> (chave de partição, chave de ordenação).
+                Tabelas não listadas usam "id" como chave de partição.
+        """
+        self.key_schema = key_schema or {}
+        self._tables: Dict[str, InMemoryTable] = {}
+        self._lock = threading.Lock()
+
+    def batch_write_item(self, RequestItems: Dict, **kwargs) -> Dict:
+        for name, requests in RequestItems.items():
+            table = self.Table(name)
+            for request in requests:
+                if "PutRequest" in request:
+                    table.put_item(Item=request["PutRequest"]["Item"])
+                else:
+                    table.delete_item(Key=request["DeleteRequest"]["Key"])
+        return {"UnprocessedItems": {}}
+
+    def batch_get_item(self, RequestItems: Dict, **kwargs) -> Dict:
+        responses = {}
+        for name, request in RequestItems.items():
+            table = self.Table(name)
+            items = [table.get_item(Key=key).get("Item") for key in request["Keys"]]
+            responses[name] = [
+                table._project(item, request) for item in items if item is not None
+            ]
+        return {"Responses": responses, "UnprocessedKeys": {}}
+
+    def Table(self, name: str) -> InMemoryTable:
+        with self._lock:
+            if name not in self._tables:
+                partition_key, sort_key = self.key_schema.get(name, ("id", None))
+                self._tables[name] = InMemoryTable(name, partition_key, sort_key)
+            return self._tables[name]
+
+
+def _evaluate(condition: Any, item: Dict, params: Dict) -> bool:
+    """Avalia uma condição do boto3 ou uma expressão simples ("a = :v AND ...")"""
+    if isinstance(condition, str):
+        values = params.get("ExpressionAttributeValues", {})
+        names = params.get("ExpressionAttributeNames", {})
+        for clause in condition.split(" AND "):
+            clause = clause.strip()
+            if clause.endswith(")"):
+                function, attribute = clause[:-1].split("(", 1)
+                exists = names.get(attribute, attribute) in item
+                if function not in ("attribute_exists", "attribute_not_exists"):
+                    raise NotImplementedError(f"Unsupported function: {function}")
+                if exists != (function == "attribute_exists"):
+                    return False
+                continue
+            attribute, operator, placeholder = clause.split(" ", 2)
+            if operator != "=":
+                raise NotImplementedError(f"Unsupported operator: {operator}")
+            attribute = names.get(attribute, attribute)
+            if item.get(attribute) != values[placeholder.strip()]:
+                return False
+        return True
+
+    expression = condition.get_expression()
+    operator = expression["operator"]
+    operands = expression["values"]
+
+    if operator == "AND":
+        return all(_evaluate(op, item, params) for op in operands)
+    if operator == "OR":
+        return any(_evaluate(op, item, params) for op in operands)
+    if operator == "NOT":
+        return not _evaluate(operands[0], item, params)
+
+    name = operands[0].name
+    if operator == "attribute_exists":
+        return name in item
+    if operator == "attribute_not_exists":
+        return name not in item
+    if name not in item:
+        return False
+
+    value = item[name]
+    arguments = [
+        item.get(op.name) if isinstance(op, AttributeBase) else op
+        for op in operands[1:]
+    ]
+
+    if operator == "=":
+        return value == arguments[0]
+    if operator == "<>":
+        return value != arguments[0]
+    if operator == "<":
+        return value < arguments[0]
+    if operator == "<=":
+        return value <= arguments[0]
+    if operator == ">":
+        return value > arguments[0]
+    if operator == ">=":
+        return value >= arguments[0]
+    if operator == "BETWEEN":
+        return arguments[0] <= value <= arguments[1]
+    if operator == "IN":
+        return value in arguments[0]
+    if operator == "begins_with":
+        return str(value).startswith(arguments[0])
+    if operator == "contains":
+        return arguments[0] in value
+
+    raise NotImplementedError(f"Unsupported operator: {operator}")
+
+
+def _client_error(code: str, message: str) -> ClientError:
+    """Erro no mesmo formato que o boto3 levanta para o UpdateItem"""
+    return ClientError({"Error": {"Code": code, "Message": message}}, "UpdateItem")
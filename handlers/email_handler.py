@@ -1,10 +1,11 @@
+import hashlib
 import os
 import time
 from typing import Dict, Any, Optional, List, Union, BinaryIO
 from datetime import datetime
 import pytz
 from handlers.ses import SESHandler
-from utils import load_template, replace_template_variables, format_currency
+from utils import render_template, format_currency
 from common.enums import EmailContentType
 from io import BytesIO
 
@@ -48,9 +49,6 @@ class EmailHandler:
             Dict: Resposta do serviço de email
         """
         try:
-            # Carregar o template de email
-            template = load_template("pdf_report")
-
             # Formatar o valor do faturamento não realizado
             formatted_value = format_currency(faturamento_nao_realizado)
 
@@ -70,13 +68,16 @@ class EmailHandler:
                 "data": current_date,
             }
 
-            email_content = replace_template_variables(template, variables)
+            email_content = render_template("pdf_report", variables)
 
             # Preparar o assunto do email
             subject = f"Análise Financeira - {petshop_name}"
 
-            # Nome do arquivo usa timestamp EPOCH
-            file_name = f"analise_{petshop_name.replace(' ', '_').lower()}_{current_timestamp}.pdf"
+            # Nome do arquivo usa o hash do conteúdo: o mesmo PDF tem sempre o mesmo nome
+            file_name = (
+                f"analise_{petshop_name.replace(' ', '_').lower()}_"
+                f"{self._content_digest(pdf_buffer)[:12]}.pdf"
+            )
 
             # Enviar o email com o relatório em anexo
             response = self.ses_handler.send_email(
@@ -89,7 +90,7 @@ class EmailHandler:
                 attachments=[
                     {
                         "name": file_name,
-                        "content": pdf_buffer.getvalue(),
+                        "content": pdf_buffer,
                         "content_type": "application/pdf",
                     }
                 ],
@@ -104,6 +105,19 @@ class EmailHandler:
         except Exception as e:
             return {"success": False, "error": str(e), "timestamp": int(time.time())}
 
+    @staticmethod
+    def _content_digest(pdf_buffer: Union[BytesIO, BinaryIO]) -> str:
+        """Hash SHA-256 do conteúdo do PDF, sem alterar a posição do buffer"""
+        if hasattr(pdf_buffer, "getvalue"):
+            return hashlib.sha256(pdf_buffer.getvalue()).hexdigest()
+
+        digest = hashlib.sha256()
+        position = pdf_buffer.tell()
+        for chunk in iter(lambda: pdf_buffer.read(1024 * 1024), b""):
+            digest.update(chunk)
+        pdf_buffer.seek(position)
+        return digest.hexdigest()
+
     def send_contact_confirmation(
         self,
         nome: str,
@@ -124,38 +138,14 @@ class EmailHandler:
             Dict: Resposta do serviço de email
         """
         try:
-            # Carregar o template de email
-            template = load_template("contact_confirmation")
-
             # Timestamp atual em formato EPOCH
             current_timestamp = int(time.time())
 
-            # Para o template, ainda precisamos de uma data formatada para legibilidade
-            current_date = datetime.fromtimestamp(current_timestamp).strftime(
-                "%d/%m/%Y às %H:%M"
-            )
-
-            # Substituir variáveis no template
-            variables = {
-                "nome": nome,
-                "email": email,
-                "petshop_name": petshop_name,
-                "mensagem": mensagem,
-                "data": current_date,
-            }
-
-            email_content = replace_template_variables(template, variables)
-
-            # Preparar o assunto do email
-            subject = "Recebemos sua mensagem - Dog's Club"
-
             # Enviar o email de confirmação
             response = self.ses_handler.send_email(
-                source=self.source_email,
-                destination=email,
-                subject=subject,
-                body=email_content,
-                content_type=EmailContentType.HTML,
+                **self.build_contact_confirmation(
+                    nome, email, petshop_name, mensagem, current_timestamp
+                )
             )
 
             return {
@@ -167,6 +157,52 @@ class EmailHandler:
         except Exception as e:
             return {"success": False, "error": str(e), "timestamp": int(time.time())}
 
+    def build_contact_confirmation(
+        self,
+        nome: str,
+        email: str,
+        petshop_name: str,
+        mensagem: str,
+        current_timestamp: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Monta o email de confirmação de contato sem enviá-lo.
+
+        Args:
+            nome: Nome do cliente
+            email: Email do cliente
+            petshop_name: Nome do petshop
+            mensagem: Mensagem enviada pelo cliente
+            current_timestamp: Timestamp EPOCH do contato (padrão: agora)
+
+        Returns:
+            Dict: Parâmetros para SESHandler.send_email
+        """
+        if current_timestamp is None:
+            current_timestamp = int(time.time())
+
+        # Para o template, ainda precisamos de uma data formatada para legibilidade
+        current_date = datetime.fromtimestamp(current_timestamp).strftime(
+            "%d/%m/%Y às %H:%M"
+        )
+
+        # Substituir variáveis no template
+        variables = {
+            "nome": nome,
+            "email": email,
+            "petshop_name": petshop_name,
+            "mensagem": mensagem,
+            "data": current_date,
+        }
+
+        return {
+            "source": self.source_email,
+            "destination": email,
+            "subject": "Recebemos sua mensagem - Dog's Club",
+            "body": render_template("contact_confirmation", variables),
+            "content_type": EmailContentType.HTML,
+        }
+
     def send_internal_notification(
         self,
         nome: str,
@@ -196,39 +232,18 @@ class EmailHandler:
             # Timestamp atual em formato EPOCH
             current_timestamp = int(time.time())
 
-            # Para o email, ainda precisamos de uma data formatada para legibilidade
-            formatted_date = datetime.fromtimestamp(current_timestamp).strftime(
-                "%d/%m/%Y às %H:%M"
-            )
-
-            # Carregar o template de email para notificação interna
-            print("Carregando template de email para notificação interna")
-            template = load_template("new_lead_notification")
-
-            # Substituir variáveis no template
-            variables = {
-                "nome": nome,
-                "email": email,
-                "whatsapp": whatsapp,
-                "petshop_name": petshop_name,
-                "fonte": fonte,
-                "data": formatted_date,
-                "timestamp": str(current_timestamp),
-                "mensagem": mensagem,
-            }
-
-            html_content = replace_template_variables(template, variables)
-            # Preparar o assunto do email
-            subject = f"[NOVO LEAD] {nome} - {petshop_name}"
-
             # Enviar o email interno
             response = self.ses_handler.send_email(
-                source=self.source_email,
-                destination=internal_recipients,
-                subject=subject,
-                body=html_content,
-                content_type=EmailContentType.HTML,
-                reply_to=email,  # Facilitar a resposta direta ao cliente
+                **self.build_internal_notification(
+                    nome,
+                    email,
+                    whatsapp,
+                    petshop_name,
+                    mensagem,
+                    fonte,
+                    internal_recipients,
+                    current_timestamp,
+                )
             )
 
             return {
@@ -241,3 +256,59 @@ class EmailHandler:
             print("ERRO AO ENVIAR EMAIL INTERNO")
             print("ERROR: ", e)
             return {"success": False, "error": str(e), "timestamp": int(time.time())}
+
+    def build_internal_notification(
+        self,
+        nome: str,
+        email: str,
+        whatsapp: str,
+        petshop_name: str,
+        mensagem: str,
+        fonte: str,
+        internal_recipients: List[str],
+        current_timestamp: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Monta a notificação interna de novo lead sem enviá-la.
+
+        Args:
+            nome: Nome do cliente
+            email: Email do cliente
+            whatsapp: WhatsApp do cliente
+            petshop_name: Nome do petshop
+            mensagem: Mensagem enviada pelo cliente
+            fonte: Fonte de onde o lead foi direcionado
+            internal_recipients: Lista de emails internos para receber a notificação
+            current_timestamp: Timestamp EPOCH do contato (padrão: agora)
+
+        Returns:
+            Dict: Parâmetros para SESHandler.send_email
+        """
+        if current_timestamp is None:
+            current_timestamp = int(time.time())
+
+        # Para o email, ainda precisamos de uma data formatada para legibilidade
+        formatted_date = datetime.fromtimestamp(current_timestamp).strftime(
+            "%d/%m/%Y às %H:%M"
+        )
+
+        # Substituir variáveis no template
+        variables = {
+            "nome": nome,
+            "email": email,
+            "whatsapp": whatsapp,
+            "petshop_name": petshop_name,
+            "fonte": fonte,
+            "data": formatted_date,
+            "timestamp": str(current_timestamp),
+            "mensagem": mensagem,
+        }
+
+        return {
+            "source": self.source_email,
+            "destination": internal_recipients,
+            "subject": f"[NOVO LEAD] {nome} - {petshop_name}",
+            "body": render_template("new_lead_notification", variables),
+            "content_type": EmailContentType.HTML,
+            "reply_to": email,  # Facilitar a resposta direta ao cliente
+        }
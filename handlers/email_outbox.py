@@ -0,0 +1,407 @@
+import base64
+import json
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from common.enums import EmailContentType, EmailPriority, OutboxStatus
+from handlers.ses import SESError, SESHandler
+
+logger = logging.getLogger(__name__)
+
+# Códigos do SES que indicam falha temporária (o envio é tentado de novo)
+RETRYABLE_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailable",
+    "InternalFailure",
+    "RequestTimeout",
+    "DailyQuotaExceeded",
+}
+
+# Diretório de dados da aplicação, usado quando EMAIL_OUTBOX_PATH não é definido.
+# Em containers deve apontar para um volume persistente
+APP_DATA_DIR = os.getenv("APP_DATA_DIR") or os.path.join(
+    os.path.expanduser("~"), ".dogs_club"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    message_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    message_id TEXT,
+    claimed_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+def default_outbox_path() -> str:
+    """
+    Caminho da fila: EMAIL_OUTBOX_PATH ou APP_DATA_DIR/email_outbox.sqlite3.
+
+    Se o diretório não puder ser criado, usa o diretório temporário. Nesse caso,
+    e sempre que o arquivo ficar dentro dele, registra um aviso: o diretório
+    temporário é apagado ao reiniciar o container, junto com as mensagens
+    ainda não enviadas.
+
+    Returns:
+        str: Caminho do arquivo SQLite
+    """
+    path = os.getenv("EMAIL_OUTBOX_PATH") or os.path.join(
+        APP_DATA_DIR, "email_outbox.sqlite3"
+    )
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Não foi possível criar o diretório da fila de emails: {e}")
+        path = os.path.join(tempfile.gettempdir(), "dogs_club_email_outbox.sqlite3")
+
+    if Path(path).resolve().is_relative_to(Path(tempfile.gettempdir()).resolve()):
+        logger.warning(
+            f"Fila de emails em diretório temporário ({path}): mensagens pendentes "
+            "serão perdidas ao reiniciar. Defina EMAIL_OUTBOX_PATH em um volume "
+            "persistente."
+        )
+    return path
+
+
+class EmailOutbox:
+    """
+    Fila persistente (SQLite) de emails já renderizados, enviada em segundo plano.
+
+    `enqueue` grava a mensagem e retorna imediatamente; uma thread envia as
+    mensagens pelo SESHandler. Erros temporários (throttling, indisponibilidade)
+    são reenviados com backoff exponencial com jitter. A chave da mensagem torna
+    o enfileiramento idempotente: a mesma chave nunca gera um segundo envio.
+
+    Várias instâncias (processos ou sessões) podem usar o mesmo arquivo: cada
+    mensagem em envio tem um prazo (lease) a partir de `claimed_at`, e só volta
+    para a fila quando esse prazo expira sem resultado.
+    """
+
+    def __init__(
+        self,
+        ses_handler: SESHandler,
+        db_path: str,
+        max_attempts: int = 8,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        poll_interval: float = 5.0,
+        lease_seconds: float = 600.0,
+    ) -> None:
+        """
+        Inicializa a fila.
+
+        Args:
+            ses_handler: Handler usado para os envios
+            db_path: Caminho do arquivo SQLite
+            max_attempts: Número máximo de tentativas por mensagem
+            base_delay: Espera inicial do backoff em segundos
+            max_delay: Espera máxima do backoff em segundos
+            poll_interval: Intervalo máximo entre verificações da fila em segundos
+            lease_seconds: Tempo após o qual uma mensagem em envio sem resultado
+                (ex: processo interrompido) volta para a fila
+        """
+        self.ses_handler = ses_handler
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(outbox)")}
+            if "claimed_at" not in columns:
+                conn.execute("ALTER TABLE outbox ADD COLUMN claimed_at REAL")
+
+    def enqueue(self, message_key: str, **send_kwargs: Any) -> bool:
+        """
+        Grava uma mensagem na fila.
+
+        Args:
+            message_key: Chave única da mensagem (idempotência)
+            send_kwargs: Parâmetros de SESHandler.send_email
+
+        Returns:
+            bool: True se a mensagem foi enfileirada, False se a chave já existia
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO outbox "
+                "(message_key, payload, status, next_attempt_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    message_key,
+                    _encode_payload(send_kwargs),
+                    OutboxStatus.PENDING.value,
+                    now,
+                    now,
+                    now,
+                ),
+            )
+            created = cursor.rowcount == 1
+
+        if created:
+            self._wake.set()
+        return created
+
+    def get(self, message_key: str) -> Optional[Dict[str, Any]]:
+        """Retorna o estado de uma mensagem (sem o conteúdo) ou None"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT message_key, status, attempts, last_error, message_id, "
+                "created_at, updated_at FROM outbox WHERE message_key = ?",
+                (message_key,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def pending_count(self) -> int:
+        """Número de mensagens ainda não enviadas"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status IN (?, ?)",
+                (OutboxStatus.PENDING.value, OutboxStatus.SENDING.value),
+            ).fetchone()[0]
+
+    def start(self) -> None:
+        """Inicia a thread de envio, se ainda não estiver rodando"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="email-outbox", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Interrompe a thread de envio"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def drain(self, limit: int = 25) -> int:
+        """
+        Envia as mensagens cujo horário de tentativa já chegou.
+
+        Args:
+            limit: Número máximo de mensagens processadas nesta chamada
+
+        Returns:
+            int: Número de mensagens processadas
+        """
+        messages = self._claim(limit)
+        for message in messages:
+            self._send(message)
+        return len(messages)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                processed = self.drain()
+            except Exception as e:
+                logger.error(f"Erro ao processar a fila de emails: {e}")
+                processed = 0
+
+            if not processed:
+                self._wake.wait(self._seconds_until_next())
+                self._wake.clear()
+
+    def _claim(self, limit: int) -> List[Dict[str, Any]]:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Pendentes cujo horário chegou e envios cujo lease expirou (ex: o
+            # processo que os reservou parou no meio do envio)
+            rows = conn.execute(
+                "SELECT * FROM outbox WHERE (status = ? AND next_attempt_at <= ?) "
+                "OR (status = ? AND COALESCE(claimed_at, updated_at) <= ?) "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (
+                    OutboxStatus.PENDING.value,
+                    now,
+                    OutboxStatus.SENDING.value,
+                    now - self.lease_seconds,
+                    limit,
+                ),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE outbox SET status = ?, claimed_at = ?, updated_at = ? "
+                "WHERE message_key = ?",
+                [
+                    (OutboxStatus.SENDING.value, now, now, row["message_key"])
+                    for row in rows
+                ],
+            )
+        return [dict(row, claimed_at=now) for row in rows]
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        attempts = message["attempts"] + 1
+        try:
+            response = self.ses_handler.send_email(
+                **_decode_payload(message["payload"])
+            )
+        except Exception as e:
+            retryable = not isinstance(e, (SESError, ValueError)) or (
+                isinstance(e, SESError) and e.code in RETRYABLE_ERROR_CODES
+            )
+            if retryable and attempts < self.max_attempts:
+                delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+                # Metade fixa e metade aleatória, para espalhar os reenvios
+                delay = delay / 2 + random.uniform(0, delay / 2)
+                logger.warning(
+                    f"Falha temporária ao enviar {message['message_key']} "
+                    f"(tentativa {attempts}), nova tentativa em {delay:.1f}s: {e}"
+                )
+                self._update(
+                    message,
+                    OutboxStatus.PENDING,
+                    attempts,
+                    error=str(e),
+                    next_attempt_at=time.time() + delay,
+                )
+            else:
+                logger.error(f"Falha ao enviar {message['message_key']}: {e}")
+                self._update(message, OutboxStatus.FAILED, attempts, error=str(e))
+            return
+
+        self._update(
+            message,
+            OutboxStatus.SENT,
+            attempts,
+            message_id=response.get("MessageId"),
+        )
+
+    def _update(
+        self,
+        message: Dict[str, Any],
+        status: OutboxStatus,
+        attempts: int,
+        error: Optional[str] = None,
+        message_id: Optional[str] = None,
+        next_attempt_at: Optional[float] = None,
+    ) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            # Só grava se a reserva ainda for desta instância (o lease não expirou
+            # e foi assumido por outra)
+            cursor = conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ?, "
+                "message_id = ?, next_attempt_at = ?, claimed_at = NULL, "
+                "updated_at = ? WHERE message_key = ? AND claimed_at = ?",
+                (
+                    status.value,
+                    attempts,
+                    error,
+                    message_id,
+                    next_attempt_at if next_attempt_at is not None else now,
+                    now,
+                    message["message_key"],
+                    message["claimed_at"],
+                ),
+            )
+        if cursor.rowcount == 0:
+            logger.warning(
+                f"Resultado de {message['message_key']} descartado: "
+                "a mensagem foi reservada por outra instância"
+            )
+
+    def _seconds_until_next(self) -> float:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MIN(CASE WHEN status = ? THEN next_attempt_at "
+                "ELSE COALESCE(claimed_at, updated_at) + ? END) "
+                "FROM outbox WHERE status IN (?, ?)",
+                (
+                    OutboxStatus.PENDING.value,
+                    self.lease_seconds,
+                    OutboxStatus.PENDING.value,
+                    OutboxStatus.SENDING.value,
+                ),
+            ).fetchone()
+        if row[0] is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, row[0] - time.time()))
+
+    def _connect(self) -> "_AutoClosing":
+        # Uma conexão por operação: o SQLite não compartilha conexões entre threads
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return _AutoClosing(conn)
+
+
+class _AutoClosing:
+    """Fecha a conexão ao sair do bloco `with` (o sqlite3 apenas faz commit)"""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self.conn
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            if self.conn.in_transaction:
+                if exc_type is None:
+                    self.conn.commit()
+                else:
+                    self.conn.rollback()
+        finally:
+            self.conn.close()
+
+
+def _encode_payload(send_kwargs: Dict[str, Any]) -> str:
+    """Serializa os parâmetros de envio (enums e anexos binários) em JSON"""
+    payload = dict(send_kwargs)
+    for name in ("content_type", "priority"):
+        if payload.get(name) is not None:
+            payload[name] = payload[name].value
+    if payload.get("attachments"):
+        payload["attachments"] = [
+            dict(
+                attachment,
+                content=base64.b64encode(
+                    attachment["content"].getvalue()
+                    if hasattr(attachment["content"], "getvalue")
+                    else attachment["content"]
+                ).decode("ascii"),
+            )
+            for attachment in payload["attachments"]
+        ]
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _decode_payload(payload: str) -> Dict[str, Any]:
+    send_kwargs = json.loads(payload)
+    if send_kwargs.get("content_type") is not None:
+        send_kwargs["content_type"] = EmailContentType(send_kwargs["content_type"])
+    if send_kwargs.get("priority") is not None:
+        send_kwargs["priority"] = EmailPriority(send_kwargs["priority"])
+    if send_kwargs.get("attachments"):
+        send_kwargs["attachments"] = [
+            dict(attachment, content=base64.b64decode(attachment["content"]))
+            for attachment in send_kwargs["attachments"]
+        ]
+    return send_kwargs
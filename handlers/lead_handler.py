@@ -1,7 +1,7 @@
 import os
 import uuid
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from handlers.dynamodb import DynamoDBHandler
 from common.utils import get_timestamp, format_iso_date
 
@@ -11,14 +11,16 @@ class LeadHandler:
     Handler para gerenciar leads do Dog's Club Reports
     """
 
-    def __init__(self):
+    def __init__(self, dynamodb: Optional[Any] = None):
         """
         Inicializa o handler de leads.
 
         Args:
-            table_name: Nome da tabela DynamoDB para armazenar os leads
+            dynamodb: Recurso DynamoDB opcional (ex: InMemoryDynamoDB em testes)
         """
-        self.dynamodb_handler = DynamoDBHandler(table=os.getenv("LEADS_TABLE"))
+        self.dynamodb_handler = DynamoDBHandler(
+            table=os.getenv("LEADS_TABLE"), dynamodb=dynamodb
+        )
 
     def create_lead(
         self,
@@ -76,6 +78,21 @@ class LeadHandler:
         response = self.dynamodb_handler.get_item({"lead_id": lead_id})
         return response.get("Item", {})
 
+    def get_leads_by_ids(self, lead_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Busca vários leads pelo ID com leituras em lote.
+
+        Args:
+            lead_ids: IDs dos leads
+
+        Returns:
+            List[Dict]: Leads encontrados, na ordem dos IDs informados
+        """
+        results = self.dynamodb_handler.get_items(
+            [{"lead_id": lead_id} for lead_id in lead_ids]
+        )
+        return [result["item"] for result in results if result["item"]]
+
     def get_lead_by_email(self, email: str) -> List[Dict[str, Any]]:
         """
         Busca leads pelo email.
@@ -86,10 +103,11 @@ class LeadHandler:
         Returns:
             List[Dict]: Lista de leads com o email fornecido
         """
-        response = self.dynamodb_handler.query_using_gsi(
-            index_name="email-index", partition_key={"email": email.lower()}
+        return list(
+            self.dynamodb_handler.iter_query(
+                index_name="email-index", partition_key={"email": email.lower()}
+            )
         )
-        return response.get("Items", [])
 
     def get_leads_by_source(self, source: str) -> List[Dict[str, Any]]:
         """
@@ -101,10 +119,11 @@ class LeadHandler:
         Returns:
             List[Dict]: Lista de leads com a fonte fornecida
         """
-        response = self.dynamodb_handler.query_using_gsi(
-            index_name="source-index", partition_key={"source": source}
+        return list(
+            self.dynamodb_handler.iter_query(
+                index_name="source-index", partition_key={"source": source}
+            )
         )
-        return response.get("Items", [])
 
     def update_lead_status(self, lead_id: str, status: str) -> Dict[str, Any]:
         """
@@ -136,6 +155,62 @@ class LeadHandler:
             key={"lead_id": lead_id}, attributes_to_update={"notes": notes}
         )
 
+    def iter_leads(
+        self,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre todos os leads ativos página a página, sem carregar a tabela em memória.
+
+        Args:
+            page_size: Número de itens avaliados por página do scan
+            projection: Lista de atributos a retornar (ex: ["lead_id", "email"])
+            max_items: Número máximo de leads a retornar
+
+        Returns:
+            Iterator[Dict]: Leads ativos
+        """
+        return self.dynamodb_handler.iter_scan(
+            FilterExpression="entity_status = :status",
+            ExpressionAttributeValues={":status": "active"},
+            page_size=page_size,
+            projection=projection,
+            max_items=max_items,
+        )
+
+    def export_leads(
+        self,
+        total_segments: int = 4,
+        checkpoint_path: Optional[str] = None,
+        page_size: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Exporta todos os leads ativos com scan paralelo, para rotinas noturnas.
+
+        Com `checkpoint_path`, uma exportação interrompida retoma cada segmento
+        de onde parou na próxima execução com o mesmo número de segmentos.
+
+        Args:
+            total_segments: Número de segmentos lidos em paralelo
+            checkpoint_path: Caminho do arquivo de checkpoint (opcional)
+            page_size: Número de itens avaliados por página do scan
+            projection: Lista de atributos a retornar
+
+        Returns:
+            Iterator[Dict]: Leads ativos, sem ordem garantida
+        """
+        return self.dynamodb_handler.parallel_scan(
+            total_segments=total_segments,
+            checkpoint_path=checkpoint_path,
+            FilterExpression="entity_status = :status",
+            ExpressionAttributeValues={":status": "active"},
+            page_size=page_size,
+            projection=projection,
+        )
+
     def get_all_leads(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Busca todos os leads ativos.
@@ -146,13 +221,13 @@ class LeadHandler:
         Returns:
             List[Dict]: Lista de leads
         """
-        scan_params = {
-            "FilterExpression": "entity_status = :status",
-            "ExpressionAttributeValues": {":status": "active"},
-        }
+        return list(self.iter_leads(max_items=limit))
 
-        if limit:
-            scan_params["Limit"] = limit
+    def count_leads(self) -> int:
+        """
+        Conta os leads ativos percorrendo a tabela em memória constante.
 
-        response = self.dynamodb_handler.scan(**scan_params)
-        return response.get("Items", [])
+        Returns:
+            int: Número de leads ativos
+        """
+        return sum(1 for _ in self.iter_leads(projection=["lead_id"]))
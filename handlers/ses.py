@@ -1,15 +1,29 @@
-import boto3
+import json
 import re
-import email.mime.multipart
-import email.mime.text
-import email.mime.application
 import base64
-from typing import Dict, Union, List, Optional, Any
+from email.parser import BytesHeaderParser, HeaderParser
+from email.utils import getaddresses
+from typing import Dict, Union, List, Optional, Any, Tuple
 from common.enums import EmailContentType, EmailPriority
 from botocore.exceptions import ClientError
+from handlers.aws_clients import get_client
+from handlers.ses_rate_limiter import DailyQuotaExceeded, get_send_limiter
+from utils.mime_message import build_raw_message
 import os
 
 
+# Número máximo de destinos por chamada de SendBulkTemplatedEmail
+BULK_DESTINATIONS_LIMIT = 50
+
+
+class SESError(Exception):
+    """Erro retornado pelo SES, com o código original da AWS (ex: "Throttling")"""
+
+    def __init__(self, message: str, code: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.code = code
+
+
 class SESHandler:
     def __init__(self, region_name: Optional[str] = None):
         """
@@ -18,21 +32,12 @@ class SESHandler:
         Args:
             region_name: Região AWS opcional. Se não fornecida, usa a região definida em AWS_REGION.
         """
-        # Obter credenciais AWS das variáveis de ambiente
-        aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
-        aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-
-        # Obter a região da variável de ambiente se não for especificada
-        if not region_name:
-            region_name = os.getenv("AWS_REGION")
-
-        # Configurar o cliente SES com as credenciais e região
-        self.ses_client = boto3.client(
-            "ses",
-            region_name=region_name,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-        )
+        # Cliente compartilhado pelo processo (pool de conexões reutilizado)
+        self.ses_client = get_client("ses", region_name=region_name)
+
+        # Limitador de taxa compartilhado por todos os handlers da região
+        self.rate_limiter = get_send_limiter(self.ses_client)
+        self.rate_limit_timeout = float(os.getenv("SES_RATE_LIMIT_TIMEOUT", "60"))
 
         self._email_regex = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
 
@@ -64,7 +69,8 @@ class SESHandler:
             content_type: Tipo de conteúdo do email
             priority: Prioridade do email
             configuration_set: Nome do conjunto de configuração do SES
-            attachments: Lista de anexos no formato [{"name": "file.pdf", "content": bytes, "content_type": "application/pdf"}]
+            attachments: Lista de anexos no formato [{"name": "file.pdf", "content": bytes, "content_type": "application/pdf"}].
+                O conteúdo também pode ser um BytesIO, lido sem cópia.
 
         Returns:
             Dict: Resposta do AWS SES
@@ -88,35 +94,24 @@ class SESHandler:
 
         # Se houver anexos, usar a API de mensagem MIME
         if attachments:
-            message = self._build_mime_message(
+            # Montar a mensagem MIME diretamente em bytes (sem cópias em str)
+            message = build_raw_message(
                 source,
                 to_addresses,
-                cc_addresses,
-                bcc_addresses,
                 subject,
-                body,
-                content_type,
-                attachments,
-                priority,
+                self._body_parts(body, content_type),
+                cc_addresses=cc_addresses,
+                bcc_addresses=bcc_addresses,
+                attachments=attachments,
+                priority=priority.value if priority else None,
             )
 
-            send_params = {
-                "Source": source,
-                "RawMessage": {"Data": message.as_string()},
-            }
-
-            if configuration_set:
-                send_params["ConfigurationSetName"] = configuration_set
-
-            try:
-                response = self.ses_client.send_raw_email(**send_params)
-                return response
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                error_message = e.response["Error"]["Message"]
-                raise Exception(
-                    f"Failed to send email. Error code: {error_code}. Message: {error_message}"
-                )
+            return self._send_raw(
+                message,
+                source=source,
+                configuration_set=configuration_set,
+                recipients=len(to_addresses) + len(cc_addresses) + len(bcc_addresses),
+            )
 
         # Se não tiver anexos, usar a API padrão
         else:
@@ -146,16 +141,56 @@ class SESHandler:
                 tags = [{"Name": "X-Priority", "Value": priority.value}]
                 send_params["Tags"] = tags
 
+            self._acquire_send(
+                len(to_addresses) + len(cc_addresses) + len(bcc_addresses)
+            )
+
             try:
                 response = self.ses_client.send_email(**send_params)
                 return response
             except ClientError as e:
                 error_code = e.response["Error"]["Code"]
                 error_message = e.response["Error"]["Message"]
-                raise Exception(
-                    f"Failed to send email. Error code: {error_code}. Message: {error_message}"
+                raise SESError(
+                    f"Failed to send email. Error code: {error_code}. Message: {error_message}",
+                    code=error_code,
                 )
 
+    def send_raw_email(
+        self,
+        raw_message: Union[str, bytes],
+        source: Optional[str] = None,
+        destinations: Optional[List[str]] = None,
+        configuration_set: Optional[str] = None,
+    ) -> Dict:
+        """
+        Envia uma mensagem MIME já montada.
+
+        Args:
+            raw_message: Mensagem MIME completa
+            source: Email do remetente (opcional, o SES usa o cabeçalho From)
+            destinations: Destinatários (opcional, o SES usa os cabeçalhos To/Cc/Bcc,
+                que também são contados para a cota de envio)
+            configuration_set: Nome do conjunto de configuração do SES
+
+        Returns:
+            Dict: Resposta do AWS SES
+        """
+        if destinations:
+            self._validate_emails(destinations)
+
+        return self._send_raw(
+            raw_message,
+            source=source,
+            destinations=destinations,
+            configuration_set=configuration_set,
+            recipients=(
+                len(destinations)
+                if destinations
+                else self._count_header_recipients(raw_message)
+            ),
+        )
+
     def verify_email_identity(self, email: str) -> Dict:
         """
         Verifica uma identidade de email no SES.
@@ -192,37 +227,64 @@ class SESHandler:
         template_name: str,
         destinations: List[Dict[str, Union[List[str], Dict]]],
         configuration_set: Optional[str] = None,
+        default_template_data: Optional[Dict[str, Any]] = None,
     ) -> Dict:
         """
         Envia emails em massa usando um template.
 
+        O SES aceita no máximo 50 destinos por chamada; listas maiores são
+        enviadas em lotes e os status são retornados na ordem dos destinos.
+
         Args:
             source: Email do remetente
             template_name: Nome do template no SES
             destinations: Lista de destinos com seus dados
             configuration_set: Nome do conjunto de configuração do SES
+            default_template_data: Valores padrão das variáveis do template
+
+        Returns:
+            Dict: Resposta do AWS SES com um item em "Status" por destino
         """
         self._validate_email(source)
 
-        send_params = {
-            "Source": source,
-            "Template": template_name,
-            "Destinations": destinations,
-        }
+        statuses = []
+        for start in range(0, len(destinations), BULK_DESTINATIONS_LIMIT):
+            chunk = destinations[start : start + BULK_DESTINATIONS_LIMIT]
+            send_params = {
+                "Source": source,
+                "Template": template_name,
+                "Destinations": chunk,
+                "DefaultTemplateData": json.dumps(
+                    default_template_data or {}, ensure_ascii=False, default=str
+                ),
+            }
 
-        if configuration_set:
-            send_params["ConfigurationSetName"] = configuration_set
+            if configuration_set:
+                send_params["ConfigurationSetName"] = configuration_set
 
-        try:
-            response = self.ses_client.send_bulk_templated_email(**send_params)
-            return response
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            error_message = e.response["Error"]["Message"]
-            raise Exception(
-                f"Failed to send bulk email. Error code: {error_code}. Message: {error_message}"
+            self._acquire_send(
+                sum(
+                    sum(
+                        len(destination["Destination"].get(field, []))
+                        for field in ("ToAddresses", "CcAddresses", "BccAddresses")
+                    )
+                    for destination in chunk
+                )
             )
 
+            try:
+                response = self.ses_client.send_bulk_templated_email(**send_params)
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                error_message = e.response["Error"]["Message"]
+                raise SESError(
+                    f"Failed to send bulk email. Error code: {error_code}. Message: {error_message}",
+                    code=error_code,
+                )
+            statuses.extend(response.get("Status", []))
+
+        return {"Status": statuses}
+
     def create_template(
         self,
         template_name: str,
@@ -258,6 +320,64 @@ class SESHandler:
                 f"Failed to create template. Error code: {error_code}. Message: {error_message}"
             )
 
+    def _send_raw(
+        self,
+        raw_message: Union[str, bytes],
+        source: Optional[str],
+        recipients: int,
+        destinations: Optional[List[str]] = None,
+        configuration_set: Optional[str] = None,
+    ) -> Dict:
+        send_params = {"RawMessage": {"Data": raw_message}}
+        if source:
+            send_params["Source"] = source
+        if destinations:
+            send_params["Destinations"] = destinations
+        if configuration_set:
+            send_params["ConfigurationSetName"] = configuration_set
+
+        self._acquire_send(recipients)
+
+        try:
+            response = self.ses_client.send_raw_email(**send_params)
+            return response
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            error_message = e.response["Error"]["Message"]
+            raise SESError(
+                f"Failed to send email. Error code: {error_code}. Message: {error_message}",
+                code=error_code,
+            )
+
+    def _acquire_send(self, recipients: int) -> None:
+        """Aguarda a taxa de envio da conta antes de chamar o SES"""
+        try:
+            allowed = self.rate_limiter.acquire(
+                max(recipients, 1), timeout=self.rate_limit_timeout
+            )
+        except DailyQuotaExceeded as e:
+            raise SESError(str(e), code="DailyQuotaExceeded")
+
+        if not allowed:
+            raise SESError(
+                "Timed out waiting for the SES send rate limit", code="Throttling"
+            )
+
+    @staticmethod
+    def _count_header_recipients(raw_message: Union[str, bytes]) -> int:
+        """Conta os destinatários dos cabeçalhos To/Cc/Bcc de uma mensagem MIME"""
+        if isinstance(raw_message, (bytes, bytearray)):
+            headers = BytesHeaderParser().parsebytes(bytes(raw_message))
+        else:
+            headers = HeaderParser().parsestr(raw_message)
+
+        campos = [
+            str(valor)
+            for nome in ("To", "Cc", "Bcc")
+            for valor in headers.get_all(nome, [])
+        ]
+        return len({email.lower() for _, email in getaddresses(campos) if email})
+
     def _validate_email(self, email: str) -> bool:
         """Valida o formato do email."""
         return bool(re.match(self._email_regex, email))
@@ -306,97 +426,16 @@ class SESHandler:
         message["Body"] = body_content
         return message
 
-    def _build_mime_message(
-        self,
-        source: str,
-        to_addresses: List[str],
-        cc_addresses: List[str],
-        bcc_addresses: List[str],
-        subject: str,
-        body: Union[str, Dict[str, str]],
-        content_type: EmailContentType = EmailContentType.TEXT,
-        attachments: List[Dict[str, Any]] = None,
-        priority: Optional[EmailPriority] = None,
-    ) -> email.mime.multipart.MIMEMultipart:
-        """
-        Constrói uma mensagem MIME para envio com anexos.
-
-        Args:
-            source: Email do remetente
-            to_addresses: Lista de destinatários
-            cc_addresses: Lista de emails em cópia
-            bcc_addresses: Lista de emails em cópia oculta
-            subject: Assunto do email
-            body: Corpo do email
-            content_type: Tipo de conteúdo (texto ou HTML)
-            attachments: Lista de anexos
-            priority: Prioridade do email
-
-        Returns:
-            MIMEMultipart: Mensagem no formato MIME
-        """
-        # Criar a estrutura base da mensagem
-        message = email.mime.multipart.MIMEMultipart()
-        message["Subject"] = subject
-        message["From"] = source
-        message["To"] = ", ".join(to_addresses)
-
-        if cc_addresses:
-            message["Cc"] = ", ".join(cc_addresses)
-        if bcc_addresses:
-            message["Bcc"] = ", ".join(bcc_addresses)
-        if priority:
-            message["X-Priority"] = priority.value
-
-        # Anexar o corpo da mensagem
+    def _body_parts(
+        self, body: Union[str, Dict[str, str]], content_type: EmailContentType
+    ) -> List[Tuple[str, str]]:
+        """Converte o corpo do email em partes MIME [(subtipo, texto)]"""
         if content_type == EmailContentType.HTML:
-            part = email.mime.text.MIMEText(body, "html", "utf-8")
-            message.attach(part)
-        elif content_type == EmailContentType.TEXT:
-            part = email.mime.text.MIMEText(body, "plain", "utf-8")
-            message.attach(part)
-        elif content_type == EmailContentType.BOTH:
-            if not isinstance(body, dict) or not all(
-                k in body for k in ["Text", "Html"]
-            ):
-                raise ValueError(
-                    "For BOTH content type, body must be a dict with 'Text' and 'Html' keys"
-                )
-            # Anexar parte texto
-            part1 = email.mime.text.MIMEText(body["Text"], "plain", "utf-8")
-            message.attach(part1)
-            # Anexar parte HTML
-            part2 = email.mime.text.MIMEText(body["Html"], "html", "utf-8")
-            message.attach(part2)
-
-        # Anexar os arquivos
-        if attachments:
-            for attachment in attachments:
-                name = attachment["name"]
-                content = attachment["content"]
-                content_type = attachment.get(
-                    "content_type", "application/octet-stream"
-                )
-
-                # Criar o anexo
-                if isinstance(content, str) and content.startswith(
-                    ("http://", "https://")
-                ):
-                    # Tratar URLs
-                    import requests
-
-                    response = requests.get(content)
-                    part = email.mime.application.MIMEApplication(response.content)
-                elif isinstance(content, bytes):
-                    # Conteúdo já está em bytes
-                    part = email.mime.application.MIMEApplication(content)
-                else:
-                    # Tentar converter para bytes
-                    part = email.mime.application.MIMEApplication(bytes(content))
-
-                # Adicionar cabeçalhos e anexar
-                part.add_header("Content-Disposition", f"attachment; filename={name}")
-                part.add_header("Content-Type", content_type)
-                message.attach(part)
-
-        return message
+            return [("html", body)]
+        if content_type == EmailContentType.TEXT:
+            return [("plain", body)]
+        if not isinstance(body, dict) or not all(k in body for k in ["Text", "Html"]):
+            raise ValueError(
+                "For BOTH content type, body must be a dict with 'Text' and 'Html' keys"
+            )
+        return [("plain", body["Text"]), ("html", body["Html"])]
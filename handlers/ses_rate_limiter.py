@@ -0,0 +1,148 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from common.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class DailyQuotaExceeded(Exception):
+    """A cota de envios das últimas 24 horas do SES foi atingida"""
+
+
+class SESSendLimiter:
+    """
+    Limita os envios ao MaxSendRate e ao Max24HourSend da conta SES.
+
+    A cota é consultada com get_send_quota na primeira chamada e a cada
+    `refresh_seconds`. O SES conta destinatários, não chamadas: um email com
+    três destinatários consome três tokens.
+    """
+
+    def __init__(
+        self,
+        ses_client: Any,
+        refresh_seconds: float = 300,
+        default_rate: float = 1.0,
+    ) -> None:
+        """
+        Inicializa o limitador.
+
+        Args:
+            ses_client: Cliente boto3 do SES
+            refresh_seconds: Intervalo entre consultas da cota em segundos
+            default_rate: Taxa usada enquanto a cota não puder ser consultada
+        """
+        self.ses_client = ses_client
+        self.refresh_seconds = refresh_seconds
+        self.bucket = TokenBucket(default_rate)
+        self._daily_remaining: Optional[float] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def acquire(self, recipients: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda a liberação do envio para `recipients` destinatários.
+
+        Args:
+            recipients: Número de destinatários do envio
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            bool: True se o envio foi liberado, False se o tempo esgotou
+
+        Raises:
+            DailyQuotaExceeded: Se a cota diária não comporta o envio
+        """
+        self._refresh_if_stale()
+
+        with self._lock:
+            if self._daily_remaining is not None:
+                if self._daily_remaining < recipients:
+                    raise DailyQuotaExceeded(
+                        f"SES 24-hour send quota exhausted "
+                        f"({self._daily_remaining:.0f} remaining, {recipients} requested)"
+                    )
+                self._daily_remaining -= recipients
+
+        if self.bucket.acquire(recipients, timeout=timeout):
+            return True
+
+        # Devolve a cota diária reservada se o envio não aconteceu
+        with self._lock:
+            if self._daily_remaining is not None:
+                self._daily_remaining += recipients
+        return False
+
+    def refresh(self) -> Dict:
+        """Consulta a cota no SES e atualiza a taxa e o saldo diário"""
+        quota = self.ses_client.get_send_quota()
+        rate = float(quota["MaxSendRate"])
+        max_24h = float(quota["Max24HourSend"])
+
+        self.bucket.set_rate(rate)
+        with self._lock:
+            # Max24HourSend igual a -1 indica envio diário ilimitado
+            self._daily_remaining = (
+                max(0.0, max_24h - float(quota["SentLast24Hours"]))
+                if max_24h >= 0
+                else None
+            )
+            self._refreshed_at = time.monotonic()
+        return quota
+
+    def _refresh_if_stale(self) -> None:
+        refreshed_at = self._refreshed_at
+        if (
+            refreshed_at is not None
+            and time.monotonic() - refreshed_at < self.refresh_seconds
+        ):
+            return
+
+        # Apenas uma thread consulta a cota; as demais seguem com a taxa atual
+        if not self._refresh_lock.acquire(blocking=refreshed_at is None):
+            return
+        try:
+            if (
+                self._refreshed_at is None
+                or time.monotonic() - self._refreshed_at >= self.refresh_seconds
+            ):
+                self.refresh()
+        except Exception as e:
+            logger.warning(f"Falha ao consultar a cota do SES: {e}")
+            # Evita consultar de novo a cada envio enquanto a API falha
+            self._refreshed_at = time.monotonic()
+        finally:
+            self._refresh_lock.release()
+
+
+_limiters: Dict[str, SESSendLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_send_limiter(ses_client: Any) -> SESSendLimiter:
+    """
+    Retorna o limitador compartilhado pela região do cliente.
+
+    A cota do SES é da conta em cada região, então todos os handlers e threads
+    do processo devem usar o mesmo limitador.
+
+    Args:
+        ses_client: Cliente boto3 do SES
+
+    Returns:
+        SESSendLimiter: Limitador da região
+    """
+    region = ses_client.meta.region_name
+    with _limiters_lock:
+        if region not in _limiters:
+            _limiters[region] = SESSendLimiter(
+                ses_client,
+                refresh_seconds=float(os.getenv("SES_QUOTA_REFRESH_SECONDS", "300")),
+                default_rate=float(os.getenv("SES_DEFAULT_SEND_RATE", "1")),
+            )
+        return _limiters[region]
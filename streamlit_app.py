@@ -15,6 +15,8 @@ Desenvolvido para a Dog's Club
 © 2025 Dog's Club. Todos os direitos reservados.
 """
 
+import logging
+import os
 import streamlit as st
 import warnings
 import re
@@ -22,13 +24,19 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Configuração do log da aplicação (os módulos apenas obtêm seus loggers)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+
 # Importação dos módulos personalizados
 from functions import (
     extract_form_data,
     analyze_petshop_data,
     show_results,
     define_css,
+    admin_panel_requested,
+    show_admin_panel,
 )
+from assets.images import LOGO, LOGO_URL, get_cached_image_bytes, preload_images
 
 # Suprimir avisos
 warnings.filterwarnings("ignore")
@@ -48,6 +56,10 @@ st.set_page_config(
 
 define_css()
 
+# Carregar e decodificar as imagens uma vez por processo (usadas na UI e nos PDFs),
+# em segundo plano para que um download não atrase a renderização da página
+preload_images(background=True)
+
 
 def on_email_change():
     """Função callback para garantir que o email seja salvo"""
@@ -569,10 +581,7 @@ def navigation_buttons(step):
 # Criar uma versão simplificada da barra lateral
 def create_simple_sidebar():
     with st.sidebar:
-        st.image(
-            "https://dogs-club-source.s3.us-east-1.amazonaws.com/logo.png",
-            width=180,
-        )
+        st.image(get_cached_image_bytes(LOGO) or LOGO_URL, width=180)
 
         st.markdown("## Ajuda")
         st.markdown(
@@ -621,6 +630,11 @@ def create_simple_sidebar():
 
 # Função principal que orquestra a aplicação
 def main():
+    # Painel interno de métricas, acessível apenas com ?admin=<token>
+    if admin_panel_requested():
+        show_admin_panel()
+        return
+
     # Configuração inicial do estado da sessão
     if "current_page" not in st.session_state:
         st.session_state["current_page"] = "form"
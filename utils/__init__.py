@@ -1,2 +1,8 @@
-from .email_templates import load_template, replace_template_variables
+from .email_templates import (
+    load_template,
+    replace_template_variables,
+    get_template,
+    render_template,
+)
 from .format_values import format_currency, format_percent, format_time
+from .mime_message import build_raw_message
@@ -1,30 +1,125 @@
-from typing import Dict, List, Optional, Union, BinaryIO
+from typing import Dict, List, Optional, Tuple, Union, BinaryIO
 from pathlib import Path
+import html
 import re
 import base64
 import os
 import mimetypes
+import threading
 
+TEMPLATES_PATH = Path(__file__).parents[1] / "html"
 
-def load_template(template_name: str) -> str:
+# Variáveis no formato {{nome_variavel}}
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class CompiledTemplate:
     """
-    Carrega um template HTML a partir do disco.
+    Template HTML pré-processado em segmentos literais e variáveis.
+
+    A renderização é uma única junção de strings, sem expressões regulares.
+    """
+
+    def __init__(self, source: str) -> None:
+        """
+        Inicializa o template.
+
+        Args:
+            source: Conteúdo HTML com variáveis no formato {{nome_variavel}}
+        """
+        self.source = source
+        # Posições pares são textos literais e ímpares são nomes de variáveis
+        self.segments: Tuple[str, ...] = tuple(_PLACEHOLDER.split(source))
+        self.variables = frozenset(self.segments[1::2])
+
+    def render(self, variables: Dict[str, object], escape: bool = True) -> str:
+        """
+        Renderiza o template com os valores fornecidos.
+
+        Args:
+            variables: Dicionário com os valores das variáveis
+            escape: Escapa caracteres especiais de HTML nos valores
+
+        Returns:
+            str: Template com as variáveis substituídas. Variáveis sem valor
+                são mantidas no formato {{nome_variavel}}.
+        """
+        parts = list(self.segments)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            if name in variables:
+                value = str(variables[name])
+                parts[i] = html.escape(value) if escape else value
+            else:
+                parts[i] = "{{" + name + "}}"
+        return "".join(parts)
+
+
+_template_cache: Dict[str, Tuple[int, CompiledTemplate]] = {}
+_template_lock = threading.Lock()
+
+
+def get_template(template_name: str) -> CompiledTemplate:
+    """
+    Retorna o template compilado, recarregando-o se o arquivo foi alterado.
 
     Args:
         template_name: Nome do template sem a extensão .html
 
     Returns:
-        str: Conteúdo do template
+        CompiledTemplate: Template pronto para renderização
     """
-    templates_path = Path(__file__).parents[1] / "html"
-    file_path = templates_path / f"{template_name}.html"
+    file_path = TEMPLATES_PATH / f"{template_name}.html"
 
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            return file.read()
+        mtime = os.stat(file_path).st_mtime_ns
     except FileNotFoundError:
         raise FileNotFoundError(f"Template não encontrado: {file_path}")
 
+    cached = _template_cache.get(template_name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with _template_lock:
+        cached = _template_cache.get(template_name)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            template = CompiledTemplate(file.read())
+        _template_cache[template_name] = (mtime, template)
+        return template
+
+
+def render_template(
+    template_name: str, variables: Dict[str, object], escape: bool = True
+) -> str:
+    """
+    Renderiza um template da pasta html/ a partir do cache.
+
+    Args:
+        template_name: Nome do template sem a extensão .html
+        variables: Dicionário com os valores das variáveis
+        escape: Escapa caracteres especiais de HTML nos valores
+
+    Returns:
+        str: HTML renderizado
+    """
+    return get_template(template_name).render(variables, escape=escape)
+
+
+def load_template(template_name: str) -> str:
+    """
+    Carrega um template HTML a partir do disco.
+
+    Args:
+        template_name: Nome do template sem a extensão .html
+
+    Returns:
+        str: Conteúdo do template
+    """
+    return get_template(template_name).source
+
 
 def replace_template_variables(template: str, variables: Dict[str, str]) -> str:
     """
@@ -37,10 +132,7 @@ def replace_template_variables(template: str, variables: Dict[str, str]) -> str:
     Returns:
         str: Template com as variáveis substituídas
     """
-    for key, value in variables.items():
-        pattern = r"\{\{" + key + r"\}\}"
-        template = re.sub(pattern, str(value), template)
-    return template
+    return CompiledTemplate(template).render(variables, escape=False)
 
 
 def encode_attachment(file_path: str) -> str:
@@ -0,0 +1,142 @@
+import base64
+import uuid
+from email.header import Header
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+# 57 bytes geram exatamente uma linha de 76 caracteres em base64; blocos com
+# múltiplos de 57 bytes podem ser codificados de forma independente
+_LINE_BYTES = 57
+_CHUNK_BYTES = _LINE_BYTES * 1024
+
+
+def build_raw_message(
+    source: str,
+    to_addresses: List[str],
+    subject: str,
+    body_parts: List[Tuple[str, str]],
+    cc_addresses: Optional[List[str]] = None,
+    bcc_addresses: Optional[List[str]] = None,
+    attachments: Optional[List[Dict[str, Any]]] = None,
+    priority: Optional[str] = None,
+) -> bytes:
+    """
+    Monta uma mensagem MIME multipart diretamente em bytes.
+
+    Os anexos são codificados em base64 por blocos em um único BytesIO, sem
+    cópias intermediárias em str; o conteúdo pode ser bytes, memoryview ou um
+    objeto de arquivo (ex: o BytesIO do PDF), lido sem copiar o buffer inteiro.
+
+    Args:
+        source: Email do remetente
+        to_addresses: Lista de destinatários
+        subject: Assunto do email
+        body_parts: Partes do corpo no formato [(subtipo, texto)], ex: [("html", "...")]
+        cc_addresses: Lista de emails em cópia
+        bcc_addresses: Lista de emails em cópia oculta
+        attachments: Lista de anexos no formato [{"name": "file.pdf", "content": bytes, "content_type": "application/pdf"}]
+        priority: Valor do cabeçalho X-Priority
+
+    Returns:
+        bytes: Mensagem pronta para SESHandler.send_raw_email
+    """
+    boundary = f"===============_{uuid.uuid4().hex}=="
+    out = BytesIO()
+
+    headers = [
+        ("Content-Type", f'multipart/mixed; boundary="{boundary}"'),
+        ("MIME-Version", "1.0"),
+        ("Subject", subject),
+        ("From", source),
+        ("To", ", ".join(to_addresses)),
+    ]
+    if cc_addresses:
+        headers.append(("Cc", ", ".join(cc_addresses)))
+    if bcc_addresses:
+        headers.append(("Bcc", ", ".join(bcc_addresses)))
+    if priority:
+        headers.append(("X-Priority", priority))
+    _write_headers(out, headers)
+    out.write(b"\n")
+
+    delimiter = f"--{boundary}\n".encode("ascii")
+
+    for subtype, text in body_parts:
+        out.write(delimiter)
+        _write_headers(
+            out,
+            [
+                ("Content-Type", f'text/{subtype}; charset="utf-8"'),
+                ("MIME-Version", "1.0"),
+                ("Content-Transfer-Encoding", "base64"),
+            ],
+        )
+        out.write(b"\n")
+        _write_base64(out, memoryview(text.encode("utf-8")))
+
+    for attachment in attachments or []:
+        out.write(delimiter)
+        _write_headers(
+            out,
+            [
+                (
+                    "Content-Type",
+                    attachment.get("content_type", "application/octet-stream"),
+                ),
+                ("MIME-Version", "1.0"),
+                ("Content-Transfer-Encoding", "base64"),
+                ("Content-Disposition", _attachment_disposition(attachment["name"])),
+            ],
+        )
+        out.write(b"\n")
+        _write_attachment(out, attachment["content"])
+
+    out.write(f"--{boundary}--\n".encode("ascii"))
+    return out.getvalue()
+
+
+def _write_headers(out: BytesIO, headers: List[Tuple[str, str]]) -> None:
+    for name, value in headers:
+        # Quebras de linha no valor injetariam cabeçalhos (ex: "Oi\r\nBcc: x@y")
+        if "\r" in value or "\n" in value:
+            raise ValueError(f"Header {name} contains a line break: {value!r}")
+        if not value.isascii():
+            value = Header(value, "utf-8", header_name=name).encode()
+        out.write(f"{name}: {value}\n".encode("ascii"))
+
+
+def _attachment_disposition(filename: str) -> str:
+    if filename.isascii():
+        return f'attachment; filename="{filename}"'
+    # RFC 2231 para nomes de arquivo com acentos
+    return f"attachment; filename*=utf-8''{quote(filename)}"
+
+
+def _write_attachment(out: BytesIO, content: Union[bytes, memoryview, Any]) -> None:
+    if isinstance(content, str) and content.startswith(("http://", "https://")):
+        # Tratar URLs
+        import requests
+
+        content = requests.get(content).content
+
+    if hasattr(content, "getvalue"):
+        # BytesIO: getvalue devolve o buffer interno sem copiar
+        _write_base64(out, memoryview(content.getvalue()))
+    elif hasattr(content, "read"):
+        while True:
+            chunk = content.read(_CHUNK_BYTES)
+            if not chunk:
+                break
+            _write_base64(out, memoryview(chunk))
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        _write_base64(out, memoryview(content))
+    else:
+        # Tentar converter para bytes
+        _write_base64(out, memoryview(bytes(content)))
+
+
+def _write_base64(out: BytesIO, data: memoryview) -> None:
+    """Codifica em base64 com linhas de 76 caracteres, bloco a bloco"""
+    for start in range(0, len(data), _CHUNK_BYTES):
+        out.write(base64.encodebytes(data[start : start + _CHUNK_BYTES]))